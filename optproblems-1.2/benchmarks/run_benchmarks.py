@@ -0,0 +1,428 @@
+"""
+Benchmarks of the evaluation throughput of the test problems.
+
+For each problem of the selected families and each dimension, the
+latency of a single call and the throughput of batch evaluations are
+measured. Batches are evaluated by ``batch_evaluate`` without a worker
+pool ("serial"), with a pool of threads ("thread"), with a pool of
+processes created by ``create_worker_pool`` ("process"), and by
+``evaluate_matrix`` ("matrix", only for real-valued problems). The
+results are stored as JSON and can be compared against a baseline
+obtained from a previous run::
+
+    python benchmarks/run_benchmarks.py --output baseline.json
+    # ... change the code ...
+    python benchmarks/run_benchmarks.py --output new.json --baseline baseline.json
+
+Measurements that became slower than the baseline by more than the
+tolerance are reported as regressions, and the exit code is 1.
+
+"""
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import datetime
+import multiprocessing.dummy
+
+import numpy as np
+
+import optproblems
+from optproblems import Individual
+from optproblems.parallel import create_worker_pool
+
+
+FAMILIES = ("cec2005", "zdt", "dtlz", "wfg", "cec2007", "dixonszegoe", "binary", "mpm2")
+CONFIGURATIONS = ("serial", "thread", "process", "matrix")
+DEFAULT_DIMENSIONS = (2, 10, 30, 50)
+DEFAULT_BATCH_SIZES = (100, 1000)
+# for problems without bounds, e.g., CEC 2005 F7 and F25
+DEFAULT_BOUNDS = (-5.0, 5.0)
+
+
+
+class Benchmark(object):
+    """A problem together with a generator of random phenomes."""
+
+    def __init__(self, family, problem, dimension, sampler, is_real_valued=True):
+        self.family = family
+        self.problem = problem
+        self.dimension = dimension
+        self.sampler = sampler
+        self.is_real_valued = is_real_valued
+
+
+    def key(self):
+        """Identify the benchmark across runs."""
+        return (self.family, str(self.problem), self.dimension, self.problem.num_objectives)
+
+
+
+def real_sampler(problem, dimension):
+    """Return a function drawing uniform random points in the bounds."""
+    min_bounds = getattr(problem, "min_bounds", None)
+    max_bounds = getattr(problem, "max_bounds", None)
+    if min_bounds is None or max_bounds is None:
+        min_bounds = [DEFAULT_BOUNDS[0]] * dimension
+        max_bounds = [DEFAULT_BOUNDS[1]] * dimension
+    min_bounds = np.array(min_bounds, dtype=float)
+    max_bounds = np.array(max_bounds, dtype=float)
+
+    def sample(rng, num_points):
+        return rng.uniform(min_bounds, max_bounds, (num_points, dimension))
+
+    return sample
+
+
+
+def binary_sampler(dimension):
+    """Return a function drawing random bit strings."""
+    def sample(rng, num_points):
+        return rng.integers(0, 2, (num_points, dimension))
+
+    return sample
+
+
+
+def zdt5_sampler(rng, num_points):
+    """Draw random phenomes for ZDT5, consisting of eleven bit strings."""
+    phenomes = []
+    for _ in range(num_points):
+        phenome = [rng.integers(0, 2, 30).tolist()]
+        phenome.extend(rng.integers(0, 2, 5).tolist() for _ in range(10))
+        phenomes.append(phenome)
+    return phenomes
+
+
+
+def real_benchmarks(family, problems):
+    """Wrap real-valued problems, which know their number of variables."""
+    benchmarks = []
+    for problem in problems:
+        dimension = problem.num_variables
+        sampler = real_sampler(problem, dimension)
+        benchmarks.append(Benchmark(family, problem, dimension, sampler))
+    return benchmarks
+
+
+
+def create_benchmarks(family, dimension, dimensions=DEFAULT_DIMENSIONS):
+    """Create the benchmarks of a family for the given dimension.
+
+    Problems with a fixed number of variables are only created for the
+    first of the requested `dimensions`, so that they are measured
+    exactly once per run.
+
+    Returns
+    -------
+    benchmarks : list of Benchmark
+    skipped : list of str
+        Descriptions of problems that cannot be created for this
+        dimension.
+
+    """
+    skipped = []
+    if family == "cec2005":
+        from optproblems.cec2005 import CEC2005
+        return real_benchmarks(family, CEC2005(dimension)), skipped
+    elif family == "zdt":
+        from optproblems.zdt import ZDT1, ZDT2, ZDT3, ZDT4, ZDT5, ZDT6
+        problems = [cls(num_variables=dimension) for cls in (ZDT1, ZDT2, ZDT3, ZDT4, ZDT6)]
+        benchmarks = real_benchmarks(family, problems)
+        if dimension == dimensions[0]:
+            # ZDT5 has a fixed binary encoding, so it is run only once
+            benchmarks.append(Benchmark(family, ZDT5(), 80, zdt5_sampler, is_real_valued=False))
+        return benchmarks, skipped
+    elif family == "dtlz":
+        from optproblems.dtlz import DTLZ
+        num_objectives = min(3, dimension - 1)
+        if num_objectives < 2:
+            skipped.append("DTLZ (more variables than objectives required)")
+            return [], skipped
+        return real_benchmarks(family, DTLZ(num_objectives, dimension)), skipped
+    elif family == "wfg":
+        from optproblems import wfg
+        k = 4 if dimension > 4 else 1
+        problems = []
+        for i in range(1, 10):
+            cls = getattr(wfg, "WFG" + str(i))
+            try:
+                problems.append(cls(2, dimension, k))
+            except (AssertionError, ValueError) as error:
+                skipped.append("WFG%d (%s)" % (i, str(error) or "invalid configuration"))
+        return real_benchmarks(family, problems), skipped
+    elif family in ("cec2007", "dixonszegoe"):
+        # these collections have fixed dimensions, so they are run only once
+        if dimension != dimensions[0]:
+            return [], skipped
+        if family == "cec2007":
+            from optproblems.cec2007 import CEC2007
+            return real_benchmarks(family, CEC2007()), skipped
+        from optproblems.continuous import DixonSzegoe
+        return real_benchmarks(family, DixonSzegoe()), skipped
+    elif family == "binary":
+        from optproblems.binary import OneMax, LeadingOnes, LeadingOnesTrailingZeros
+        problems = [cls(dimension) for cls in (OneMax, LeadingOnes, LeadingOnesTrailingZeros)]
+        return [Benchmark(family, problem, dimension, binary_sampler(dimension), is_real_valued=False)
+                for problem in problems], skipped
+    elif family == "mpm2":
+        from optproblems.mpm import MultiplePeaksModel2
+        # the peaks are drawn with the random module
+        random.seed(dimension)
+        return real_benchmarks(family, [MultiplePeaksModel2(dimension)]), skipped
+    raise ValueError("unknown family: " + family)
+
+
+
+def to_phenomes(samples):
+    """Convert sampled points into lists, as algorithms usually pass them."""
+    if isinstance(samples, np.ndarray):
+        return samples.tolist()
+    return samples
+
+
+
+def measure_single_calls(benchmark, rng, min_time):
+    """Return the mean time of single calls, the best of three runs."""
+    problem = benchmark.problem
+    phenomes = to_phenomes(benchmark.sampler(rng, 100))
+    best = float("inf")
+    for _ in range(3):
+        num_calls = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time or num_calls == 0:
+            for phenome in phenomes:
+                problem(phenome)
+            num_calls += len(phenomes)
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed / num_calls)
+    return best
+
+
+
+def measure_batch(benchmark, rng, configuration, batch_size, min_time, repeat):
+    """Return the best time per evaluation of batch evaluations."""
+    problem = benchmark.problem
+    samples = benchmark.sampler(rng, batch_size)
+    phenomes = to_phenomes(samples)
+    best = float("inf")
+    total_elapsed = 0.0
+    for i in range(repeat):
+        if configuration == "matrix":
+            start = time.perf_counter()
+            problem.evaluate_matrix(samples)
+        else:
+            individuals = [Individual(phenome) for phenome in phenomes]
+            start = time.perf_counter()
+            problem.batch_evaluate(individuals)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed / batch_size)
+        total_elapsed += elapsed
+        if total_elapsed >= min_time and i > 0:
+            break
+    return best
+
+
+
+def create_pool(configuration, problems, num_workers, chunksize=1):
+    """Create the worker pool for a configuration, or return None.
+
+    The chunk size of the problems is fixed, so that the adaptive
+    scheduler cannot decide to bypass the pool.
+
+    """
+    for problem in problems:
+        problem.chunksize = chunksize
+    if configuration == "thread":
+        pool = multiprocessing.dummy.Pool(num_workers)
+        pool.num_workers = num_workers
+        for problem in problems:
+            problem.worker_pool = pool
+        return pool
+    elif configuration == "process":
+        return create_worker_pool(problems, processes=num_workers)
+    for problem in problems:
+        problem.worker_pool = None
+    return None
+
+
+
+def run(families, dimensions, batch_sizes, configurations, num_workers, min_time, repeat, seed, log):
+    """Run all benchmarks and return the results as list of dicts."""
+    results = []
+    rng = np.random.default_rng(seed)
+    for family in families:
+        for dimension in dimensions:
+            benchmarks, skipped = create_benchmarks(family, dimension, dimensions)
+            for description in skipped:
+                log("skipped %s %s in %d dimensions" % (family, description, dimension))
+            if not benchmarks:
+                continue
+            for benchmark in benchmarks:
+                seconds = measure_single_calls(benchmark, rng, min_time)
+                results.append(result_entry(benchmark, "single_call", None, None, seconds))
+                log(format_entry(results[-1]))
+            for configuration in configurations:
+                selected = benchmarks
+                if configuration == "matrix":
+                    selected = [b for b in benchmarks if b.is_real_valued]
+                problems = [benchmark.problem for benchmark in selected]
+                pool = create_pool(configuration, problems, num_workers)
+                try:
+                    for benchmark in selected:
+                        for batch_size in batch_sizes:
+                            seconds = measure_batch(benchmark, rng, configuration,
+                                                    batch_size, min_time, repeat)
+                            results.append(result_entry(benchmark, "batch", configuration,
+                                                        batch_size, seconds))
+                            log(format_entry(results[-1]))
+                finally:
+                    for problem in problems:
+                        problem.worker_pool = None
+                    if pool is not None:
+                        pool.close()
+                        pool.join()
+    return results
+
+
+
+def result_entry(benchmark, kind, configuration, batch_size, seconds):
+    """Create the JSON record of a measurement."""
+    family, problem, dimension, num_objectives = benchmark.key()
+    return {"family": family,
+            "problem": problem,
+            "dimension": dimension,
+            "num_objectives": num_objectives,
+            "benchmark": kind,
+            "configuration": configuration,
+            "batch_size": batch_size,
+            "seconds_per_evaluation": seconds,
+            "evaluations_per_second": 1.0 / seconds if seconds > 0 else None}
+
+
+
+def entry_key(entry):
+    """Identify a measurement across runs."""
+    return (entry["family"], entry["problem"], entry["dimension"], entry["num_objectives"],
+            entry["benchmark"], entry["configuration"], entry["batch_size"])
+
+
+
+def format_entry(entry):
+    """Return a line of human-readable output."""
+    kind = entry["benchmark"]
+    if entry["configuration"] is not None:
+        kind += " %s n=%d" % (entry["configuration"], entry["batch_size"])
+    return "%-12s %-20s d=%-3d m=%d %-26s %12.3f us/eval" % (
+        entry["family"], entry["problem"], entry["dimension"], entry["num_objectives"],
+        kind, entry["seconds_per_evaluation"] * 1e6)
+
+
+
+def compare(results, baseline_results, tolerance):
+    """Find measurements that became slower than in the baseline.
+
+    Returns
+    -------
+    regressions : list of tuple
+        Contains pairs of baseline and new entry, for which the new time
+        exceeds the baseline time by more than the factor
+        ``1 + tolerance``.
+    num_compared : int
+        The number of measurements found in both runs.
+
+    """
+    baseline = dict((entry_key(entry), entry) for entry in baseline_results)
+    regressions = []
+    num_compared = 0
+    for entry in results:
+        old_entry = baseline.get(entry_key(entry))
+        if old_entry is None:
+            continue
+        num_compared += 1
+        ratio = entry["seconds_per_evaluation"] / old_entry["seconds_per_evaluation"]
+        if ratio > 1.0 + tolerance:
+            regressions.append((old_entry, entry))
+    return regressions, num_compared
+
+
+
+def metadata(arguments):
+    """Describe the environment of a run."""
+    return {"optproblems_version": optproblems.__version__,
+            "python": sys.version,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": multiprocessing.cpu_count(),
+            "timestamp": datetime.datetime.now().isoformat(),
+            "arguments": vars(arguments)}
+
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the evaluation throughput of the test problems.")
+    parser.add_argument("--families", nargs="+", choices=FAMILIES, default=list(FAMILIES))
+    parser.add_argument("--dimensions", nargs="+", type=int, default=list(DEFAULT_DIMENSIONS))
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument("--configurations", nargs="+", choices=CONFIGURATIONS,
+                        default=list(CONFIGURATIONS))
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(),
+                        help="the number of threads or processes in the pools")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="the minimal duration of a measurement in seconds")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="the maximal number of repetitions of a batch measurement")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="the JSON file to write the results to")
+    parser.add_argument("--baseline", help="a JSON file of a previous run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="the relative slowdown reported as regression")
+    parser.add_argument("--quiet", action="store_true")
+    return parser.parse_args(argv)
+
+
+
+def main(argv=None):
+    arguments = parse_arguments(argv)
+    if arguments.quiet:
+        log = lambda message: None
+    else:
+        def log(message):
+            print(message)
+            sys.stdout.flush()
+    results = run(arguments.families,
+                  arguments.dimensions,
+                  arguments.batch_sizes,
+                  arguments.configurations,
+                  arguments.workers,
+                  arguments.min_time,
+                  arguments.repeat,
+                  arguments.seed,
+                  log)
+    if not results:
+        print("no benchmarks were measured for the given families and dimensions")
+    if arguments.output:
+        with open(arguments.output, "w") as json_file:
+            json.dump({"metadata": metadata(arguments), "results": results}, json_file, indent=1)
+    if arguments.baseline:
+        with open(arguments.baseline) as json_file:
+            baseline_results = json.load(json_file)["results"]
+        regressions, num_compared = compare(results, baseline_results, arguments.tolerance)
+        print("compared %d measurements with the baseline, %d regressions" % (num_compared, len(regressions)))
+        for old_entry, entry in regressions:
+            ratio = entry["seconds_per_evaluation"] / old_entry["seconds_per_evaluation"]
+            print("REGRESSION %s (%.2fx slower)" % (format_entry(entry), ratio))
+        if regressions:
+            return 1
+    if not results:
+        return 1
+    return 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,701 @@
+"""
+Simple optimization algorithms operating on whole populations.
+
+The algorithms in this module keep their populations in NumPy arrays and
+evaluate each new solution exactly once, by one batch call per
+generation (see :func:`evaluate_population`). The objective values are
+cached in arrays alongside the solutions, so that selection and
+bookkeeping never trigger additional evaluations. Only single-objective
+problems are supported. If a problem is to be maximized (attribute
+`do_maximize`), the objective values are negated internally.
+
+"""
+import math
+import queue
+import traceback
+import multiprocessing
+
+import numpy as np
+
+from optproblems.base import Individual, ResourcesExhausted, SharedEvaluationBudget
+from optproblems.base import bounds_to_arrays
+
+
+def evaluate_population(problem, phenomes):
+    """Evaluate all rows of a matrix with one batch call.
+
+    If the problem has a worker pool that does not know the problem, the
+    rows are evaluated by :func:`batch_evaluate
+    <optproblems.base.Problem.batch_evaluate>` to use the pool. Otherwise,
+    :func:`evaluate_matrix <optproblems.base.Problem.evaluate_matrix>` is
+    used.
+
+    Returns
+    -------
+    objective_values : numpy.ndarray
+        A one-dimensional array.
+
+    Raises
+    ------
+    ResourcesExhausted
+        If the budget does not suffice for all rows.
+
+    """
+    if problem.worker_pool is None or problem.uses_registered_pool():
+        objective_values = problem.evaluate_matrix(phenomes)
+    else:
+        individuals = [Individual(phenome) for phenome in phenomes]
+        problem.batch_evaluate(individuals)
+        objective_values = [individual.objective_values for individual in individuals]
+    return np.asarray(objective_values, dtype=float).reshape(len(phenomes))
+
+
+
+def search_space_bounds(problem, num_variables, min_bounds=None, max_bounds=None):
+    """Determine the bounds for initialization and repair.
+
+    Missing bounds are taken from the attributes `min_bounds` and
+    `max_bounds` of the problem.
+
+    Returns
+    -------
+    min_array, max_array : numpy.ndarray
+        The bounds, with infinite values where no bounds exist.
+
+    """
+    if min_bounds is None:
+        min_bounds = getattr(problem, "min_bounds", None)
+    if max_bounds is None:
+        max_bounds = getattr(problem, "max_bounds", None)
+    if min_bounds is None:
+        min_bounds = [None] * num_variables
+    if max_bounds is None:
+        max_bounds = [None] * num_variables
+    assert len(min_bounds) == num_variables and len(max_bounds) == num_variables
+    return bounds_to_arrays(min_bounds, max_bounds)
+
+
+
+def uniform_population(rng, size, min_array, max_array):
+    """Draw points uniformly in the bounds.
+
+    Where a bound is missing, the unit interval is used instead.
+
+    """
+    is_bounded = np.isfinite(min_array) & np.isfinite(max_array)
+    low = np.where(is_bounded, min_array, 0.0)
+    high = np.where(is_bounded, max_array, 1.0)
+    return rng.uniform(low, high, (size, len(min_array)))
+
+
+
+class PopulationBasedAlgorithm(object):
+    """Common bookkeeping of the algorithms in this module.
+
+    Subclasses implement :func:`initialize`, :func:`step`, and
+    :func:`current_value`.
+
+    """
+    def __init__(self, problem, num_variables=None, min_bounds=None, max_bounds=None, rng=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        problem : Problem
+            A single-objective problem.
+        num_variables : int, optional
+            The search space dimension. By default, the attribute
+            `num_variables` of the problem is used.
+        min_bounds : sequence, optional
+            The lower bounds. By default, the attribute `min_bounds` of
+            the problem is used.
+        max_bounds : sequence, optional
+            The upper bounds. By default, the attribute `max_bounds` of
+            the problem is used.
+        rng : numpy.random.Generator or int, optional
+            The random number generator, or a seed for a new one.
+
+        """
+        assert problem.num_objectives == 1
+        if num_variables is None:
+            num_variables = problem.num_variables
+        self.problem = problem
+        self.num_variables = num_variables
+        self.min_array, self.max_array = search_space_bounds(problem, num_variables,
+                                                             min_bounds, max_bounds)
+        self.rng = np.random.default_rng(rng)
+        self.sign = -1.0 if getattr(problem, "do_maximize", False) else 1.0
+        self.is_initialized = False
+        self.best_phenome = None
+        self.best_fitness = float("inf")
+        self.num_iterations = 0
+
+
+    def evaluate(self, phenomes):
+        """Return the (sign-corrected) fitness of the rows of a matrix."""
+        fitness = self.sign * evaluate_population(self.problem, phenomes)
+        best_index = int(np.argmin(fitness))
+        if fitness[best_index] < self.best_fitness:
+            self.best_fitness = float(fitness[best_index])
+            self.best_phenome = phenomes[best_index].copy()
+        return fitness
+
+
+    @property
+    def best_objective_value(self):
+        """The best objective value found so far, in the original sign."""
+        return self.sign * self.best_fitness
+
+
+    def initialize(self):
+        raise NotImplementedError()
+
+
+    def step(self):
+        raise NotImplementedError()
+
+
+    def current_value(self):
+        """Return the objective value to record after each iteration."""
+        return self.best_objective_value
+
+
+    def run(self, num_iterations):
+        """Run the algorithm for a number of iterations.
+
+        The run ends early if the budget of the problem is exhausted.
+
+        Returns
+        -------
+        curve : numpy.ndarray
+            The values of :func:`current_value` after the
+            initialization and after each iteration.
+
+        """
+        curve = []
+        try:
+            if not self.is_initialized:
+                self.initialize()
+                self.is_initialized = True
+            curve.append(self.current_value())
+            for _ in range(num_iterations):
+                self.step()
+                self.num_iterations += 1
+                curve.append(self.current_value())
+        except ResourcesExhausted:
+            pass
+        return np.array(curve)
+
+
+
+class GeneticAlgorithm(PopulationBasedAlgorithm):
+    """A generational genetic algorithm for real-valued problems.
+
+    The population is a matrix with one individual per row. Parents are
+    chosen by tournament selection with replacement, based on the cached
+    objective values of the current population. Pairs of parents are
+    recombined by two-point crossover, and each child is mutated with
+    probability `mutation_rate` by adding Gaussian noise. The offspring
+    are clipped to the bounds and replace the whole population. All
+    operators work on the whole population at once.
+
+    """
+    def __init__(self, problem,
+                 population_size,
+                 num_variables=None,
+                 tournament_size=2,
+                 mutation_rate=0.3,
+                 mutation_scale=12.0,
+                 min_bounds=None,
+                 max_bounds=None,
+                 rng=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        problem : Problem
+            A single-objective problem.
+        population_size : int
+            The number of individuals.
+        num_variables : int, optional
+            The search space dimension. By default, the attribute
+            `num_variables` of the problem is used.
+        tournament_size : int, optional
+            The number of competitors in each tournament.
+        mutation_rate : float, optional
+            The probability of mutating a child.
+        mutation_scale : float, optional
+            The standard deviation of the Gaussian mutation.
+        min_bounds : sequence, optional
+            The lower bounds. By default, the attribute `min_bounds` of
+            the problem is used.
+        max_bounds : sequence, optional
+            The upper bounds. By default, the attribute `max_bounds` of
+            the problem is used.
+        rng : numpy.random.Generator or int, optional
+            The random number generator, or a seed for a new one.
+
+        """
+        PopulationBasedAlgorithm.__init__(self, problem, num_variables,
+                                          min_bounds, max_bounds, rng)
+        assert population_size >= 2
+        assert tournament_size >= 1
+        self.population_size = population_size
+        self.tournament_size = tournament_size
+        self.mutation_rate = mutation_rate
+        self.mutation_scale = mutation_scale
+        self.population = None
+        self.fitness = None
+
+
+    def initialize(self):
+        """Create and evaluate a random initial population."""
+        population = uniform_population(self.rng, self.population_size, self.min_array, self.max_array)
+        self.fitness = self.evaluate(population)
+        self.population = population
+
+
+    def select(self, num_parents):
+        """Choose parents by tournaments, without any evaluations.
+
+        Returns
+        -------
+        parents : numpy.ndarray
+            A matrix with `num_parents` rows.
+
+        """
+        competitors = self.rng.integers(0, self.population_size, (num_parents, self.tournament_size))
+        winners = np.argmin(self.fitness[competitors], axis=1)
+        return self.population[competitors[np.arange(num_parents), winners]]
+
+
+    def crossover(self, parents_a, parents_b):
+        """Apply two-point crossover to all pairs of parents at once."""
+        num_pairs, num_variables = parents_a.shape
+        points = np.sort(self.rng.integers(0, num_variables + 1, (num_pairs, 2)), axis=1)
+        starts = points[:, 0:1]
+        stops = points[:, 1:2]
+        # exchange at least one variable
+        stops = np.where(starts == stops, stops + 1, stops)
+        columns = np.arange(num_variables)
+        swapped = (columns >= starts) & (columns < stops)
+        children_a = np.where(swapped, parents_b, parents_a)
+        children_b = np.where(swapped, parents_a, parents_b)
+        return children_a, children_b
+
+
+    def mutate(self, children):
+        """Add Gaussian noise to a random subset of the children, in place."""
+        is_mutated = self.rng.random(len(children)) < self.mutation_rate
+        num_mutated = np.count_nonzero(is_mutated)
+        if num_mutated > 0:
+            noise = self.rng.normal(0.0, self.mutation_scale, (num_mutated, children.shape[1]))
+            children[is_mutated] += noise
+        return children
+
+
+    def step(self):
+        """Carry out one generation.
+
+        Raises
+        ------
+        ResourcesExhausted
+            If the budget does not suffice for the offspring. The
+            population is left unchanged in this case.
+
+        """
+        num_pairs = int(math.ceil(self.population_size / 2.0))
+        parents = self.select(2 * num_pairs)
+        children_a, children_b = self.crossover(parents[:num_pairs], parents[num_pairs:])
+        offspring = np.concatenate((children_a, children_b))[:self.population_size]
+        self.mutate(offspring)
+        np.clip(offspring, self.min_array, self.max_array, out=offspring)
+        self.fitness = self.evaluate(offspring)
+        self.population = offspring
+
+
+    def current_value(self):
+        """Return the best objective value of the current population."""
+        return self.sign * self.fitness.min()
+
+
+    def emigrants(self, num_migrants):
+        """Return copies of the best individuals and their fitness."""
+        num_migrants = min(num_migrants, self.population_size)
+        indices = np.argsort(self.fitness, kind="stable")[:num_migrants]
+        return self.population[indices].copy(), self.fitness[indices].copy()
+
+
+    def immigrate(self, phenomes, fitness):
+        """Replace the worst individuals by already evaluated ones.
+
+        Only immigrants that are better than the individuals they replace
+        are accepted. No evaluations are necessary.
+
+        """
+        num_migrants = min(len(fitness), self.population_size)
+        order = np.argsort(fitness, kind="stable")[:num_migrants]
+        phenomes = np.asarray(phenomes, dtype=float)[order]
+        fitness = np.asarray(fitness, dtype=float)[order]
+        worst = np.argsort(self.fitness, kind="stable")[::-1][:num_migrants]
+        is_better = fitness < self.fitness[worst]
+        self.population[worst[is_better]] = phenomes[is_better]
+        self.fitness[worst[is_better]] = fitness[is_better]
+        if num_migrants > 0 and fitness[0] < self.best_fitness:
+            self.best_fitness = float(fitness[0])
+            self.best_phenome = phenomes[0].copy()
+
+
+
+class ParticleSwarmOptimization(PopulationBasedAlgorithm):
+    """Particle swarm optimization with random informants.
+
+    The swarm is stored as a struct of arrays: positions, velocities,
+    personal best positions, and the fitness of the personal best
+    positions are (swarm_size, d) and (swarm_size,) arrays. In each
+    iteration, every particle chooses `num_informants` random informants
+    (and itself), and the velocities of the whole swarm are updated by
+    one vectorized equation::
+
+        v = alpha * v + beta * r1 * (p - x) + gamma * r2 * (i - x) + delta * r3 * (g - x)
+        x = x + epsilon * v
+
+    where `p` are the personal best positions, `i` the personal best
+    positions of the fittest informants, `g` the global best position,
+    and `r1`, `r2`, `r3` are uniform random numbers in [0, 1] for each
+    particle and variable. Then the new positions are repaired and
+    evaluated once. The fitness of the personal bests is cached, so that
+    no position is evaluated twice.
+
+    """
+    def __init__(self, problem,
+                 swarm_size,
+                 num_variables=None,
+                 num_informants=2,
+                 alpha=0.7,
+                 beta=2.0,
+                 gamma=0.9,
+                 delta=0.0,
+                 epsilon=1.0,
+                 initial_velocity_scale=0.1,
+                 repair=None,
+                 min_bounds=None,
+                 max_bounds=None,
+                 rng=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        problem : Problem
+            A single-objective problem.
+        swarm_size : int
+            The number of particles.
+        num_variables : int, optional
+            The search space dimension. By default, the attribute
+            `num_variables` of the problem is used.
+        num_informants : int, optional
+            The number of random informants of each particle.
+        alpha : float, optional
+            The inertia weight.
+        beta : float, optional
+            The weight of the personal best position.
+        gamma : float, optional
+            The weight of the best position of the informants.
+        delta : float, optional
+            The weight of the global best position.
+        epsilon : float, optional
+            The step size.
+        initial_velocity_scale : float, optional
+            The initial velocities are drawn uniformly from the interval
+            of this fraction of the range, in both directions.
+        repair : callable, optional
+            Receives the (swarm_size, d) array of new positions and
+            returns the repaired positions, e.g., the `vectorized` method
+            of a :class:`BoundConstraintsRepair
+            <optproblems.base.BoundConstraintsRepair>`. By default, the
+            positions are clipped to the bounds.
+        min_bounds : sequence, optional
+            The lower bounds. By default, the attribute `min_bounds` of
+            the problem is used.
+        max_bounds : sequence, optional
+            The upper bounds. By default, the attribute `max_bounds` of
+            the problem is used.
+        rng : numpy.random.Generator or int, optional
+            The random number generator, or a seed for a new one.
+
+        """
+        PopulationBasedAlgorithm.__init__(self, problem, num_variables,
+                                          min_bounds, max_bounds, rng)
+        assert swarm_size >= 1
+        assert num_informants >= 0
+        self.swarm_size = swarm_size
+        self.num_informants = num_informants
+        self.alpha = alpha
+        self.beta = beta
+        self.gamma = gamma
+        self.delta = delta
+        self.epsilon = epsilon
+        self.initial_velocity_scale = initial_velocity_scale
+        self.repair = repair
+        self.positions = None
+        self.velocities = None
+        self.best_positions = None
+        self.best_position_fitness = None
+
+
+    def initialize(self):
+        """Create and evaluate a random swarm."""
+        positions = uniform_population(self.rng, self.swarm_size, self.min_array, self.max_array)
+        width = np.where(np.isfinite(self.max_array - self.min_array),
+                         self.max_array - self.min_array, 1.0)
+        max_speed = self.initial_velocity_scale * width
+        self.velocities = self.rng.uniform(-max_speed, max_speed, positions.shape)
+        fitness = self.evaluate(positions)
+        self.positions = positions
+        self.best_positions = positions.copy()
+        self.best_position_fitness = fitness
+
+
+    def fittest_informants(self):
+        """Return the index of the fittest informant of each particle."""
+        swarm_size = self.swarm_size
+        informants = np.empty((swarm_size, self.num_informants + 1), dtype=np.intp)
+        informants[:, 0] = np.arange(swarm_size)
+        informants[:, 1:] = self.rng.integers(0, swarm_size, (swarm_size, self.num_informants))
+        fittest = np.argmin(self.best_position_fitness[informants], axis=1)
+        return informants[np.arange(swarm_size), fittest]
+
+
+    def step(self):
+        """Move the whole swarm and evaluate each new position once.
+
+        Raises
+        ------
+        ResourcesExhausted
+            If the budget does not suffice for the new positions. The
+            swarm is left unchanged in this case.
+
+        """
+        rng = self.rng
+        shape = self.positions.shape
+        positions = self.positions
+        best_positions = self.best_positions
+        informant_positions = best_positions[self.fittest_informants()]
+        velocities = self.alpha * self.velocities
+        velocities += self.beta * rng.random(shape) * (best_positions - positions)
+        velocities += self.gamma * rng.random(shape) * (informant_positions - positions)
+        if self.delta != 0.0:
+            velocities += self.delta * rng.random(shape) * (self.best_phenome - positions)
+        new_positions = positions + self.epsilon * velocities
+        if self.repair is None:
+            np.clip(new_positions, self.min_array, self.max_array, out=new_positions)
+        else:
+            new_positions = np.asarray(self.repair(new_positions), dtype=float)
+        fitness = self.evaluate(new_positions)
+        self.positions = new_positions
+        self.velocities = velocities
+        is_improved = fitness < self.best_position_fitness
+        best_positions[is_improved] = new_positions[is_improved]
+        self.best_position_fitness[is_improved] = fitness[is_improved]
+
+
+
+def _run_island(island_index, problem, algorithm, algorithm_kwargs, seed_sequence,
+                num_generations, migration_interval, num_migrants, inbox, outbox, results):
+    """Evolve one island in a worker process of an :class:`IslandModel`.
+
+    Every `migration_interval` generations, the best individuals are put
+    into `outbox`, and all individuals waiting in `inbox` are integrated
+    without blocking. The outcome (or a traceback) is put into `results`.
+
+    """
+    # migrants that are never received must not keep the process alive
+    outbox.cancel_join_thread()
+    try:
+        optimizer = algorithm(problem, rng=np.random.default_rng(seed_sequence),
+                              **algorithm_kwargs)
+        curve = list(optimizer.run(0))
+        remaining_generations = num_generations
+        while optimizer.is_initialized and remaining_generations > 0:
+            num_iterations = min(migration_interval, remaining_generations)
+            epoch_curve = optimizer.run(num_iterations)
+            curve.extend(epoch_curve[1:])
+            if len(epoch_curve) - 1 < num_iterations:
+                # the budget is exhausted
+                break
+            remaining_generations -= num_iterations
+            outbox.put(optimizer.emigrants(num_migrants))
+            while True:
+                try:
+                    phenomes, fitness = inbox.get_nowait()
+                except queue.Empty:
+                    break
+                optimizer.immigrate(phenomes, fitness)
+        outcome = (np.array(curve), optimizer.best_phenome, optimizer.best_objective_value)
+        results.put((island_index, outcome, None))
+    except Exception:
+        results.put((island_index, None, traceback.format_exc()))
+
+
+
+class IslandModel(object):
+    """Several populations evolving in parallel processes.
+
+    Each island runs a :class:`GeneticAlgorithm` (or another algorithm
+    offering :func:`emigrants <GeneticAlgorithm.emigrants>` and
+    :func:`immigrate <GeneticAlgorithm.immigrate>`) in its own process,
+    on a copy of the problem. The islands are arranged in a ring. Every
+    `migration_interval` generations, each island sends copies of its
+    best individuals together with their fitness to its successor
+    through a queue, and integrates all individuals that have arrived
+    from its predecessor in the meantime. An island never waits for its
+    neighbors, so the islands only synchronize when they access the
+    budget.
+
+    The problem must have a :class:`SharedEvaluationBudget
+    <optproblems.base.SharedEvaluationBudget>`, so that the evaluations
+    of all islands are charged to one budget. It is sent to the islands
+    when they are started, so it must be picklable with the chosen
+    multiprocessing context. A worker pool of the problem is not used by
+    the islands.
+
+    While waiting for the islands, the parent process checks every
+    `poll_interval` seconds whether an island process has died without
+    delivering its outcome, e.g., because it was killed by the operating
+    system.
+
+    """
+    poll_interval = 0.5
+
+    def __init__(self, problem,
+                 num_islands,
+                 migration_interval=10,
+                 num_migrants=1,
+                 algorithm=GeneticAlgorithm,
+                 context=None,
+                 seed=None,
+                 **algorithm_kwargs):
+        """Constructor.
+
+        Parameters
+        ----------
+        problem : Problem
+            A single-objective problem with a shared budget.
+        num_islands : int
+            The number of islands and worker processes.
+        migration_interval : int, optional
+            The number of generations between migrations.
+        num_migrants : int, optional
+            The number of individuals each island sends per migration.
+        algorithm : class, optional
+            The algorithm on each island. It is instantiated as
+            ``algorithm(problem, rng=generator, **algorithm_kwargs)``.
+        context : multiprocessing context, optional
+            The context to start the processes with. It must match the
+            context the budget was created with.
+        seed : int or numpy.random.SeedSequence, optional
+            The seed from which the generators of the islands are
+            spawned.
+        algorithm_kwargs
+            Further arguments for the algorithm, e.g., `population_size`.
+
+        """
+        assert isinstance(problem.budget, SharedEvaluationBudget)
+        assert num_islands >= 1
+        assert migration_interval >= 1
+        assert num_migrants >= 0
+        if context is None:
+            context = multiprocessing
+        self.problem = problem
+        self.num_islands = num_islands
+        self.migration_interval = migration_interval
+        self.num_migrants = num_migrants
+        self.algorithm = algorithm
+        self.algorithm_kwargs = algorithm_kwargs
+        self.context = context
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.best_phenome = None
+        self.best_objective_value = None
+        self.sign = -1.0 if getattr(problem, "do_maximize", False) else 1.0
+
+
+    def run(self, num_generations):
+        """Run all islands for a number of generations.
+
+        The islands stop early when the shared budget is exhausted.
+
+        Returns
+        -------
+        curves : numpy.ndarray
+            An array of shape (num_islands, n), where row i contains the
+            curve of island i as returned by its algorithm's `run`. Shorter
+            curves are padded with NaN.
+
+        Raises
+        ------
+        RuntimeError
+            If an island raised an exception or its process died. The
+            remaining islands are terminated in the latter case.
+
+        """
+        context = self.context
+        num_islands = self.num_islands
+        seed_sequences = self.seed_sequence.spawn(num_islands)
+        inboxes = [context.Queue() for _ in range(num_islands)]
+        results = context.Queue()
+        processes = []
+        for i in range(num_islands):
+            args = (i, self.problem, self.algorithm, self.algorithm_kwargs, seed_sequences[i],
+                    num_generations, self.migration_interval, self.num_migrants,
+                    inboxes[i], inboxes[(i + 1) % num_islands], results)
+            process = context.Process(target=_run_island, args=args)
+            process.start()
+            processes.append(process)
+        outcomes = [None] * num_islands
+        errors = []
+        pending = set(range(num_islands))
+        # islands that had exited at the last poll without a result
+        exited = set()
+        try:
+            # collect the results before joining to not block the queue
+            while pending:
+                try:
+                    island_index, outcome, error = results.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    for i in sorted(pending):
+                        exitcode = processes[i].exitcode
+                        if exitcode is None:
+                            continue
+                        # a clean exit may still have a result in transit
+                        if exitcode != 0 or i in exited:
+                            raise RuntimeError("island %d died with exit code %d" % (i, exitcode))
+                        exited.add(i)
+                    continue
+                pending.discard(island_index)
+                outcomes[island_index] = outcome
+                if error is not None:
+                    errors.append(error)
+        finally:
+            for inbox in inboxes:
+                inbox.cancel_join_thread()
+            if pending:
+                results.cancel_join_thread()
+                for process in processes:
+                    if process.is_alive():
+                        process.terminate()
+            for process in processes:
+                process.join()
+        if errors:
+            raise RuntimeError("island failed:\n" + errors[0])
+        for _, best_phenome, best_objective_value in outcomes:
+            if best_phenome is None:
+                continue
+            if (self.best_phenome is None or
+                    self.sign * best_objective_value < self.sign * self.best_objective_value):
+                self.best_phenome = best_phenome
+                self.best_objective_value = best_objective_value
+        length = max(len(outcome[0]) for outcome in outcomes)
+        curves = np.full((num_islands, length), np.nan)
+        for i, outcome in enumerate(outcomes):
+            curves[i, :len(outcome[0])] = outcome[0]
+        return curves
@@ -2,9 +2,33 @@
 Infrastructure to define optimization problems.
 """
 import math
+import time
 import copy
+import itertools
+import os
+import sys
+import types
+import importlib
+import threading
+import weakref
+import multiprocessing
 import multiprocessing.dummy
-from collections import OrderedDict
+import multiprocessing.managers
+import concurrent.futures
+from collections import OrderedDict, deque
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+import numpy as np
+
+from optproblems.parallel import evaluate_registered, evaluate_matrix_shared
+from optproblems.parallel import evaluate_batch, evaluate_registered_batch
+from optproblems.parallel import AdaptiveScheduler, submit_task, count_workers
+from optproblems.profiling import EvaluationProfile
+from optproblems.profiling import PREPROCESSOR, BUDGET, OBJECTIVE_FUNCTION, POOL_DISPATCH
+from optproblems.recording import EvaluationRecorder
 
 
 class Aborted(StopIteration):
@@ -118,11 +142,90 @@ class BundledObjectives:
         return flattened
 
 
+    def vectorized(self, phenomes):
+        """Collect objective values for a matrix of phenomes.
+
+        Returns a two-dimensional array with one row of objective values
+        per phenome.
+
+        """
+        num_phenomes = len(phenomes)
+        columns = []
+        for objective_function in self.objective_functions:
+            returned_values = np.asarray(vectorize(objective_function)(phenomes))
+            columns.append(returned_values.reshape((num_phenomes, -1)))
+        return np.hstack(columns)
+
+
 
 def identity(argument):
     return argument
 
 
+identity.vectorized = identity
+
+
+
+def vectorize(function):
+    """Obtain a version of `function` that processes a matrix of phenomes.
+
+    A callable may offer a batched implementation in its attribute
+    `vectorized`, which receives a two-dimensional array with one phenome
+    per row. If it exists, this implementation is returned. Otherwise, a
+    fallback is returned that applies `function` to each row separately
+    and collects the results in a list.
+
+    """
+    vectorized = getattr(function, "vectorized", None)
+    if vectorized is not None:
+        return vectorized
+
+    def apply_to_rows(phenomes):
+        return [function(phenome) for phenome in phenomes]
+
+    return apply_to_rows
+
+
+
+def _array_key_prefix(dtype, shape):
+    """Encode data type and shape, which the raw bytes do not contain."""
+    return (np.dtype(dtype).str + str(tuple(shape))).encode("ascii")
+
+
+
+def array_key(phenome):
+    """Return the raw bytes of a phenome as key for a dictionary.
+
+    This is much faster than converting a NumPy array into a tuple. The
+    bytes are prefixed with the data type and the shape, so phenomes
+    only obtain the same key if they also have the same data type and
+    shape.
+
+    """
+    phenome = np.ascontiguousarray(phenome)
+    return _array_key_prefix(phenome.dtype, phenome.shape) + phenome.tobytes()
+
+
+
+def vectorized_array_key(phenomes):
+    """Return the keys of all rows of a matrix at once (see :func:`array_key`)."""
+    phenomes = np.ascontiguousarray(phenomes)
+    num_rows = len(phenomes)
+    prefix = _array_key_prefix(phenomes.dtype, phenomes.shape[1:])
+    row_size = phenomes.itemsize * phenomes[0].size if num_rows > 0 else 0
+    if row_size == 0:
+        return [prefix] * num_rows
+    data = phenomes.tobytes()
+    return [prefix + data[start:start + row_size] for start in range(0, len(data), row_size)]
+
+
+array_key.vectorized = vectorized_array_key
+
+
+
+_problem_ids = itertools.count()
+
+
 
 class Problem(object):
     """The base class for problems to be solved.
@@ -131,14 +234,22 @@ class Problem(object):
     a single objective function or a list of objective functions. For
     more sophisticated cases, creating a subclass may be necessary.
 
+    The evaluations can be instrumented by :func:`enable_profiling`,
+    and written to disk by :func:`start_recording`.
+
     """
+    profile = None
+    recorder = None
+
     def __init__(self, objective_functions,
                  num_objectives=None,
                  max_evaluations=float("inf"),
                  worker_pool=None,
                  mp_module=None,
                  phenome_preprocessor=None,
-                 name=None):
+                 name=None,
+                 locking=None,
+                 budget=None):
         """Constructor.
 
         Parameters
@@ -157,12 +268,15 @@ class Problem(object):
             is no restriction.
         worker_pool : Pool, optional
             A pool of worker processes. Default is None (no 
-            parallelization).
+            parallelization). A pool created by
+            :func:`create_worker_pool <optproblems.parallel.create_worker_pool>`
+            avoids sending the objective function with every task.
         mp_module : module, optional
             Either `multiprocessing`, `multiprocessing.dummy` (default),
             or a `MockMultiProcessing` instance. This is only used to create
             an internal lock around bookkeeping code in various places. The
-            lock is only required for asynchronous parallelization, but not
+            lock is only required for asynchronous parallelization, e.g.,
+            with :func:`submit` and :func:`evaluate_async`, but not
             for the parallelization with a worker pool in 
             :func:`batch_evaluate`.
         phenome_preprocessor : callable, optional
@@ -174,6 +288,19 @@ class Problem(object):
             applied.
         name : str, optional
             A nice name for humans to read.
+        locking : str, optional
+            The synchronization strategy for the bookkeeping. One of
+            "none", "thread", "process", "manager", or "counter" (see
+            :func:`create_lock <optproblems.base.create_lock>`). With
+            "counter", the numbers of consumed and remaining evaluations
+            are kept in shared memory and protected by the lock of this
+            shared array. By default, the lock is obtained from
+            ``mp_module.Lock()``.
+        budget : EvaluationBudget, optional
+            An existing budget to charge the evaluations to. This way,
+            several problem instances can share one budget. If this
+            argument is given, `max_evaluations` and `locking` are
+            ignored.
 
         """
         try:
@@ -191,20 +318,80 @@ class Problem(object):
             assert num_objectives > 0
         self.objective_function = one_function
         self.num_objectives = num_objectives
-        self.remaining_evaluations = max_evaluations
-        self.consumed_evaluations = 0
         self.worker_pool = worker_pool
         self.chunksize = 1
+        self.scheduler = AdaptiveScheduler()
+        self.transport = "pickle"
         if mp_module is None:
             mp_module = multiprocessing.dummy
         self.mp_module = mp_module
-        self.lock = mp_module.Manager().Lock()
+        if budget is None:
+            if locking == "counter":
+                budget = SharedEvaluationBudget(max_evaluations)
+            else:
+                budget = EvaluationBudget(max_evaluations, locking, mp_module)
+        self.budget = budget
+        self.lock = budget.lock
+        self.problem_id = "%d-%d" % (os.getpid(), next(_problem_ids))
         if phenome_preprocessor is None:
             phenome_preprocessor = identity
         self.phenome_preprocessor = phenome_preprocessor
         self.name = name
 
 
+    @property
+    def consumed_evaluations(self):
+        return self.budget.consumed
+
+
+    @consumed_evaluations.setter
+    def consumed_evaluations(self, value):
+        self.budget.consumed = value
+
+
+    @property
+    def remaining_evaluations(self):
+        return self.budget.remaining
+
+
+    @remaining_evaluations.setter
+    def remaining_evaluations(self, value):
+        self.budget.remaining = value
+
+
+    def __getstate__(self):
+        """Return the state for pickling, e.g., to send it to a worker.
+
+        The worker pool, the lock, and the recorder are left out, and the
+        multiprocessing module is replaced by its name. The budget is
+        pickled with the state, so the evaluations in other processes
+        are only counted against the same budget if it is a
+        :class:`SharedEvaluationBudget
+        <optproblems.base.SharedEvaluationBudget>`.
+
+        """
+        state = self.__dict__.copy()
+        if "worker_pool" in state:
+            state["worker_pool"] = None
+        mp_module = state.get("mp_module")
+        if isinstance(mp_module, types.ModuleType):
+            state["mp_module"] = mp_module.__name__
+        if "budget" in state:
+            state.pop("lock", None)
+        state.pop("recorder", None)
+        return state
+
+
+    def __setstate__(self, state):
+        """Restore the state created by :func:`__getstate__`."""
+        self.__dict__.update(state)
+        mp_module = state.get("mp_module")
+        if isinstance(mp_module, str):
+            self.mp_module = importlib.import_module(mp_module)
+        if "budget" in state:
+            self.lock = self.budget.lock
+
+
     def __str__(self):
         """Return the name of this problem."""
         if self.name is not None:
@@ -213,6 +400,62 @@ class Problem(object):
             return self.__class__.__name__
 
 
+    def enable_profiling(self):
+        """Start recording the time spent in the parts of the evaluations.
+
+        Returns
+        -------
+        profile : EvaluationProfile
+            The new :class:`EvaluationProfile
+            <optproblems.profiling.EvaluationProfile>`, also available in
+            the attribute `profile`.
+
+        """
+        self.profile = EvaluationProfile()
+        return self.profile
+
+
+    def disable_profiling(self):
+        """Stop recording timings and return the profile recorded so far."""
+        profile = self.profile
+        self.profile = None
+        return profile
+
+
+    def start_recording(self, directory, record_phenomes=False, chunk_size=10000):
+        """Start writing the evaluations to files in a directory.
+
+        The evaluations by :func:`__call__`, :func:`evaluate_matrix`,
+        :func:`batch_evaluate`, :func:`submit`, :func:`submit_batch`, and
+        thus :func:`evaluate_iter` are recorded, together with the
+        phenomes after pre-processing if `record_phenomes` is True.
+        Asynchronous evaluations are recorded in the order in which they
+        complete, and those completing after :func:`stop_recording` are
+        not recorded. See
+        :class:`EvaluationRecorder <optproblems.recording.EvaluationRecorder>`
+        for the parameters.
+
+        Returns
+        -------
+        recorder : EvaluationRecorder
+            The new recorder, also available in the attribute `recorder`.
+
+        """
+        do_maximize = getattr(self, "do_maximize", False)
+        self.recorder = EvaluationRecorder(directory, self.num_objectives, record_phenomes,
+                                           chunk_size, do_maximize)
+        return self.recorder
+
+
+    def stop_recording(self):
+        """Write the remaining records and return the closed recorder."""
+        recorder = self.recorder
+        self.recorder = None
+        if recorder is not None:
+            recorder.close()
+        return recorder
+
+
     def __call__(self, phenome):
         """Evaluate a solution and return objective values.
 
@@ -224,14 +467,50 @@ class Problem(object):
             If the budget of function evaluations is exhausted.
 
         """
+        if self.profile is not None:
+            return self.profiled_call(phenome)
         phenome = self.phenome_preprocessor(phenome)
-        with self.lock:
-            if self.remaining_evaluations > 0:
-                self.consumed_evaluations += 1
-                self.remaining_evaluations -= 1
-            else:
-                raise ResourcesExhausted("problem evaluations")
+        if not self.budget.try_consume(1):
+            raise ResourcesExhausted("problem evaluations")
+        objective_values = self.check_num_objectives(self.objective_function(phenome))
+        if self.recorder is not None:
+            self.recorder.record([phenome], [objective_values])
+        return objective_values
+
+
+    def profiled_call(self, phenome):
+        """Do the same as :func:`__call__`, but record the timings."""
+        profile = self.profile
+        profile.count("calls")
+        start = time.perf_counter()
+        phenome = self.phenome_preprocessor(phenome)
+        stop = time.perf_counter()
+        profile.record(PREPROCESSOR, stop - start)
+        start = stop
+        granted = self.budget.try_consume(1)
+        stop = time.perf_counter()
+        profile.record(BUDGET, stop - start)
+        if not granted:
+            profile.count("exhausted")
+            raise ResourcesExhausted("problem evaluations")
+        start = stop
         objective_values = self.objective_function(phenome)
+        profile.record(OBJECTIVE_FUNCTION, time.perf_counter() - start)
+        objective_values = self.check_num_objectives(objective_values)
+        if self.recorder is not None:
+            self.recorder.record([phenome], [objective_values])
+        return objective_values
+
+
+    def check_num_objectives(self, objective_values):
+        """Assert that the number of objective values is correct.
+
+        Returns
+        -------
+        objective_values : object
+            The unchanged argument.
+
+        """
         try:
             num_obj_values = len(objective_values)
         except TypeError:
@@ -252,11 +531,419 @@ class Problem(object):
         individual.objective_values = self.__call__(individual.phenome)
 
 
+    def submit(self, phenome):
+        """Start the evaluation of a solution without waiting for it.
+
+        The phenome is pre-processed and the evaluation is counted
+        immediately, as in :func:`__call__
+        <optproblems.base.Problem.__call__>`. The evaluation itself is
+        carried out by the worker pool, which may be a
+        :class:`multiprocessing.pool.Pool` or an executor from
+        :mod:`concurrent.futures` (see
+        :func:`submit_task <optproblems.parallel.submit_task>`). Without
+        a worker pool, the solution is evaluated right away.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Provides the objective values when the evaluation is done.
+
+        Raises
+        ------
+        ResourcesExhausted
+            If the budget of function evaluations is exhausted.
+
+        """
+        profile = self.profile
+        if profile is not None:
+            profile.count("submitted")
+            start = time.perf_counter()
+        phenome = self.phenome_preprocessor(phenome)
+        if profile is not None:
+            start = self.record_time(PREPROCESSOR, start)
+        if not self.budget.try_consume(1):
+            raise ResourcesExhausted("problem evaluations")
+        if profile is not None:
+            start = self.record_time(BUDGET, start)
+        if self.uses_registered_pool():
+            function = evaluate_registered
+            argument = (self.problem_id, phenome)
+        else:
+            function = self.objective_function
+            argument = phenome
+        check = self.check_num_objectives
+        if self.recorder is not None:
+            check = self.recording_check(check, [phenome], single=True)
+        try:
+            future = submit_task(self.worker_pool, function, argument, check)
+        except Exception:
+            # the task could not be dispatched, e.g., the pool is closed
+            self.budget.refund(1)
+            raise
+        if profile is not None:
+            self.record_completion(future, start)
+        return future
+
+
+    def submit_batch(self, phenomes):
+        """Start the evaluation of several solutions as one task.
+
+        The phenomes are pre-processed and the evaluations are counted
+        immediately. The whole batch is sent to the worker pool as a
+        single task (see :func:`submit`).
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Provides the list of objective values when the evaluations
+            are done.
+
+        Raises
+        ------
+        ResourcesExhausted
+            If the remaining budget is not sufficient to evaluate the
+            whole batch. In this case, no evaluations are counted.
+
+        """
+        profile = self.profile
+        if profile is not None:
+            profile.count("submitted_batches")
+            start = time.perf_counter()
+        preprocessor = self.phenome_preprocessor
+        phenomes = [preprocessor(phenome) for phenome in phenomes]
+        num_phenomes = len(phenomes)
+        if profile is not None and num_phenomes > 0:
+            start = self.record_time(PREPROCESSOR, start, num_phenomes)
+        if not self.budget.try_consume(num_phenomes):
+            raise ResourcesExhausted("problem evaluations")
+        if profile is not None and num_phenomes > 0:
+            start = self.record_time(BUDGET, start, num_phenomes)
+        if self.uses_registered_pool():
+            function = evaluate_registered_batch
+            argument = (self.problem_id, phenomes)
+        else:
+            function = evaluate_batch
+            argument = (self.objective_function, phenomes)
+        check_num_objectives = self.check_num_objectives
+        def check(results):
+            return [check_num_objectives(objective_values) for objective_values in results]
+        if self.recorder is not None and num_phenomes > 0:
+            check = self.recording_check(check, phenomes)
+        try:
+            future = submit_task(self.worker_pool, function, argument, check)
+        except Exception:
+            self.budget.refund(num_phenomes)
+            raise
+        if profile is not None and num_phenomes > 0:
+            self.record_completion(future, start, num_phenomes)
+        return future
+
+
+    def record_time(self, section, start, num_items=1):
+        """Record the time since `start` in the profile and return the current time."""
+        stop = time.perf_counter()
+        self.profile.record(section, stop - start, num_items)
+        return stop
+
+
+    def record_completion(self, future, start, num_items=1):
+        """Record the time from `start` until the future is done in the profile."""
+        profile = self.profile
+        def record(future):
+            profile.record(POOL_DISPATCH, time.perf_counter() - start, num_items)
+        future.add_done_callback(record)
+
+
+    def recording_check(self, check, phenomes, single=False):
+        """Extend the check of an asynchronous result by recording it.
+
+        The returned function is applied by :func:`submit_task
+        <optproblems.parallel.submit_task>` before the result is set on
+        the future, so the evaluations are recorded before anyone can
+        see them. Failed evaluations are not recorded, and neither are
+        those completing after the recorder was closed.
+
+        """
+        recorder = self.recorder
+        def check_and_record(result):
+            result = check(result)
+            try:
+                recorder.record(phenomes, [result] if single else result)
+            except ValueError:
+                # the recorder may be closed while the evaluation runs
+                if not recorder.closed:
+                    raise
+            return result
+        return check_and_record
+
+
+    def evaluate_iter(self, phenomes, window=None, chunksize=1, ordered=True):
+        """Lazily evaluate a possibly unbounded stream of phenomes.
+
+        Phenomes are only pulled from the iterable when there is room in
+        the window of evaluations in flight, so that arbitrarily long
+        streams can be evaluated in constant memory. The phenomes are
+        sent to the worker pool in chunks with :func:`submit_batch`. The
+        generator ends when the iterable or the budget is exhausted;
+        phenomes that cannot be afforded are not pulled from the iterable.
+
+        Parameters
+        ----------
+        phenomes : iterable
+            The solutions to evaluate.
+        window : int, optional
+            The maximal number of chunks in flight. By default, twice the
+            number of workers, or one without a worker pool.
+        chunksize : int, optional
+            The number of phenomes per task.
+        ordered : bool, optional
+            If False, results are yielded as soon as their chunk is done,
+            instead of in the order of the input.
+
+        Yields
+        ------
+        phenome : object
+            The phenome as obtained from the iterable.
+        objective_values : object
+            Its objective values.
+
+        """
+        worker_pool = self.worker_pool
+        if window is None:
+            if worker_pool is None:
+                window = 1
+            else:
+                window = 2 * count_workers(worker_pool)
+        assert window >= 1 and chunksize >= 1
+        iterator = iter(phenomes)
+        pending = deque()
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < window:
+                size = int(min(chunksize, max(self.remaining_evaluations, 0)))
+                chunk = list(itertools.islice(iterator, size))
+                if not chunk:
+                    exhausted = True
+                    break
+                try:
+                    future = self.submit_batch(chunk)
+                except ResourcesExhausted:
+                    # the budget was consumed concurrently by someone else
+                    exhausted = True
+                    break
+                pending.append((chunk, future))
+            if not pending:
+                return
+            if ordered:
+                chunk, future = pending.popleft()
+            else:
+                futures = [future for _, future in pending]
+                concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                for position, (chunk, future) in enumerate(pending):
+                    if future.done():
+                        break
+                del pending[position]
+            for phenome, objective_values in zip(chunk, future.result()):
+                yield phenome, objective_values
+
+
+    def evaluate_async(self, individual):
+        """Start the evaluation of an individual and return an awaitable.
+
+        This method must be called while an asyncio event loop is
+        running. The evaluation is started by :func:`submit`, and the
+        objective values are written into the individual when they are
+        available. Without a worker pool, the objective function is run
+        in the default executor of the event loop, so that the loop is
+        not blocked.
+
+        As in :func:`submit`, the phenome is pre-processed and the
+        evaluation is counted right away. Because
+        :class:`ResourcesExhausted` inherits from :class:`StopIteration`,
+        which cannot be raised inside coroutines, an exhausted budget is
+        reported by this call and not when awaiting the result.
+
+        Returns
+        -------
+        future : asyncio.Future
+            Provides the evaluated individual.
+
+        Raises
+        ------
+        ResourcesExhausted
+            If the budget of function evaluations is exhausted.
+
+        """
+        # imported here, because asyncio takes longer to import than
+        # the rest of this package
+        import asyncio
+        loop = asyncio.get_running_loop()
+        if self.worker_pool is None:
+            phenome = self.phenome_preprocessor(individual.phenome)
+            if not self.budget.try_consume(1):
+                raise ResourcesExhausted("problem evaluations")
+            check = self.check_num_objectives
+            if self.recorder is not None:
+                check = self.recording_check(check, [phenome], single=True)
+            objective_function = self.objective_function
+            evaluation = loop.run_in_executor(None, lambda: check(objective_function(phenome)))
+        else:
+            evaluation = asyncio.wrap_future(self.submit(individual.phenome))
+        result = loop.create_future()
+        def assign(evaluation):
+            if result.cancelled():
+                return
+            if evaluation.cancelled():
+                result.cancel()
+            elif evaluation.exception() is not None:
+                result.set_exception(evaluation.exception())
+            else:
+                individual.objective_values = evaluation.result()
+                result.set_result(individual)
+        evaluation.add_done_callback(assign)
+        return result
+
+
+    def vectorized_objective_function(self, phenomes):
+        """Apply the objective function to each row of a matrix.
+
+        This default implementation uses the batched implementation
+        offered by the objective function, if there is one (see
+        :func:`vectorize <optproblems.base.vectorize>`). Otherwise, the
+        rows are evaluated one by one. Subclasses can override this method
+        to provide a vectorized implementation of their own. No budget is
+        consumed here.
+
+        """
+        return vectorize(self.objective_function)(phenomes)
+
+
+    def evaluate_matrix(self, phenomes):
+        """Evaluate a population given as two-dimensional array.
+
+        Pre-processing, budget accounting, and the evaluation itself are
+        carried out once for the whole batch instead of once per phenome.
+        The pre-processor and the objective function are applied with
+        their batched implementations, if they provide one (see
+        :func:`vectorize <optproblems.base.vectorize>`). If the worker
+        pool was created by
+        :func:`create_worker_pool <optproblems.parallel.create_worker_pool>`,
+        the rows are distributed among the workers, transported via
+        shared memory.
+
+        Parameters
+        ----------
+        phenomes : array_like
+            An (n, d) array containing one phenome per row.
+
+        Returns
+        -------
+        objective_values : numpy.ndarray
+            An array of shape (n,) for single-objective problems, else an
+            array of shape (n, num_objectives).
+
+        Raises
+        ------
+        ResourcesExhausted
+            If the remaining budget is not sufficient to evaluate the
+            whole batch. In this case, no evaluations are counted.
+
+        """
+        phenomes = np.asarray(phenomes)
+        assert phenomes.ndim == 2
+        if len(phenomes) == 0:
+            if self.num_objectives == 1:
+                return np.empty(0)
+            return np.empty((0, self.num_objectives))
+        num_phenomes = len(phenomes)
+        profile = self.profile
+        if profile is not None:
+            profile.count("matrix_evaluations")
+            start = time.perf_counter()
+        preprocessor = self.phenome_preprocessor
+        if preprocessor is not identity:
+            phenomes = np.asarray(vectorize(preprocessor)(phenomes))
+            if profile is not None:
+                start = self.record_time(PREPROCESSOR, start, num_phenomes)
+        if not self.budget.try_consume(num_phenomes):
+            raise ResourcesExhausted("problem evaluations")
+        if profile is not None:
+            start = self.record_time(BUDGET, start, num_phenomes)
+        if num_phenomes > 1 and self.uses_registered_pool():
+            objective_values = evaluate_matrix_shared(self.worker_pool,
+                                                      self.problem_id,
+                                                      phenomes,
+                                                      self.num_objectives)
+            section = POOL_DISPATCH
+        else:
+            objective_values = np.asarray(self.vectorized_objective_function(phenomes))
+            section = OBJECTIVE_FUNCTION
+        if profile is not None:
+            self.record_time(section, start, num_phenomes)
+        if self.num_objectives == 1:
+            objective_values = objective_values.reshape((num_phenomes,))
+        else:
+            objective_values = objective_values.reshape((num_phenomes, self.num_objectives))
+        if self.recorder is not None:
+            self.recorder.record(phenomes, objective_values)
+        return objective_values
+
+
+    def uses_registered_pool(self):
+        """Check if the worker pool knows this problem.
+
+        This is the case if the pool was created by
+        :func:`create_worker_pool <optproblems.parallel.create_worker_pool>`
+        for this problem.
+
+        """
+        registered_problems = getattr(self.worker_pool, "registered_problems", ())
+        return self.problem_id in registered_problems
+
+
+    def pool_map(self, phenomes, chunksize=1):
+        """Evaluate phenomes on the worker pool, without budget accounting.
+
+        If the pool knows this problem, the tasks only contain the id of
+        the problem and the phenome. Otherwise, the objective function
+        is sent along with each chunk.
+
+        """
+        worker_pool = self.worker_pool
+        if self.uses_registered_pool():
+            # the workers already know the objective function
+            tasks = [(self.problem_id, phenome) for phenome in phenomes]
+            return worker_pool.map(evaluate_registered, tasks, chunksize=chunksize)
+        else:
+            return worker_pool.map(self.objective_function, phenomes, chunksize=chunksize)
+
+
+    def assign_objective_values(self, individuals, objective_values):
+        """Write the rows of an array of objective values into individuals.
+
+        Single objective values become floats, several objective values
+        become lists of floats.
+
+        """
+        objective_values = np.asarray(objective_values).tolist()
+        for individual, values in zip(individuals, objective_values):
+            individual.objective_values = values
+
+
     def batch_evaluate(self, individuals):
         """Evaluate a batch of individuals.
 
         Objective values are written directly into the individuals'
-        corresponding attributes.
+        corresponding attributes. If the attribute `transport` is set to
+        "shared_memory" and the worker pool knows this problem (see
+        :func:`create_worker_pool <optproblems.parallel.create_worker_pool>`),
+        the phenomes are converted into an array and evaluated by
+        :func:`evaluate_matrix`. Otherwise, they are pickled and sent to
+        the workers in chunks of size `chunksize` (by default 1). With
+        ``chunksize = "auto"``, the :class:`AdaptiveScheduler
+        <optproblems.parallel.AdaptiveScheduler>` in the attribute
+        `scheduler` chooses the chunk size from measurements, or even
+        decides to evaluate in the calling process.
 
         Raises
         ------
@@ -269,25 +956,48 @@ class Problem(object):
             evaluate = self.evaluate
             for individual in individuals:
                 evaluate(individual)
+        elif self.transport == "shared_memory" and self.uses_registered_pool():
+            phenomes = np.array([individual.phenome for individual in individuals], dtype=float)
+            try:
+                objective_values = self.evaluate_matrix(phenomes)
+            except ResourcesExhausted:
+                # fall back to evaluating as many as possible
+                num_affordable = int(min(len(individuals), max(self.remaining_evaluations, 0)))
+                if num_affordable > 0:
+                    objective_values = self.evaluate_matrix(phenomes[:num_affordable])
+                    self.assign_objective_values(individuals, objective_values)
+                raise
+            self.assign_objective_values(individuals, objective_values)
         else:
+            profile = self.profile
+            if profile is not None:
+                profile.count("batch_evaluations")
+                start = time.perf_counter()
             preprocessor = self.phenome_preprocessor
-            num_objectives = self.num_objectives
-            with self.lock:
-                budgeted_evaluations = min(len(individuals), self.remaining_evaluations)
-                affordable_individuals = individuals[:budgeted_evaluations]
+            budgeted_evaluations = self.budget.consume_up_to(len(individuals))
+            affordable_individuals = individuals[:budgeted_evaluations]
+            if profile is not None:
+                start = self.record_time(BUDGET, start, len(individuals))
+            try:
                 phenomes = [preprocessor(ind.phenome) for ind in affordable_individuals]
-                self.consumed_evaluations += budgeted_evaluations
-                self.remaining_evaluations -= budgeted_evaluations
-            results = self.worker_pool.map(self.objective_function,
-                                           phenomes,
-                                           chunksize=self.chunksize)
+            except Exception:
+                self.budget.refund(budgeted_evaluations)
+                raise
+            if profile is not None and phenomes:
+                start = self.record_time(PREPROCESSOR, start, len(phenomes))
+            if self.chunksize == "auto":
+                results = self.scheduler.map(self, phenomes)
+                if profile is not None and len(phenomes) > 1:
+                    profile.count("scheduler_" + self.scheduler.decision["mode"])
+            else:
+                results = self.pool_map(phenomes, self.chunksize)
+            if profile is not None and phenomes:
+                self.record_time(POOL_DISPATCH, start, len(phenomes))
+            check_num_objectives = self.check_num_objectives
             for individual, objective_values in zip(individuals, results):
-                try:
-                    num_obj_values = len(objective_values)
-                except TypeError:
-                    num_obj_values = 1
-                assert num_obj_values == num_objectives
-                individual.objective_values = objective_values
+                individual.objective_values = check_num_objectives(objective_values)
+            if self.recorder is not None:
+                self.recorder.record(phenomes, results)
             if len(individuals) > len(affordable_individuals):
                 raise ResourcesExhausted("problem evaluations")
 
@@ -340,6 +1050,416 @@ class MockMultiProcessing:
 
 
 
+def create_lock(locking=None, mp_module=None):
+    """Create a lock for the bookkeeping of a problem.
+
+    Parameters
+    ----------
+    locking : str, optional
+        "none" returns a :class:`MockMultiProcessing
+        <optproblems.base.MockMultiProcessing>` instance, which provides
+        no synchronization at all. "thread" returns a
+        :func:`threading.Lock`. "process" returns a
+        :func:`multiprocessing.Lock`, which lives in shared memory. "manager"
+        returns a lock proxy from ``mp_module.Manager()``, which requires a
+        server process, but can also be pickled. By default,
+        ``mp_module.Lock()`` is returned.
+    mp_module : module, optional
+        Either `multiprocessing`, `multiprocessing.dummy` (default), or a
+        `MockMultiProcessing` instance.
+
+    """
+    if mp_module is None:
+        mp_module = multiprocessing.dummy
+    if locking is None:
+        return mp_module.Lock()
+    elif locking == "none":
+        return MockMultiProcessing()
+    elif locking == "thread":
+        return threading.Lock()
+    elif locking == "process":
+        return multiprocessing.Lock()
+    elif locking == "manager":
+        return mp_module.Manager().Lock()
+    else:
+        raise ValueError("unknown locking strategy: " + str(locking))
+
+
+
+class EvaluationBudget(object):
+    """A budget of function evaluations.
+
+    All modifications go through the methods of this class, which check
+    and update the counters atomically under :attr:`lock`. A budget can
+    be shared by several problem instances in the same process.
+
+    """
+    def __init__(self, max_evaluations=float("inf"), locking=None, mp_module=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        max_evaluations : int, optional
+            The maximum number of function evaluations. By default there
+            is no restriction.
+        locking : str, optional
+            The synchronization strategy, see :func:`create_lock
+            <optproblems.base.create_lock>`.
+        mp_module : module, optional
+            Either `multiprocessing`, `multiprocessing.dummy` (default),
+            or a `MockMultiProcessing` instance.
+
+        """
+        self.locking = locking
+        self.lock = create_lock(locking, mp_module)
+        self.consumed = 0
+        self.remaining = max_evaluations
+
+
+    def try_consume(self, num_evaluations=1):
+        """Consume `num_evaluations` if the remaining budget suffices.
+
+        Returns
+        -------
+        success : bool
+            False if the budget is not sufficient. In this case, nothing
+            is consumed.
+
+        """
+        with self.lock:
+            if self.remaining >= num_evaluations:
+                self.consumed += num_evaluations
+                self.remaining -= num_evaluations
+                return True
+            return False
+
+
+    def consume_up_to(self, num_evaluations):
+        """Consume as many of `num_evaluations` as the budget allows.
+
+        Returns
+        -------
+        granted : int
+            The number of evaluations that were actually consumed.
+
+        """
+        with self.lock:
+            granted = int(min(num_evaluations, max(self.remaining, 0)))
+            self.consumed += granted
+            self.remaining -= granted
+            return granted
+
+
+    def refund(self, num_evaluations):
+        """Give back evaluations that were consumed, but not carried out."""
+        with self.lock:
+            self.consumed -= num_evaluations
+            self.remaining += num_evaluations
+
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        lock = self.lock
+        if not isinstance(lock, (MockMultiProcessing, multiprocessing.managers.BaseProxy)):
+            # a fresh lock is created in the receiving process
+            del state["lock"]
+        return state
+
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "lock" not in state:
+            if self.locking == "process":
+                self.lock = multiprocessing.Lock()
+            else:
+                self.lock = threading.Lock()
+
+
+
+_shared_budgets = weakref.WeakValueDictionary()
+_shared_budget_ids = itertools.count()
+
+
+
+def _lookup_shared_budget(budget_id):
+    """Find a shared budget inherited from the parent process."""
+    try:
+        return _shared_budgets[budget_id]
+    except KeyError:
+        message = "shared budget %s is unknown in process %d; "
+        message += "it must be created before the worker processes are started"
+        raise RuntimeError(message % (budget_id, os.getpid()))
+
+
+
+class SharedEvaluationBudget(EvaluationBudget):
+    """A budget of function evaluations in shared memory.
+
+    The counters are stored in a :func:`multiprocessing.Array`, whose lock
+    makes every check-and-update atomic across processes. Thus, problems
+    that are evaluated asynchronously in worker processes still respect
+    the maximal number of evaluations exactly.
+
+    The budget can be handed to worker processes that are started after
+    its creation, either as part of the arguments for starting the
+    process (e.g., the `initargs` of a pool), or by pickling it into a task
+    of a forked worker, which then finds the inherited instance.
+    Integral counter values are returned as int, although they are
+    stored as double to be able to represent an infinite budget.
+
+    """
+    def __init__(self, max_evaluations=float("inf"), context=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        max_evaluations : int, optional
+            The maximum number of function evaluations. By default there
+            is no restriction.
+        context : multiprocessing context, optional
+            The context used to allocate the shared memory. It must match
+            the context of the worker processes, e.g.,
+            ``multiprocessing.get_context("spawn")``. By default, the
+            `multiprocessing` module itself is used.
+
+        """
+        if context is None:
+            context = multiprocessing
+        self.locking = "counter"
+        self.shared_array = context.Array("d", [0, max_evaluations])
+        self.lock = self.shared_array.get_lock()
+        self.budget_id = "%d-%d" % (os.getpid(), next(_shared_budget_ids))
+        _shared_budgets[self.budget_id] = self
+
+
+    @staticmethod
+    def _as_count(value):
+        if value.is_integer():
+            return int(value)
+        return value
+
+
+    @property
+    def consumed(self):
+        return self._as_count(self.shared_array.get_obj()[0])
+
+
+    @consumed.setter
+    def consumed(self, value):
+        self.shared_array.get_obj()[0] = value
+
+
+    @property
+    def remaining(self):
+        return self._as_count(self.shared_array.get_obj()[1])
+
+
+    @remaining.setter
+    def remaining(self, value):
+        self.shared_array.get_obj()[1] = value
+
+
+    def __reduce__(self):
+        if multiprocessing.context.get_spawning_popen() is not None:
+            # the array itself can be transferred while starting a process
+            return (_restore_shared_budget, (self.budget_id, self.shared_array))
+        return (_lookup_shared_budget, (self.budget_id,))
+
+
+
+def _restore_shared_budget(budget_id, shared_array):
+    """Rebuild a shared budget in a newly started process."""
+    try:
+        return _shared_budgets[budget_id]
+    except KeyError:
+        budget = SharedEvaluationBudget.__new__(SharedEvaluationBudget)
+        budget.locking = "counter"
+        budget.shared_array = shared_array
+        budget.lock = shared_array.get_lock()
+        budget.budget_id = budget_id
+        _shared_budgets[budget_id] = budget
+        return budget
+
+
+
+def estimate_size(obj):
+    """Estimate the memory consumption of a key or value in bytes.
+
+    Sequences and dictionaries are measured together with their
+    (top-level) items, arrays by their data buffer. This is only an
+    approximation, which is good enough for bounding the size of an
+    archive.
+
+    """
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj) + (0 if obj.flags.owndata else obj.nbytes)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (tuple, list)):
+        size += sum(sys.getsizeof(item) for item in obj)
+    elif isinstance(obj, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in obj.items())
+    return size
+
+
+
+class BoundedArchive(MutableMapping):
+    """An archive for :class:`Cache <optproblems.base.Cache>` with eviction.
+
+    The archive behaves like a dictionary, but removes entries when a
+    maximal number of entries or a maximal total size is reached, or when
+    entries become too old. Reading an entry with ``archive[key]``
+    counts as an access for the eviction policy, while ``key in archive``
+    does not. All operations take constant (amortized) time.
+
+    """
+    POLICIES = ("lru", "lfu", "fifo")
+
+    def __init__(self, max_entries=None,
+                 max_bytes=None,
+                 policy="lru",
+                 ttl=None,
+                 size_function=estimate_size):
+        """Constructor.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximal number of entries. Unbounded by default.
+        max_bytes : int, optional
+            The maximal total size of keys and values, as measured by
+            `size_function`. Unbounded by default.
+        policy : str, optional
+            Which entry to evict when a bound is reached. "lru" removes
+            the least recently used, "lfu" the least frequently used
+            (ties are broken by age), and "fifo" the oldest entry.
+        ttl : int, optional
+            The time to live of entries, measured in the number of
+            entries stored afterwards, i.e., in true evaluations. Expired
+            entries are removed regardless of the policy. By default,
+            entries do not expire.
+        size_function : callable, optional
+            Estimates the size of a key or value in bytes. Only used if
+            `max_bytes` is given.
+
+        """
+        assert policy in self.POLICIES
+        assert max_entries is None or max_entries > 0
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.ttl = ttl
+        self.size_function = size_function
+        self.entries = OrderedDict()
+        self.sizes = dict()
+        self.total_bytes = 0
+        # for lfu
+        self.frequencies = dict()
+        self.frequency_buckets = dict()
+        self.min_frequency = 0
+        # for ttl
+        self.clock = 0
+        self.insertion_times = OrderedDict()
+        self.num_evictions = 0
+
+
+    def __len__(self):
+        return len(self.entries)
+
+
+    def __iter__(self):
+        return iter(self.entries)
+
+
+    def __contains__(self, key):
+        return key in self.entries
+
+
+    def __getitem__(self, key):
+        value = self.entries[key]
+        if self.policy == "lru":
+            self.entries.move_to_end(key)
+        elif self.policy == "lfu":
+            self._increment_frequency(key)
+        return value
+
+
+    def __setitem__(self, key, value):
+        if key in self.entries:
+            del self[key]
+        self.clock += 1
+        if self.ttl is not None:
+            self._remove_expired()
+        size = 0
+        if self.max_bytes is not None:
+            size = self.size_function(key) + self.size_function(value)
+            if size > self.max_bytes:
+                # would never fit
+                return
+            while self.entries and self.total_bytes + size > self.max_bytes:
+                self._evict()
+        if self.max_entries is not None:
+            while len(self.entries) >= self.max_entries:
+                self._evict()
+        self.entries[key] = value
+        if self.max_bytes is not None:
+            self.sizes[key] = size
+            self.total_bytes += size
+        if self.ttl is not None:
+            self.insertion_times[key] = self.clock
+        if self.policy == "lfu":
+            self.frequencies[key] = 1
+            self.frequency_buckets.setdefault(1, OrderedDict())[key] = None
+            self.min_frequency = 1
+
+
+    def __delitem__(self, key):
+        del self.entries[key]
+        if key in self.sizes:
+            self.total_bytes -= self.sizes.pop(key)
+        self.insertion_times.pop(key, None)
+        if self.policy == "lfu":
+            frequency = self.frequencies.pop(key)
+            bucket = self.frequency_buckets[frequency]
+            del bucket[key]
+            if not bucket:
+                del self.frequency_buckets[frequency]
+                if frequency == self.min_frequency and self.frequency_buckets:
+                    self.min_frequency = min(self.frequency_buckets)
+
+
+    def _increment_frequency(self, key):
+        frequency = self.frequencies[key]
+        bucket = self.frequency_buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self.frequency_buckets[frequency]
+            if frequency == self.min_frequency:
+                self.min_frequency = frequency + 1
+        self.frequencies[key] = frequency + 1
+        self.frequency_buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+
+    def _evict(self):
+        if self.policy == "lfu":
+            victim = next(iter(self.frequency_buckets[self.min_frequency]))
+        else:
+            victim = next(iter(self.entries))
+        del self[victim]
+        self.num_evictions += 1
+
+
+    def _remove_expired(self):
+        insertion_times = self.insertion_times
+        deadline = self.clock - self.ttl
+        while insertion_times:
+            key, insertion_time = next(iter(insertion_times.items()))
+            if insertion_time > deadline:
+                break
+            del self[key]
+            self.num_evictions += 1
+
+
+
 class Cache(Problem):
     """Wrapper to save objective function evaluations of duplicates.
 
@@ -354,8 +1474,24 @@ class Cache(Problem):
         as ``Problem(Cache(Problem(...)), max_evaluations=x)`` would
         work.
 
+    Objective values are stored in an immutable form (see
+    :func:`freeze_objective_values`) and returned without copying. So,
+    lists of objective values become tuples, and arrays become read-only.
+
+    By default, the archive grows without limit. Long runs can bound its
+    memory consumption with `max_entries`, `max_bytes`, or `ttl`, which
+    select a :class:`BoundedArchive <optproblems.base.BoundedArchive>`.
+    The attributes `saved_evaluations` (cache hits), `cache_misses`, and
+    `cache_evictions` provide statistics.
+
     """
-    def __init__(self, problem, hash_function=tuple):
+    def __init__(self, problem,
+                 hash_function=tuple,
+                 max_entries=None,
+                 max_bytes=None,
+                 eviction_policy="lru",
+                 ttl=None,
+                 archive=None):
         """Constructor.
 
         Parameters
@@ -366,13 +1502,42 @@ class Cache(Problem):
             A function that gets the phenome as input and returns a
             hashable key for storing the objective values in a dictionary.
             By default we convert the phenome into a tuple to obtain this
-            functionality.
+            functionality. For NumPy phenomes, :func:`array_key
+            <optproblems.base.array_key>` is considerably faster. A
+            batched implementation in the attribute `vectorized` is used
+            for matrices of phenomes.
+        max_entries : int, optional
+            The maximal number of entries in the archive.
+        max_bytes : int, optional
+            The maximal estimated size of the archive in bytes (see
+            :func:`estimate_size <optproblems.base.estimate_size>`).
+        eviction_policy : str, optional
+            "lru", "lfu", or "fifo". Only relevant if the archive is
+            bounded.
+        ttl : int, optional
+            Entries are removed after this many further entries have
+            been stored.
+        archive : mutable mapping, optional
+            A custom archive. If given, the bounds and the eviction
+            policy are ignored.
 
         """
         self.problem = problem
         self.hash_function = hash_function
         self.saved_evaluations = 0
-        self.archive = OrderedDict()
+        self.cache_misses = 0
+        if archive is None:
+            if max_entries is None and max_bytes is None and ttl is None:
+                archive = OrderedDict()
+            else:
+                archive = BoundedArchive(max_entries, max_bytes, eviction_policy, ttl)
+        self.archive = archive
+
+
+    @property
+    def cache_evictions(self):
+        """The number of entries the archive has removed so far."""
+        return getattr(self.archive, "num_evictions", 0)
 
 
     @staticmethod
@@ -386,6 +1551,10 @@ class Cache(Problem):
         to override this method if you have very exotic objective values.
 
         """
+        if isinstance(objective_values, np.ndarray):
+            return objective_values.size > 0 and objective_values.dtype.kind in "biufc"
+        if isinstance(objective_values, str):
+            return False
         valid = objective_values is not None
         try:
             num_obj_values = len(objective_values)
@@ -393,13 +1562,38 @@ class Cache(Problem):
             return valid
         valid = valid and num_obj_values > 0
         try:
-            valid = valid and None not in objective_values
-            valid = valid and [] not in objective_values
+            # identity and type checks avoid element-wise comparisons of
+            # NumPy scalars with None and []
+            for value in objective_values:
+                if value is None or (isinstance(value, list) and len(value) == 0):
+                    return False
         except TypeError:
             return False
         return valid
 
 
+    @staticmethod
+    def freeze_objective_values(objective_values):
+        """Return an immutable version of the objective values.
+
+        Lists are converted into tuples, and arrays into read-only
+        copies, so that stored values can be handed out without copying.
+        Other objects, in particular numbers, are returned as they are.
+        Override this method if your objective values are mutable
+        objects of another type.
+
+        """
+        if isinstance(objective_values, np.ndarray):
+            if not objective_values.flags.writeable:
+                return objective_values
+            frozen = objective_values.copy()
+            frozen.setflags(write=False)
+            return frozen
+        elif isinstance(objective_values, list):
+            return tuple(objective_values)
+        return objective_values
+
+
     @property
     def num_objectives(self):
         return self.problem.num_objectives
@@ -410,6 +1604,51 @@ class Cache(Problem):
         return self.problem.worker_pool
 
 
+    @worker_pool.setter
+    def worker_pool(self, value):
+        self.problem.worker_pool = value
+
+
+    @property
+    def objective_function(self):
+        return self.problem.objective_function
+
+
+    @property
+    def problem_id(self):
+        return self.problem.problem_id
+
+
+    @property
+    def vectorized_objective_function(self):
+        return self.problem.vectorized_objective_function
+
+
+    @property
+    def profile(self):
+        return self.problem.profile
+
+
+    @profile.setter
+    def profile(self, value):
+        self.problem.profile = value
+
+
+    @property
+    def recorder(self):
+        return self.problem.recorder
+
+
+    @recorder.setter
+    def recorder(self, value):
+        self.problem.recorder = value
+
+
+    @property
+    def budget(self):
+        return self.problem.budget
+
+
     @property
     def consumed_evaluations(self):
         return self.problem.consumed_evaluations
@@ -446,17 +1685,86 @@ class Cache(Problem):
         recognized = False
         with self.problem.lock:
             if key in self.archive:
-                objective_values = copy.deepcopy(self.archive[key])
+                objective_values = self.archive[key]
                 self.saved_evaluations += 1
                 recognized = True
+            else:
+                self.cache_misses += 1
         if not recognized:
             objective_values = self.problem.__call__(phenome)
             if self.are_objectives_valid(objective_values):
+                objective_values = self.freeze_objective_values(objective_values)
                 with self.problem.lock:
-                    self.archive[key] = copy.deepcopy(objective_values)
+                    self.archive[key] = objective_values
         return objective_values
 
 
+    def submit(self, phenome):
+        """Cached asynchronous evaluation of one solution.
+
+        If the solution is found in the archive, a completed future is
+        returned. Else, the evaluation is submitted to the original
+        problem, and the objective values are stored in the archive when
+        they arrive, if they are valid.
+
+        """
+        key = self.hash_function(phenome)
+        with self.problem.lock:
+            if key in self.archive:
+                objective_values = self.archive[key]
+                self.saved_evaluations += 1
+                future = concurrent.futures.Future()
+                future.set_result(objective_values)
+                return future
+            self.cache_misses += 1
+        future = self.problem.submit(phenome)
+        def store_result(future):
+            if future.exception() is None:
+                self.store([(key, future.result())])
+        future.add_done_callback(store_result)
+        return future
+
+
+    def submit_batch(self, phenomes):
+        """Cached asynchronous evaluation of several solutions.
+
+        Only the distinct phenomes without an entry in the archive are
+        submitted to the original problem. The returned future provides
+        the objective values for all phenomes.
+
+        """
+        phenomes = list(phenomes)
+        keys = [self.hash_function(phenome) for phenome in phenomes]
+        positions = self.group_duplicates(keys)
+        unique_keys = list(positions)
+        known_values = self.lookup(unique_keys)
+        values_by_key = dict((unique_keys[j], values) for j, values in known_values.items())
+        new_keys = [key for j, key in enumerate(unique_keys) if j not in known_values]
+        num_duplicates = len(keys) - len(unique_keys)
+        future = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+        if not new_keys:
+            with self.problem.lock:
+                self.saved_evaluations += num_duplicates
+            future.set_result([values_by_key[key] for key in keys])
+            return future
+        new_phenomes = [phenomes[positions[key][0]] for key in new_keys]
+        def combine(new_future):
+            try:
+                freeze = self.freeze_objective_values
+                new_values = [freeze(values) for values in new_future.result()]
+                values_by_key.update(zip(new_keys, new_values))
+                self.store(zip(new_keys, new_values))
+                with self.problem.lock:
+                    self.saved_evaluations += num_duplicates
+            except Exception as exception:
+                future.set_exception(exception)
+            else:
+                future.set_result([values_by_key[key] for key in keys])
+        self.problem.submit_batch(new_phenomes).add_done_callback(combine)
+        return future
+
+
     def batch_evaluate(self, individuals):
         """Evaluate a batch of individuals, trying to avoid re-evaluations.
 
@@ -465,9 +1773,14 @@ class Cache(Problem):
         delegated to the original problem. Finally, the new evaluations are
         stored in the archive, if they are valid.
 
-        .. warning:: If ``worker_pool is not None``, duplicates in a batch
-                    will not be recognized, leading to an expensive function
-                    evaluation for each one.
+        If ``worker_pool is not None``, duplicates inside the batch are
+        also recognized. Only one representative per key is sent to the
+        original problem (and charged to the budget), and its objective
+        values are copied to the duplicates afterwards. Duplicates count
+        as saved evaluations once their representative has been
+        evaluated. If the budget is exhausted during the batch, the
+        duplicates of representatives that were not evaluated remain
+        without objective values.
 
         """
         if self.worker_pool is None or len(individuals) == 1:
@@ -476,27 +1789,145 @@ class Cache(Problem):
                 evaluate(individual)
         else:
             hash_function = self.hash_function
-            unrecognized_individuals = []
+            positions = self.group_duplicates(hash_function(ind.phenome) for ind in individuals)
+            unique_keys = list(positions)
             # treat known solutions
-            for individual in individuals:
-                key = hash_function(individual.phenome)
-                with self.problem.lock:
-                    if key in self.archive:
-                        individual.objective_values = copy.deepcopy(self.archive[key])
-                        self.saved_evaluations += 1
-                    else:
-                        unrecognized_individuals.append(individual)
+            known_values = self.lookup(unique_keys)
+            representatives = []
+            representative_keys = []
+            num_duplicates = 0
+            for j, key in enumerate(unique_keys):
+                if j in known_values:
+                    for i in positions[key]:
+                        individuals[i].objective_values = known_values[j]
+                    num_duplicates += len(positions[key]) - 1
+                else:
+                    representative = individuals[positions[key][0]]
+                    # tells afterwards if the representative was evaluated
+                    representative.objective_values = None
+                    representatives.append(representative)
+                    representative_keys.append(key)
             # do actual evaluations
             try:
-                self.problem.batch_evaluate(unrecognized_individuals)
+                self.problem.batch_evaluate(representatives)
             finally:
-                are_objectives_valid = self.are_objectives_valid
-                for individual in unrecognized_individuals:
-                    valid = are_objectives_valid(individual.objective_values)
-                    if valid:
-                        key = hash_function(individual.phenome)
-                        with self.problem.lock:
-                            self.archive[key] = copy.deepcopy(individual.objective_values)
+                freeze = self.freeze_objective_values
+                evaluated_keys = []
+                new_values = []
+                for key, representative in zip(representative_keys, representatives):
+                    if representative.objective_values is None:
+                        continue
+                    objective_values = freeze(representative.objective_values)
+                    representative.objective_values = objective_values
+                    for i in positions[key][1:]:
+                        individuals[i].objective_values = objective_values
+                    num_duplicates += len(positions[key]) - 1
+                    evaluated_keys.append(key)
+                    new_values.append(objective_values)
+                with self.problem.lock:
+                    self.saved_evaluations += num_duplicates
+                self.store(zip(evaluated_keys, new_values))
+
+
+    def evaluate_matrix(self, phenomes):
+        """Evaluate a matrix of phenomes, trying to avoid re-evaluations.
+
+        Rows with an entry in the archive reuse the stored objective
+        values. The remaining rows are evaluated together by the
+        original problem's
+        :func:`evaluate_matrix <optproblems.base.Problem.evaluate_matrix>`
+        and stored in the archive afterwards, if they are valid. Rows
+        occurring several times in the matrix are only evaluated once.
+
+        """
+        phenomes = np.asarray(phenomes)
+        assert phenomes.ndim == 2
+        keys = vectorize(self.hash_function)(phenomes)
+        positions = self.group_duplicates(keys)
+        unique_keys = list(positions)
+        known_values = self.lookup(unique_keys)
+        values_by_key = dict((unique_keys[j], values) for j, values in known_values.items())
+        new_keys = [key for j, key in enumerate(unique_keys) if j not in known_values]
+        if new_keys:
+            new_rows = [positions[key][0] for key in new_keys]
+            new_values = self.problem.evaluate_matrix(phenomes[new_rows])
+            values_by_key.update(zip(new_keys, new_values))
+            self.store(zip(new_keys, new_values))
+        # duplicates are only saved once their representative is evaluated
+        with self.problem.lock:
+            self.saved_evaluations += len(keys) - len(unique_keys)
+        return np.array([values_by_key[key] for key in keys])
+
+
+    @staticmethod
+    def group_duplicates(keys):
+        """Group the positions of equal keys.
+
+        Returns
+        -------
+        positions : OrderedDict
+            Maps each distinct key to the list of its positions, in the
+            order of first occurrence.
+
+        """
+        positions = OrderedDict()
+        for i, key in enumerate(keys):
+            positions.setdefault(key, []).append(i)
+        return positions
+
+
+    def lookup(self, keys):
+        """Look up the objective values for several keys at once.
+
+        If the archive provides a ``get_many`` method, as for example
+        :class:`PersistentArchive <optproblems.persistence.PersistentArchive>`,
+        all keys are retrieved in one call. Hits and misses are counted.
+
+        Returns
+        -------
+        known_values : dict
+            Maps the positions of the recognized keys to the stored
+            (immutable) objective values.
+
+        """
+        archive = self.archive
+        known_values = {}
+        with self.problem.lock:
+            get_many = getattr(archive, "get_many", None)
+            if get_many is not None:
+                stored_values = get_many(keys)
+                for i, key in enumerate(keys):
+                    if key in stored_values:
+                        known_values[i] = stored_values[key]
+            else:
+                for i, key in enumerate(keys):
+                    if key in archive:
+                        known_values[i] = archive[key]
+            self.saved_evaluations += len(known_values)
+            self.cache_misses += len(keys) - len(known_values)
+        return known_values
+
+
+    def store(self, items):
+        """Store the valid objective values of several (key, values) pairs.
+
+        If the archive provides a ``set_many`` method, all entries are
+        written in one call.
+
+        """
+        are_objectives_valid = self.are_objectives_valid
+        freeze = self.freeze_objective_values
+        valid_items = [(key, freeze(objective_values))
+                       for key, objective_values in items
+                       if are_objectives_valid(objective_values)]
+        archive = self.archive
+        with self.problem.lock:
+            set_many = getattr(archive, "set_many", None)
+            if set_many is not None:
+                set_many(valid_items)
+            else:
+                for key, objective_values in valid_items:
+                    archive[key] = objective_values
 
 
 
@@ -504,7 +1935,10 @@ class ScalingPreprocessor:
     """Translation and linear transformation between arbitrary cuboids.
 
     This class is useful to normalize the search space, while the problem can
-    keep using its "native" units.
+    keep using its "native" units. The scale factors are computed once in
+    the constructor. A whole population can be transformed at once with
+    :func:`vectorized`. If a range of `from_cuboid` has zero width, a
+    :class:`ZeroDivisionError` is raised when phenomes are transformed.
 
     .. note:: This class makes use of the decorator design pattern for
         potential chaining of pre-processors, see
@@ -539,9 +1973,33 @@ class ScalingPreprocessor:
         assert len(min_bounds_from) == len(max_bounds_from)
         for min_bound_from, max_bound_from in zip(min_bounds_from, max_bounds_from):
             assert max_bound_from >= min_bound_from
+        assert len(min_bounds_from) == len(min_bounds_to)
+        length_factors = []
+        self.degenerate_variables = []
+        for i in range(len(min_bounds_from)):
+            from_width = max_bounds_from[i] - min_bounds_from[i]
+            if from_width == 0:
+                # the error is deferred to the transformation, as before
+                self.degenerate_variables.append(i)
+                length_factors.append(float("nan"))
+                continue
+            length_factor = max_bounds_to[i] - min_bounds_to[i]
+            length_factor /= from_width
+            length_factors.append(length_factor)
+        self.length_factors = length_factors
+        self.min_bounds_from_array = np.array(min_bounds_from, dtype=float)
+        self.min_bounds_to_array = np.array(min_bounds_to, dtype=float)
+        self.length_factors_array = np.array(length_factors, dtype=float)
         self.previous_preprocessor = previous_preprocessor
 
 
+    def check_degenerate(self):
+        """Raise a ZeroDivisionError if a range of `from_cuboid` is empty."""
+        if self.degenerate_variables:
+            raise ZeroDivisionError("from_cuboid has zero width for variable x%d"
+                                    % self.degenerate_variables[0])
+
+
     def __call__(self, phenome):
         """Transform from one space to the other.
 
@@ -551,19 +2009,39 @@ class ScalingPreprocessor:
         """
         if self.previous_preprocessor is not None:
             phenome = self.previous_preprocessor(phenome)
-        min_bounds_to, max_bounds_to = self.to_cuboid
-        min_bounds_from, max_bounds_from = self.from_cuboid
+        self.check_degenerate()
+        min_bounds_to = self.to_cuboid[0]
+        min_bounds_from = self.from_cuboid[0]
+        length_factors = self.length_factors
         assert len(phenome) == len(min_bounds_from)
         # scale
         scaled_point = copy.copy(phenome)
         for i, value in enumerate(phenome):
-            length_factor = max_bounds_to[i] - min_bounds_to[i]
-            length_factor /= max_bounds_from[i] - min_bounds_from[i]
-            scaled_point[i] = (phenome[i] - min_bounds_from[i]) * length_factor
+            scaled_point[i] = (value - min_bounds_from[i]) * length_factors[i]
             scaled_point[i] += min_bounds_to[i]
         return scaled_point
 
 
+    def vectorized(self, phenomes):
+        """Transform all rows of an (n, d) array at once.
+
+        Returns
+        -------
+        scaled_points : numpy.ndarray
+            A new array.
+
+        """
+        if self.previous_preprocessor is not None:
+            phenomes = vectorize(self.previous_preprocessor)(phenomes)
+        phenomes = np.asarray(phenomes, dtype=float)
+        assert phenomes.ndim == 2 and phenomes.shape[1] == len(self.length_factors)
+        self.check_degenerate()
+        scaled_points = phenomes - self.min_bounds_from_array
+        scaled_points *= self.length_factors_array
+        scaled_points += self.min_bounds_to_array
+        return scaled_points
+
+
 
 class BoundConstraintError(ValueError):
     """Used to report violations of bound constraints.
@@ -593,9 +2071,31 @@ def max_bound_violated(value, max_bound):
 
 
 
+def bounds_to_arrays(min_bounds, max_bounds):
+    """Convert bounds into float arrays, replacing None by -inf and inf."""
+    min_array = np.array([-np.inf if bound is None else bound for bound in min_bounds], dtype=float)
+    max_array = np.array([np.inf if bound is None else bound for bound in max_bounds], dtype=float)
+    return min_array, max_array
+
+
+
+def find_bound_violation(phenomes, min_array, max_array):
+    """Return the (row, column) of the first bound violation in a matrix, or None."""
+    violated = phenomes < min_array
+    violated |= phenomes > max_array
+    if not violated.any():
+        return None
+    row, column = np.unravel_index(np.argmax(violated), violated.shape)
+    return row, column
+
+
+
 class BoundConstraintsChecker:
     """A pre-processor raising exceptions if bound constraints are violated.
 
+    The bounds are converted to arrays once in the constructor, for the
+    batched check in :func:`vectorized`.
+
     .. note:: This class makes use of the decorator design pattern for
         potential chaining of pre-processors, see
         https://en.wikipedia.org/wiki/Decorator_pattern
@@ -616,6 +2116,10 @@ class BoundConstraintsChecker:
         """
         self.min_bounds, self.max_bounds = bounds
         assert len(self.min_bounds) == len(self.max_bounds)
+        self.min_array, self.max_array = bounds_to_arrays(self.min_bounds, self.max_bounds)
+        # the same as lists with infinite instead of missing bounds
+        self.min_limits = self.min_array.tolist()
+        self.max_limits = self.max_array.tolist()
         self.previous_preprocessor = previous_preprocessor
 
 
@@ -630,15 +2134,35 @@ class BoundConstraintsChecker:
         """
         if self.previous_preprocessor is not None:
             phenome = self.previous_preprocessor(phenome)
-        max_bounds = self.max_bounds
-        min_bounds = self.min_bounds
-        assert len(phenome) == len(min_bounds)
+        min_limits = self.min_limits
+        max_limits = self.max_limits
+        assert len(phenome) == len(min_limits)
         for i, phene in enumerate(phenome):
-            if min_bound_violated(phene, min_bounds[i]) or max_bound_violated(phene, max_bounds[i]):
-                raise BoundConstraintError(phene, min_bounds[i], max_bounds[i], variable_name="x"+str(i))
+            if phene < min_limits[i] or phene > max_limits[i]:
+                raise BoundConstraintError(phene, self.min_bounds[i], self.max_bounds[i], variable_name="x"+str(i))
         return phenome
 
 
+    def vectorized(self, phenomes):
+        """Check the bound constraints of all rows of an (n, d) array.
+
+        Raises
+        ------
+        BoundConstraintError
+            For the first violated bound constraint in row-major order.
+
+        """
+        if self.previous_preprocessor is not None:
+            phenomes = vectorize(self.previous_preprocessor)(phenomes)
+        phenomes = np.asarray(phenomes)
+        assert phenomes.ndim == 2 and phenomes.shape[1] == len(self.min_bounds)
+        violation = find_bound_violation(phenomes, self.min_array, self.max_array)
+        if violation is not None:
+            row, i = violation
+            raise BoundConstraintError(phenomes[row, i], self.min_bounds[i], self.max_bounds[i], variable_name="x"+str(i))
+        return phenomes
+
+
 
 def project(value, min_bound, max_bound):
     """Clip the value to the feasible range.
@@ -750,11 +2274,103 @@ def wrap(value, min_bound, max_bound):
 
 
 
+def check_finite(phenomes):
+    """Raise an exception if the array contains infinite values."""
+    if np.isinf(phenomes).any():
+        raise Exception("Infinity detected in phenome")
+
+
+
+def project_array(phenomes, min_bounds, max_bounds):
+    """Clip an (n, k) array to the bounds of its columns, in place.
+
+    This is the batched form of :func:`project`. Missing bounds must be
+    given as infinite values (see :func:`bounds_to_arrays`).
+
+    """
+    return np.clip(phenomes, min_bounds, max_bounds, out=phenomes)
+
+
+
+def reflect_array(phenomes, min_bounds, max_bounds):
+    """Reflect the values of an (n, k) array into their bounds, in place.
+
+    This is the batched form of :func:`reflect`. Instead of mirroring
+    repeatedly, the reflection is computed by modular arithmetic with
+    period twice the range. Missing bounds must be given as infinite
+    values (see :func:`bounds_to_arrays`).
+
+    """
+    check_finite(phenomes)
+    violated = phenomes < min_bounds
+    violated |= phenomes > max_bounds
+    if not violated.any():
+        return phenomes
+    rows, columns = np.nonzero(violated)
+    values = phenomes[rows, columns]
+    min_bounds = np.broadcast_to(min_bounds, phenomes.shape[-1:])[columns]
+    max_bounds = np.broadcast_to(max_bounds, phenomes.shape[-1:])[columns]
+    width = max_bounds - min_bounds
+    with np.errstate(invalid="ignore"):
+        period = 2.0 * width
+        remainder = np.mod(values - min_bounds, period)
+        reflected = np.where(remainder > width,
+                             min_bounds + (period - remainder),
+                             min_bounds + remainder)
+        # with only one bound, a single reflection suffices
+        reflected_once = np.where(values < min_bounds,
+                                  min_bounds + (min_bounds - values),
+                                  max_bounds - (values - max_bounds))
+    both_bounds = np.isfinite(width)
+    repaired = np.where(both_bounds, reflected, reflected_once)
+    repaired = np.where(width == 0.0, max_bounds, repaired)
+    phenomes[rows, columns] = repaired
+    return phenomes
+
+
+
+def wrap_array(phenomes, min_bounds, max_bounds):
+    """Wrap the values of an (n, k) array around their bounds, in place.
+
+    This is the batched form of :func:`wrap`.
+
+    """
+    if not (np.isfinite(min_bounds).all() and np.isfinite(max_bounds).all()):
+        raise Exception("Wrapping is only applicable if lower and upper bounds exist")
+    check_finite(phenomes)
+    violated = phenomes < min_bounds
+    violated |= phenomes > max_bounds
+    if not violated.any():
+        return phenomes
+    rows, columns = np.nonzero(violated)
+    values = phenomes[rows, columns]
+    min_bounds = np.broadcast_to(min_bounds, phenomes.shape[-1:])[columns]
+    max_bounds = np.broadcast_to(max_bounds, phenomes.shape[-1:])[columns]
+    width = max_bounds - min_bounds
+    with np.errstate(invalid="ignore", divide="ignore"):
+        wrapped = min_bounds + np.mod(values - min_bounds, width)
+    phenomes[rows, columns] = np.where(width == 0.0, max_bounds, wrapped)
+    return phenomes
+
+
+project.vectorized = project_array
+reflect.vectorized = reflect_array
+wrap.vectorized = wrap_array
+
+BUILT_IN_REPAIR_MODES = (project, reflect, wrap, BoundConstraintError)
+
+
+
 class BoundConstraintsRepair:
     """A pre-processor that repairs violations of bound constraints.
 
     More information about the available repair methods can be found
-    in [Wessing2013]_.
+    in [Wessing2013]_. With :func:`vectorized`, a whole population is
+    repaired at once. There, the variables are grouped by repair mode,
+    and each group is repaired by the batched form of its repair
+    function (see :func:`project_array`, :func:`reflect_array`, and
+    :func:`wrap_array`). Custom repair functions can offer a batched
+    form in their attribute `vectorized`, with the same signature.
 
     .. note:: This class makes use of the decorator design pattern for
         potential chaining of pre-processors, see
@@ -778,10 +2394,11 @@ class BoundConstraintsRepair:
             sequence contains the upper bounds for each variable.
         repair_modes : sequence
             Contains an individual repair mode for each variable. The
-            methods projection, reflection, and wrapping are supported.
+            methods projection, reflection, and wrapping are supported,
+            as well as callables with the signature of :func:`project`.
             Values of None indicate that repair is not possible/desired.
-            If a constraint violation is detected in this case, an
-            exception is raised.
+            If a constraint violation is detected in this case, a
+            :class:`BoundConstraintError` is raised.
         previous_preprocessor : callable, optional
             Another callable that processes the phenome before this one
             does.
@@ -803,28 +2420,118 @@ class BoundConstraintsRepair:
                 raise Exception("Unknown repair mode: " + str(repair_mode))
         self.repair_modes = repair_modes
         assert len(self.repair_modes) == len(self.min_bounds)
+        self.min_array, self.max_array = bounds_to_arrays(self.min_bounds, self.max_bounds)
+        self.min_limits = self.min_array.tolist()
+        self.max_limits = self.max_array.tolist()
+        # like wrap_array, reject every phenome and not only violating ones
+        self.wraps_without_bounds = any(
+            repair_mode is wrap and math.isinf(max_limit - min_limit)
+            for repair_mode, min_limit, max_limit in zip(repair_modes, self.min_limits, self.max_limits))
+        # group the variables by repair mode, keeping the order of first occurrence
+        groups = OrderedDict()
+        for i, repair_mode in enumerate(repair_modes):
+            groups.setdefault(repair_mode, []).append(i)
+        num_variables = len(repair_modes)
+        self.repair_groups = []
+        for repair_mode, columns in groups.items():
+            if columns == list(range(num_variables)):
+                # all variables, so that no copies of columns are necessary
+                columns = slice(None)
+            else:
+                columns = np.array(columns)
+            self.repair_groups.append((repair_mode,
+                                       columns,
+                                       self.min_array[columns],
+                                       self.max_array[columns]))
         self.previous_preprocessor = previous_preprocessor
 
 
     def __call__(self, phenome):
         """Return a repaired version of this phenome.
 
-        Does not modify the original.
+        Does not modify the original. The built-in repair functions are
+        only called for values violating the bounds (or infinite ones),
+        custom repair functions are called for every value. As in
+        :func:`vectorized`, wrapping a variable with a missing bound
+        raises an exception for every phenome.
 
         """
-        max_bounds = self.max_bounds
-        min_bounds = self.min_bounds
+        if self.wraps_without_bounds:
+            raise Exception("Wrapping is only applicable if lower and upper bounds exist")
         if self.previous_preprocessor is not None:
             phenome = self.previous_preprocessor(phenome)
-        phenome = copy.deepcopy(phenome)
+        phenome = copy.copy(phenome)
+        min_limits = self.min_limits
+        max_limits = self.max_limits
         repair_modes = self.repair_modes
-        # determine repair mode and execute
         for i, phene in enumerate(phenome):
             repair_mode = repair_modes[i]
-            phenome[i] = repair_mode(phene, min_bounds[i], max_bounds[i])
+            if repair_mode in BUILT_IN_REPAIR_MODES:
+                if min_limits[i] <= phene <= max_limits[i] and not math.isinf(phene):
+                    continue
+                if repair_mode is BoundConstraintError:
+                    if phene < min_limits[i] or phene > max_limits[i]:
+                        raise BoundConstraintError(phene, self.min_bounds[i], self.max_bounds[i], variable_name="x"+str(i))
+                    continue
+            phenome[i] = repair_mode(phene, self.min_bounds[i], self.max_bounds[i])
         return phenome
 
 
+    def vectorized(self, phenomes, in_place=False):
+        """Repair all rows of an (n, d) array.
+
+        Parameters
+        ----------
+        phenomes : array_like
+            One phenome per row.
+        in_place : bool, optional
+            If True, `phenomes` must be a float array, which receives the
+            result. Otherwise, the input is not modified.
+
+        Returns
+        -------
+        phenomes : numpy.ndarray
+            The repaired phenomes.
+
+        """
+        buffer = phenomes
+        if self.previous_preprocessor is not None:
+            phenomes = vectorize(self.previous_preprocessor)(phenomes)
+        if in_place:
+            assert isinstance(buffer, np.ndarray) and buffer.dtype == np.float64
+            if phenomes is not buffer:
+                buffer[...] = phenomes
+            phenomes = buffer
+        else:
+            phenomes = np.array(phenomes, dtype=float)
+        assert phenomes.ndim == 2 and phenomes.shape[1] == len(self.min_bounds)
+        for repair_mode, columns, min_bounds, max_bounds in self.repair_groups:
+            if repair_mode is BoundConstraintError:
+                violation = find_bound_violation(phenomes[:, columns], min_bounds, max_bounds)
+                if violation is not None:
+                    row, j = violation
+                    i = np.arange(phenomes.shape[1])[columns][j]
+                    raise BoundConstraintError(phenomes[row, i], self.min_bounds[i], self.max_bounds[i], variable_name="x"+str(i))
+                continue
+            vectorized_repair = getattr(repair_mode, "vectorized", None)
+            if isinstance(columns, slice):
+                values = phenomes
+            else:
+                values = phenomes[:, columns]
+            if vectorized_repair is not None:
+                values = vectorized_repair(values, min_bounds, max_bounds)
+            else:
+                original_columns = np.arange(phenomes.shape[1])[columns]
+                for j, i in enumerate(original_columns):
+                    min_bound = self.min_bounds[i]
+                    max_bound = self.max_bounds[i]
+                    for row in range(len(values)):
+                        values[row, j] = repair_mode(float(values[row, j]), min_bound, max_bound)
+            if values is not phenomes:
+                phenomes[:, columns] = values
+        return phenomes
+
+
 
 class TestProblem(Problem):
     """Abstract base class for artificial test problems."""
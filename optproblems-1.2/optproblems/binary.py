@@ -7,7 +7,9 @@ Common binary test problems.
 
 import random
 
-from optproblems.base import TestProblem, Individual
+import numpy as np
+
+from optproblems.base import TestProblem, Individual, vectorize
 
 
 def hamming_dist(bitstring1, bitstring2):
@@ -80,6 +82,18 @@ class BinaryChecker:
         return phenome
 
 
+    def vectorized(self, phenomes):
+        """Check all rows of an (n, d) array at once."""
+        if self.previous_preprocessor is not None:
+            phenomes = vectorize(self.previous_preprocessor)(phenomes)
+        phenomes = np.asarray(phenomes)
+        assert phenomes.ndim == 2
+        if self.num_variables is not None:
+            assert phenomes.shape[1] == self.num_variables
+        assert np.all((phenomes == 0) | (phenomes == 1))
+        return phenomes
+
+
 
 class OneMax(TestProblem):
     """The most simple binary optimization problem."""
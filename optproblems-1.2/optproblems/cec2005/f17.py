@@ -1,6 +1,8 @@
 
 import random
 
+import numpy as np
+
 from optproblems.cec2005.f16 import F16
 
 
@@ -19,4 +21,11 @@ class F17(F16):
         return obj_value + self.bias
 
 
+    def vectorized_objective_function(self, phenomes):
+        obj_values = F16.vectorized_objective_function(self, phenomes) - self.bias
+        noise = np.array([random.gauss(0.0, 1.0) for _ in range(len(obj_values))])
+        obj_values *= (1.0 + 0.2 * noise)
+        return obj_values + self.bias
+
+
 
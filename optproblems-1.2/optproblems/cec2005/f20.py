@@ -1,17 +1,9 @@
 
 from optproblems.cec2005.f18 import F18
+from optproblems.cec2005.helper import PackagedData
 
 
 class F20(F18):
     """Rotated hybrid composition function F18 with global optimum on bounds."""
 
-    offsets = [[1.5953, 5.0, 1.8047, 5.0, -3.0486, 5.0, 3.5582, 5.0, -0.3767, 5.0, 4.4793, 5.0, -1.5149, 5.0, 3.008, 5.0, 2.7314, 5.0, -3.9423, 5.0, -0.1481, 5.0, 2.8357, 5.0, -2.6808, 5.0, -2.6297, 5.0, -1.3002, 5.0, 1.9387, 5.0, 0.6687, 5.0, -1.5665, 5.0, -3.8233, 5.0, -3.5785, 5.0, -2.6055, 5.0, 3.3571, 5.0, -1.1528, 5.0, -4.0471, 5.0, 0.9251, 5.0, 1.4861, 5.0, 3.0545, 5.0, -3.6943, 5.0, 0.6094, 5.0, 0.5744, 5.0, 0.4908, 5.0, 1.8709, 5.0, -0.26, 5.0, -0.1701, 5.0, -1.5888, 5.0, 1.3802, 5.0, 0.5727, 5.0, 2.2799, 5.0, 3.9601, 5.0, 2.5688, 5.0, -1.2435, 5.0, -2.4123, 5.0, 0.574, 5.0, 0.0113, 5.0, -1.3399, 5.0, 2.5203, 5.0, -4.498, 5.0, -0.1648, 5.0, -2.4704, 5.0, -2.7025, 5.0],
-               [-0.4694, -0.9504, 4.423, -4.3429, 4.1355, -2.1496, 1.359, 1.6644, -0.4942, -0.3133, 2.8969, 3.5529, 4.3648, 1.6676, 4.3873, 1.2013, -3.3488, 1.9179, -3.0347, -3.1162, 0.6953, 1.1995, 4.078, 2.9136, -3.977, 1.4906, 4.1008, -4.4356, 4.1101, 0.2507, 1.8725, -0.1733, -3.125, -0.8586, -3.3198, 3.9131, -0.857, 3.7669, 3.4829, 3.6658, -0.7697, -3.5814, -4.1172, 2.9127, -4.4485, 3.4213, 2.3902, 2.0265, -2.7435, 2.1096, -1.2642, -2.6251, -1.6156, 0.2497, -0.952, 1.8805, 0.5874, 0.074, -3.2857, -2.069, 3.9455, -3.488, -1.9532, 0.7981, -2.3774, 1.5821, 1.0687, 2.8757, 2.4418, 3.8749, -1.8744, -0.2689, -2.4202, -1.0933, 2.4775, 3.4062, 3.8519, 0.2697, 4.057, -3.4813, 1.364, 0.9791, 0.3786, 1.0357, -2.8149, 3.7426, 1.5305, 2.2033, -0.2552, -0.4773, 2.8402, -3.9985, 2.9175, 2.657, 1.9482, -2.5473, -2.778, 3.083, -1.0791, 4.1557],
-               [1.5059, 1.4645, -3.019, 2.4182, -0.3464, 4.1054, -1.3402, -3.0782, -2.609, 3.1952, 2.6404, 3.4108, 1.5007, 3.3836, -2.93, -4.4413, -4.0264, -0.3244, -2.068, -3.9792, 0.3351, -4.4986, -3.3008, -3.1732, 1.5274, 2.7197, -3.8414, -0.089, 2.0098, -1.3819, -0.3714, 1.1506, 4.4092, -2.5041, 1.8166, 1.9411, -1.5877, -0.7389, -3.2214, 0.988, 3.0597, 2.035, 1.1269, 2.2449, 1.6163, 2.9061, -2.927, -1.8663, -2.3012, -3.054, -2.8475, -0.3154, 2.0189, 3.5799, 2.5004, 2.1726, -2.3015, 0.0365, -1.9528, -4.0525, 3.8383, -4.2818, -2.9702, -2.818, 0.3275, -4.1971, 3.5293, -2.3649, 3.6285, -3.3654, -3.6385, -1.7819, -3.4012, -0.8381, -2.1338, -1.0608, -0.6099, -1.3864, -3.0536, -3.8265, -3.6656, -3.4714, 0.3118, 1.9456, 3.2694, -1.5046, 0.5896, 0.1711, -1.8727, -2.304, -4.1229, 1.0773, 2.6329, -3.4434, -2.9708, 3.8591, -1.9641, 2.1665, 2.4181, -1.6451],
-               [2.8727, -0.8312, -4.1507, -4.3428, -4.2097, -3.95, -3.7506, -3.1893, 3.4647, 0.4615, 1.581, -0.4376, 1.5074, 0.8747, 0.3915, -0.5341, -0.953, 1.1543, -4.0131, -2.871, -3.3812, 1.8587, 2.6131, -3.4436, -1.8011, 1.7809, 3.7035, 1.065, 2.2193, -1.4669, -0.1322, -0.4288, 3.1035, 1.2798, 0.8398, -2.8744, -4.4, 1.2042, -0.3312, 1.0092, -1.2502, -3.5151, 1.8168, -0.3298, 3.4255, 2.6113, -0.4725, 0.0535, -2.5668, 2.7233, -0.1867, -3.8712, -2.1966, 2.8308, -2.6592, -1.8225, 3.2404, -0.3647, -2.6874, -3.7407, 4.0805, 3.245, -4.169, -2.7157, 0.4695, -2.9804, 2.2225, -1.5141, 0.0602, -3.7222, 0.7063, -3.5451, 1.3085, -0.7206, -0.2193, 0.9755, -0.0105, -2.8736, 3.4371, -4.3517, -3.3811, -0.9701, 1.3177, 0.5757, 2.9334, 2.5125, -0.3391, 0.3051, -0.7175, -1.314, 2.9475, -3.483, -0.9436, -1.4855, -0.2893, -0.8183, 1.7258, -3.0167, -0.1103, 3.1678],
-               [4.4658, -3.9845, -0.3494, 0.2917, -4.2515, 2.354, -3.4443, -4.4291, -2.4516, 0.8209, 1.4629, -1.6978, -4.2535, 1.9427, 0.7308, 4.084, -2.7881, 3.941, -3.1722, 0.39, 2.8115, 0.9652, -2.7972, 0.7904, 3.4347, -3.3543, 1.2593, -0.8484, 3.7855, -1.2499, -4.4726, -4.1715, -1.9464, -4.2946, 0.0137, 1.8651, 1.3919, 1.3469, 0.077, -4.2427, 2.0416, -2.2337, 3.1337, 0.7874, 3.4143, -2.8692, 1.208, -2.1867, -3.3004, -3.3325, -1.7701, -2.1764, 1.959, -1.5053, -3.2669, -0.6987, 0.2366, -3.654, -0.3136, -0.5393, -2.839, 0.0449, 3.7872, -1.492, 3.4913, -2.5888, 4.0587, -1.4555, -0.856, -1.9638, 4.2491, -3.7508, 3.3998, 3.9581, -0.3211, -3.1923, -2.3639, 3.2155, -1.1436, 0.0863, -1.8019, 4.0851, 4.0134, 3.292, -4.1672, -2.8533, -1.5603, -1.7606, -1.7146, -3.1181, 3.9641, 0.2457, -0.8076, 4.3399, -2.8689, 3.5696, 2.2266, -0.6762, -2.1257, -3.0045],
-               [-3.6435, -2.0476, -1.2299, -3.4435, 4.4239, -2.2258, 0.6129, -2.9539, 0.0023, -2.2894, 1.9921, -3.7181, 3.2795, 0.8902, -1.5611, -0.6445, 0.6171, -3.1832, -0.9539, 1.5753, 2.8997, -2.9514, 1.5675, 4.2907, 4.1501, 0.2397, -3.4251, 2.3066, 3.1111, -4.4475, 2.9233, 4.2417, 2.5346, -0.8434, 2.6903, 1.2803, 3.7653, -2.0836, -2.6593, -2.3126, 4.0565, 0.2353, 1.7158, -1.7222, 3.1438, -1.2706, -1.7882, 0.6263, -0.8204, 2.415, 4.1012, 2.4257, -0.0525, 0.2929, 3.4564, -4.1724, 3.9334, -4.1287, 3.856, 3.2555, 0.3465, -1.9134, -1.978, -2.415, -3.1939, -4.4729, -1.8994, -0.1777, -1.7676, 3.8711, 2.4538, -2.4724, -0.9937, 3.0893, -0.1302, -1.9, 2.0793, -0.741, -2.9585, -4.473, -0.7422, 1.2235, -4.2093, 3.1633, -0.9721, 1.4358, -3.8565, 1.4121, 2.457, -2.6026, 3.6255, -3.3658, 4.0111, 0.0963, 3.6452, 2.2841, 0.7774, -3.0156, -2.8912, 3.1835],
-               [-1.1745, 3.0297, 2.8241, -0.1778, 3.3345, -2.8002, 2.9149, 1.281, -2.2089, -1.3471, -1.9499, 0.6569, -1.9806, -2.319, 3.287, 3.702, -3.8655, -2.7791, 2.4153, -2.8463, -0.3631, -0.5981, -0.924, 2.8715, 3.502, -4.2941, -1.1615, 0.9879, 0.4369, 0.0763, 0.6576, 0.6311, -4.3961, 4.3963, 1.3707, -0.0266, 1.9707, -1.2409, -1.9082, -2.1188, 1.3977, 2.0461, -0.6695, 1.1433, 3.6783, -1.1106, 3.2087, -1.1471, -1.4124, 0.5772, 2.8861, 0.9213, 1.4773, 1.0597, -2.0235, 0.7462, -3.5674, 1.611, -4.2773, -4.2037, -2.9796, 0.8997, -4.4701, 2.652, 4.4957, 1.3634, -0.5745, -0.9522, -2.4138, 0.6266, 1.967, -2.7401, -2.7359, -1.8662, -0.7621, -2.0829, -1.2188, -4.4287, -1.7063, 2.8928, -1.1988, 1.4114, -1.0523, -2.8782, 1.7692, -0.3978, -4.174, 1.0188, 3.2339, 3.2872, -1.0091, -0.3623, 3.9882, -2.0295, 3.2559, -0.0226, 1.9173, 0.6989, 3.0538, -1.4615],
-               [0.1917, 1.5042, 3.9221, 4.3594, -1.8238, -3.6437, -0.324, -3.7165, -1.2099, 0.7948, 1.1181, 4.0311, 0.9166, 4.1516, -1.8571, -3.0236, -0.0184, -1.4155, -0.0369, 1.8959, 3.8687, 0.0725, 1.012, 1.6473, 3.1023, 2.1231, -1.3169, -1.5877, -0.5051, -1.597, 2.5903, 4.1357, 2.9418, -3.534, 4.1269, -0.1585, -2.9321, 4.4927, -2.0294, -1.3496, -3.6786, 1.7717, -1.761, 2.5642, 3.7443, -2.6462, -4.194, 1.7037, 0.1554, 3.0101, -2.6164, 1.6023, 2.2117, 1.3432, -4.1605, -1.7008, 3.0109, 1.6287, -0.7228, -2.8939, 1.6288, 1.6823, 1.6935, -2.056, -2.2421, 1.8703, 4.4554, -1.9358, -4.2634, 2.1077, -1.7835, -3.9426, -2.268, -1.9449, 4.4574, 0.5201, 2.1527, 4.4191, 2.263, 0.5296, -3.9116, 0.1973, -1.0577, -3.1378, 3.9344, -3.0929, -1.3338, -1.9536, -4.0336, -1.0727, 2.0414, 3.8963, 2.0828, 2.9286, 1.0216, -3.119, -0.6571, 3.4339, 0.1909, 3.0014],
-               [3.3343, -0.873, 1.3635, 4.2597, 2.5769, 0.8656, -0.3686, -3.9734, 4.2913, 2.7508, -4.0107, -3.5053, -0.4895, -1.3107, -0.9999, -2.6812, -0.7117, -0.405, 0.7137, -4.238, -4.2863, -2.9899, 1.7945, -1.698, -2.4834, 0.8753, 2.6363, 1.8389, 4.4227, 3.1564, -2.4925, 0.1185, 3.7033, 3.7941, 1.5931, -0.3381, -0.7565, -4.2494, 0.2984, -1.6731, 3.1468, 3.7846, -0.3273, -1.2854, -0.9828, -1.9557, -0.4683, 0.1099, 3.8553, 4.285, 3.4984, 3.9925, -2.9157, 0.7524, 0.1578, 0.5946, -0.1152, 1.7587, -4.2671, -2.5506, 2.2974, 1.191, 1.2025, 1.462, 2.9187, 3.247, 0.7028, 4.2204, -0.4681, 0.9897, -3.3918, 1.3758, 4.1709, 0.9767, -3.7773, 3.8934, 0.9309, 1.9174, -1.8683, -1.6969, -3.1156, -2.2597, -4.2807, 2.3251, -0.3963, -3.9255, -4.0755, -1.8718, -0.9349, -0.4783, -0.1861, 1.331, 3.6992, -0.0393, 3.2312, -3.9977, -1.389, 0.1224, 2.2305, 4.0094],
-               [0.0] * 100]
+    offsets = PackagedData("f20_offsets")
@@ -1,6 +1,6 @@
 
 from optproblems.cec2005.f21 import F21
-from optproblems.cec2005.helper import my_x_round
+from optproblems.cec2005.helper import my_x_round, vectorized_my_x_round
 
 
 class F23(F21):
@@ -10,3 +10,9 @@ class F23(F21):
         phenome = [my_x_round(phene, offset) for phene, offset in zip(phenome, self.offsets[0])]
         assert len(phenome) == self.num_variables
         return self.hybrid_composition_function(phenome) + self.bias
+
+
+    def vectorized_objective_function(self, phenomes):
+        offsets = self.offsets[0][:self.num_variables]
+        phenomes = vectorized_my_x_round(phenomes, offsets)
+        return self.hybrid_composition_function.vectorized(phenomes) + self.bias
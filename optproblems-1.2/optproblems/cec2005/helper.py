@@ -1,14 +1,105 @@
 
 import math
+import os
 import random
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
 import numpy as np
 
-from optproblems.continuous import sphere, schaffer6
+from optproblems.base import vectorize
+from optproblems.continuous import sphere, schaffer6, vectorized_sphere
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+_loaded_data = dict()
+
+
+
+def load_data(name):
+    """Return the packaged array with the given name.
+
+    The arrays are stored as .npy files in :data:`DATA_DIR`. They are
+    memory-mapped read-only on first request and shared by all callers
+    afterwards, so only the pages that are actually touched are read from
+    disk.
+
+    """
+    try:
+        return _loaded_data[name]
+    except KeyError:
+        path = os.path.join(DATA_DIR, name + ".npy")
+        array = np.load(path, mmap_mode="r")
+        _loaded_data[name] = array
+        return array
+
+
+
+class PackagedData(object):
+    """A class attribute that is loaded from the data directory on access.
+
+    This keeps the large rotation matrices and offset vectors of the test
+    suite out of the module source, so that importing a problem does not
+    require to parse and build all of them.
+
+    """
+    def __init__(self, name):
+        self.name = name
+
+
+    def __get__(self, instance, owner):
+        return load_data(self.name)
+
+
+
+class DimensionTable(Mapping):
+    """Read-only mapping from the number of variables to a packaged array.
+
+    Parameters
+    ----------
+    problem : object
+        The object holding the data attributes.
+    template : str
+        The attribute name, containing a placeholder for the dimension,
+        e.g. "matrix{}D".
+    dimensions : sequence of int, optional
+        The available dimensions.
+
+    """
+    def __init__(self, problem, template, dimensions=(2, 10, 30, 50)):
+        self.problem = problem
+        self.template = template
+        self.dimensions = tuple(dimensions)
+
+
+    def __getitem__(self, num_variables):
+        if num_variables not in self.dimensions:
+            raise KeyError(num_variables)
+        return getattr(self.problem, self.template.format(num_variables))
+
+
+    def __iter__(self):
+        return iter(self.dimensions)
+
+
+    def __len__(self):
+        return len(self.dimensions)
 
 
 class HybridCompositionFunction:
+    """A weighted combination of shifted, scaled, and rotated basic functions.
+
+    The offsets and rotation matrices of all basic functions are stacked
+    into an array of shape (k, n) and a tensor of shape (k, n, n),
+    respectively. Shifting, weighting, and scaling are thus carried out for
+    all basic functions at once, and each rotation is a single matrix
+    product for the whole population.
 
+    """
     def __init__(self, num_variables, basic_functions, matrices, sigmas, lambdas, biases, offsets, c, name=None):
         self.num_variables = num_variables
         self.basic_functions = basic_functions
@@ -26,6 +117,9 @@ class HybridCompositionFunction:
         assert len(sigmas) == len(lambdas)
         assert len(lambdas) == len(biases)
         assert len(biases) == len(offsets)
+        # stacked representation
+        self.offset_matrix = np.array([offset[:num_variables] for offset in offsets], dtype=float)
+        self.matrix_tensor = np.array(matrices, dtype=float)
         # calculate/estimate the f_max for all the functions involved
         self.f_max = []
         for i, basic_function in enumerate(basic_functions):
@@ -35,44 +129,35 @@ class HybridCompositionFunction:
 
 
     def __call__(self, phenome):
-        # shortcuts
+        phenome = np.asarray(phenome, dtype=float)
+        return float(self.vectorized(phenome[np.newaxis, :])[0])
+
+
+    def vectorized(self, phenomes):
+        """Evaluate the function for a matrix with one phenome per row."""
+        phenomes = np.asarray(phenomes, dtype=float)
         num_variables = self.num_variables
-        sigmas = self.sigmas
-        lambdas = self.lambdas
-        basic_functions = self.basic_functions
-        matrices = self.matrices
-        f_max = self.f_max
-        biases = self.biases
+        sigmas = np.asarray(self.sigmas, dtype=float)
+        lambdas = np.asarray(self.lambdas, dtype=float)
+        # z has the shape (num_phenomes, num_functions, num_variables)
+        z = phenomes[:, np.newaxis, :] - self.offset_matrix
         # get the raw weights
-        w_max = float("-inf")
-        z = []
-        weights = []
-        for i in range(len(basic_functions)):
-            z.append(np.array([phene - offset for offset, phene in zip(self.offsets[i], phenome)]))
-            sum_of_squares = 0.0
-            for j in range(num_variables):
-                sum_of_squares += z[i][j] ** 2
-            weight = math.exp(-1.0 * sum_of_squares / (2.0 * num_variables * sigmas[i] ** 2))
-            weights.append(weight)
-            if w_max < weights[i]:
-                w_max = weights[i]
+        sums_of_squares = np.einsum("ijk,ijk->ij", z, z)
+        weights = np.exp(-1.0 * sums_of_squares / (2.0 * num_variables * sigmas ** 2))
+        w_max = np.max(weights, axis=1, keepdims=True)
         # modify the weights
-        w1m_max_pow = 1.0 - math.pow(w_max, 10.0)
-        for i in range(len(basic_functions)):
-            if weights[i] != w_max:
-                weights[i] *= w1m_max_pow
+        weights = np.where(weights != w_max, weights * (1.0 - w_max ** 10.0), weights)
         # normalize the weights
-        weight_sum = sum(weights)
-        for i in range(len(basic_functions)):
-            weights[i] /= weight_sum
-        # calculate objective value
-        sum_f = 0.0
-        for i, basic_function in enumerate(basic_functions):
-            for j in range(num_variables):
-                z[i][j] /= lambdas[i]
-            z[i] = np.dot(z[i], matrices[i])
-            sum_f += weights[i] * (self.c * basic_function(z[i]) / f_max[i] + biases[i])
-        return sum_f
+        weights /= np.sum(weights, axis=1, keepdims=True)
+        # scale, rotate, and calculate objective values
+        z /= lambdas[:, np.newaxis]
+        matrix_tensor = self.matrix_tensor
+        values = np.empty_like(weights)
+        for i, basic_function in enumerate(self.basic_functions):
+            rotated = np.dot(z[:, i, :], matrix_tensor[i])
+            values[:, i] = vectorize(basic_function)(rotated)
+        values = self.c * values / self.f_max + self.biases
+        return np.sum(weights * values, axis=1)
 
 
 
@@ -90,6 +175,14 @@ def my_x_round(x, offset=0.0):
 
 
 
+def vectorized_my_x_round(values, offset=0.0):
+    """Element-wise version of :func:`my_x_round` for arrays."""
+    values = np.asarray(values, dtype=float)
+    rounded = np.copysign(np.floor(np.abs(2.0 * values) + 0.5), values) / 2.0
+    return np.where(np.abs(values - offset) < 0.5, values, rounded)
+
+
+
 def generalized_schaffer6(phenome):
     """A generalization of Schaffer's function 6 for arbitrary dimensions."""
     result = sum(schaffer6(phenome[i-1:i+1]) for i in range(1, len(phenome)))
@@ -98,7 +191,31 @@ def generalized_schaffer6(phenome):
 
 
 
+def vectorized_generalized_schaffer6(phenomes):
+    """The generalized Schaffer function 6 for a matrix of phenomes."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    sums_of_squares = phenomes ** 2 + np.roll(phenomes, -1, axis=1) ** 2
+    result = np.sin(np.sqrt(sums_of_squares)) ** 2 - 0.5
+    result /= (1.0 + 0.001 * sums_of_squares) ** 2
+    result += 0.5
+    return np.sum(result, axis=1)
+
+
+generalized_schaffer6.vectorized = vectorized_generalized_schaffer6
+
+
+
 def noisy_sphere(phenome):
     return sphere(phenome) * (1.0 + 0.1 * abs(random.gauss(0.0, 1.0)))
 
 
+
+def vectorized_noisy_sphere(phenomes):
+    """The noisy sphere function for a matrix of phenomes."""
+    noise = np.array([abs(random.gauss(0.0, 1.0)) for _ in range(len(phenomes))])
+    return vectorized_sphere(phenomes) * (1.0 + 0.1 * noise)
+
+
+noisy_sphere.vectorized = vectorized_noisy_sphere
+
+
@@ -8,8 +8,10 @@ import math
 import random
 import itertools
 
+import numpy as np
+
 from optproblems.base import TestProblem, BoundConstraintsChecker
-from optproblems.base import Individual
+from optproblems.base import Individual, vectorize
 
 
 TWO_PI = 2.0 * math.pi
@@ -62,6 +64,27 @@ class SequenceChecker:
         return phenome
 
 
+    def vectorized(self, phenomes):
+        """Check all rows of an (n, d) array at once.
+
+        For arrays with a numerical data type, the type check is carried
+        out once for the scalar type of the array.
+
+        """
+        if self.previous_preprocessor is not None:
+            phenomes = vectorize(self.previous_preprocessor)(phenomes)
+        phenomes = np.asarray(phenomes)
+        assert phenomes.ndim == 2 and phenomes.shape[1] == self.num_variables
+        data_type = self.data_type
+        if data_type is not None:
+            if phenomes.dtype == object:
+                for phene in phenomes.flat:
+                    assert isinstance(phene, data_type)
+            elif phenomes.size > 0:
+                assert isinstance(phenomes.flat[0], data_type)
+        return phenomes
+
+
 
 class Shekel(TestProblem):
     """Shekel's family of test problems.
@@ -144,6 +167,13 @@ class Shekel(TestProblem):
         return ret
 
 
+    def vectorized_objective_function(self, phenomes):
+        phenomes = np.asarray(phenomes, dtype=float)
+        a = np.array(self.a)
+        sums_of_squares = np.sum((phenomes[:, np.newaxis, :] - a) ** 2, axis=2)
+        return -np.sum(1.0 / (sums_of_squares + self.c), axis=1)
+
+
     def get_optimal_solutions(self, max_number=None):
         """Return the global optimum."""
         local_optima = self.get_locally_optimal_solutions()
@@ -273,6 +303,14 @@ class Hartman3(TestProblem):
         return ret
 
 
+    def vectorized_objective_function(self, phenomes):
+        phenomes = np.asarray(phenomes, dtype=float)
+        a = np.array(self.a)
+        p = np.array(self.p)
+        temp_sums = np.sum(a * (phenomes[:, np.newaxis, :] - p) ** 2, axis=2)
+        return -np.sum(self.c * np.exp(-temp_sums), axis=1)
+
+
     def get_optimal_solutions(self, max_number=None):
         """Return the global optimum."""
         local_optima = self.get_locally_optimal_solutions()
@@ -386,6 +424,14 @@ class Hartman6(TestProblem):
         return ret
 
 
+    def vectorized_objective_function(self, phenomes):
+        phenomes = np.asarray(phenomes, dtype=float)
+        a = np.array(self.a)
+        p = np.array(self.p)
+        temp_sums = np.sum(a * (phenomes[:, np.newaxis, :] - p) ** 2, axis=2)
+        return -np.sum(self.c * np.exp(-temp_sums), axis=1)
+
+
     def get_optimal_solutions(self, max_number=None):
         """Return the global optimum."""
         local_optima = self.get_locally_optimal_solutions()
@@ -439,6 +485,23 @@ def branin(phenome):
 
 
 
+def vectorized_branin(phenomes):
+    """The Branin function for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    x = phenomes[:, 0]
+    y = phenomes[:, 1]
+    b = 5.1 / (4.0 * math.pi * math.pi)
+    c = 5.0 / math.pi
+    f = 1.0 / (8.0 * math.pi)
+    ret = (y - b * x ** 2 + c * x - 6.0) ** 2
+    ret += 10.0 * (1.0 - f) * np.cos(x) + 10.0
+    return ret
+
+
+branin.vectorized = vectorized_branin
+
+
+
 class Branin(TestProblem):
     """Branin's test problem 'RCOS'.
 
@@ -511,6 +574,16 @@ def goldstein_price(phenome):
 
 
 
+def vectorized_goldstein_price(phenomes):
+    """The Goldstein-Price function for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    return goldstein_price(phenomes.T)
+
+
+goldstein_price.vectorized = vectorized_goldstein_price
+
+
+
 class GoldsteinPrice(TestProblem):
     """A test problem by Goldstein and Price.
 
@@ -625,6 +698,23 @@ def ackley(phenome):
 
 
 
+def vectorized_ackley(phenomes):
+    """The Ackley function for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    num_variables = phenomes.shape[1]
+    a = 20.0
+    b = 0.2
+    sum1 = np.sum(phenomes ** 2, axis=1)
+    sum2 = np.sum(np.cos(TWO_PI * phenomes), axis=1)
+    value = -a * np.exp(-b * np.sqrt(1.0 / num_variables * sum1))
+    value += -np.exp(1.0 / num_variables * sum2) + a + math.e
+    return value
+
+
+ackley.vectorized = vectorized_ackley
+
+
+
 class Ackley(TestProblem):
     """Ackley's test problem.
 
@@ -659,6 +749,16 @@ def double_sum(phenome):
 
 
 
+def vectorized_double_sum(phenomes):
+    """Schwefel's problem 1.2 for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    return np.sum(np.cumsum(phenomes, axis=1) ** 2, axis=1)
+
+
+double_sum.vectorized = vectorized_double_sum
+
+
+
 class DoubleSum(TestProblem):
     """Schwefel's double-sum problem."""
 
@@ -699,6 +799,14 @@ class EllipsoidFunction:
         return result
 
 
+    def vectorized(self, phenomes):
+        """Evaluate the function for a matrix with one phenome per row."""
+        phenomes = np.asarray(phenomes, dtype=float)
+        num_variables = phenomes.shape[1]
+        exponents = np.arange(num_variables) / float(num_variables - 1)
+        return np.sum(self.a ** exponents * phenomes ** 2, axis=1)
+
+
 
 class Ellipsoid(TestProblem):
     """A configurable ellipsoidal test problem.
@@ -828,6 +936,15 @@ class FletcherPowell(TestProblem):
         return ret
 
 
+    def vectorized_objective_function(self, phenomes):
+        phenomes = np.asarray(phenomes, dtype=float)
+        num_variables = self.num_variables
+        a = np.array(self.a)[:num_variables, :num_variables]
+        b = np.array(self.b)[:num_variables, :num_variables]
+        lhs = np.dot(np.sin(phenomes), a.T) + np.dot(np.cos(phenomes), b.T)
+        return np.sum((np.array(self.e) - lhs) ** 2, axis=1)
+
+
 
 def griewank(phenome):
     """The bare-bones Griewank function."""
@@ -840,6 +957,19 @@ def griewank(phenome):
 
 
 
+def vectorized_griewank(phenomes):
+    """The Griewank function for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    ssum = np.sum(phenomes ** 2 / 4000.0, axis=1)
+    divisors = np.sqrt(np.arange(1.0, phenomes.shape[1] + 1.0))
+    product = np.prod(np.cos(phenomes / divisors), axis=1)
+    return ssum - product + 1.0
+
+
+griewank.vectorized = vectorized_griewank
+
+
+
 class Griewank(TestProblem):
     """Griewank's test problem.
 
@@ -872,6 +1002,16 @@ def himmelblau(phenome):
 
 
 
+def vectorized_himmelblau(phenomes):
+    """The Himmelblau function for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    return himmelblau(phenomes.T)
+
+
+himmelblau.vectorized = vectorized_himmelblau
+
+
+
 class Himmelblau(TestProblem):
     """Himmelblau's test problem.
 
@@ -1005,6 +1145,14 @@ class LunacekTwoSpheres(TestProblem):
         return min(value1, value2)
 
 
+    def vectorized_objective_function(self, phenomes):
+        phenomes = np.asarray(phenomes, dtype=float)
+        values1 = vectorized_sphere(phenomes - self.offset1)
+        values2 = vectorized_sphere(phenomes - self.offset2)
+        values2 = self.depth * self.num_variables + self.size * values2
+        return np.minimum(values1, values2)
+
+
     def get_optimal_solutions(self, max_number=None):
         """Return the global optimum."""
         optima = []
@@ -1094,6 +1242,16 @@ class LunacekTwoRastrigins(LunacekTwoSpheres):
         return sphere_obj_value + rastrigin_part
 
 
+    def vectorized_objective_function(self, phenomes):
+        phenomes = np.asarray(phenomes, dtype=float)
+        a = self.a
+        sphere_obj_values = LunacekTwoSpheres.vectorized_objective_function(self, phenomes)
+        shifted1 = phenomes - self.offset1
+        rastrigin_part = a * shifted1.shape[1]
+        rastrigin_part -= a * np.sum(np.cos(self.omega * shifted1), axis=1)
+        return sphere_obj_values + rastrigin_part
+
+
     def get_locally_optimal_solutions(self, max_number=None):
         raise NotImplementedError("Locally optimal solutions are unknown.")
 
@@ -1128,6 +1286,15 @@ class ModifiedRastriginFunction:
         return ret
 
 
+    def vectorized(self, phenomes):
+        """Evaluate the function for a matrix with one phenome per row."""
+        phenomes = np.asarray(phenomes, dtype=float)
+        omegas = np.array(self.omegas)
+        k_values = np.array(self.k_values)
+        summands = 10.0 * np.cos(omegas * phenomes) + 2.0 * k_values * phenomes ** 2
+        return 10.0 * self.num_variables + np.sum(summands, axis=1)
+
+
 
 class ModifiedRastrigin(TestProblem):
     """A test problem similar to the Rastrigin problem.
@@ -1291,6 +1458,14 @@ class RastriginFunction:
         return ret
 
 
+    def vectorized(self, phenomes):
+        """Evaluate the function for a matrix with one phenome per row."""
+        phenomes = np.asarray(phenomes, dtype=float)
+        a = self.a
+        summands = phenomes ** 2 - a * np.cos(self.omega * phenomes)
+        return a * phenomes.shape[1] + np.sum(summands, axis=1)
+
+
 
 class Rastrigin(TestProblem):
     """A configurable Rastrigin test problem.
@@ -1330,6 +1505,18 @@ def rosenbrock(phenome):
 
 
 
+def vectorized_rosenbrock(phenomes):
+    """The Rosenbrock function for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    x = phenomes[:, :-1]
+    summands = 100.0 * (x ** 2 - phenomes[:, 1:]) ** 2 + (x - 1.0) ** 2
+    return np.sum(summands, axis=1)
+
+
+rosenbrock.vectorized = vectorized_rosenbrock
+
+
+
 class Rosenbrock(TestProblem):
     """Rosenbrock's test problem.
 
@@ -1363,6 +1550,20 @@ def schaffer6(phenome):
 
 
 
+def vectorized_schaffer6(phenomes):
+    """Schaffer's function 6 for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    sums_of_squares = phenomes[:, 0] ** 2 + phenomes[:, 1] ** 2
+    result = np.sin(np.sqrt(sums_of_squares)) ** 2 - 0.5
+    result /= (1.0 + 0.001 * sums_of_squares) ** 2
+    result += 0.5
+    return result
+
+
+schaffer6.vectorized = vectorized_schaffer6
+
+
+
 class Schaffer6(TestProblem):
     """Schaffer's test problem 6.
 
@@ -1430,6 +1631,19 @@ def schaffer7(phenome):
 
 
 
+def vectorized_schaffer7(phenomes):
+    """Schaffer's function 7 for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    sums_of_squares = phenomes[:, 0] ** 2 + phenomes[:, 1] ** 2
+    result = sums_of_squares ** 0.25
+    result *= np.sin(50.0 * sums_of_squares ** 0.1) ** 2 + 1.0
+    return result
+
+
+schaffer7.vectorized = vectorized_schaffer7
+
+
+
 class Schaffer7(TestProblem):
     """Schaffer's test problem 7.
 
@@ -1491,6 +1705,16 @@ def schwefel(phenome):
 
 
 
+def vectorized_schwefel(phenomes):
+    """The Schwefel function for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    return -np.sum(phenomes * np.sin(np.sqrt(np.abs(phenomes))), axis=1)
+
+
+schwefel.vectorized = vectorized_schwefel
+
+
+
 class Schwefel(TestProblem):
     """Schwefel's test problem.
 
@@ -1615,6 +1839,16 @@ def six_hump_camelback(phenome):
 
 
 
+def vectorized_six_hump_camelback(phenomes):
+    """The six-hump camelback function for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    return six_hump_camelback(phenomes.T)
+
+
+six_hump_camelback.vectorized = vectorized_six_hump_camelback
+
+
+
 class SixHumpCamelback(TestProblem):
     """The so-called six-hump camelback test problem.
 
@@ -1678,6 +1912,16 @@ def sphere(phenome):
 
 
 
+def vectorized_sphere(phenomes):
+    """The sphere function for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    return np.sum(phenomes ** 2, axis=1)
+
+
+sphere.vectorized = vectorized_sphere
+
+
+
 class Sphere(TestProblem):
     """The sphere problem.
 
@@ -1716,6 +1960,16 @@ def vincent(phenome):
 
 
 
+def vectorized_vincent(phenomes):
+    """The Vincent function for a matrix with one phenome per row."""
+    phenomes = np.asarray(phenomes, dtype=float)
+    return -np.sum(np.sin(10.0 * np.log(phenomes)), axis=1) / phenomes.shape[1]
+
+
+vincent.vectorized = vectorized_vincent
+
+
+
 class Vincent(TestProblem):
     """Vincent's test problem.
 
@@ -1813,29 +2067,76 @@ class Vincent(TestProblem):
 
 
 class WeierstrassFunction:
-    """A configurable Weierstrass function."""
+    """A configurable Weierstrass function.
+
+    The coefficients ``a ** k`` and ``2 * pi * b ** k`` for
+    ``k = 0, ..., k_max`` and the constant term, which does not depend on
+    the phenome, are tabulated in the constructor, and again whenever one
+    of the parameters `a`, `b`, and `k_max` is set.
 
+    """
     def __init__(self, a=0.5, b=3.0, k_max=20):
-        self.a = a
-        self.b = b
-        self.k_max = k_max
+        self._a = a
+        self._b = b
+        self._k_max = k_max
+        self.update_tables()
+
+
+    def update_tables(self):
+        """Tabulate the coefficients for the current parameters."""
+        exponents = np.arange(self._k_max + 1)
+        self.amplitudes = np.power(self._a, exponents, dtype=float)
+        self.frequencies = TWO_PI * np.power(self._b, exponents, dtype=float)
+        self.constant_term = np.sum(self.amplitudes * np.cos(self.frequencies * 0.5))
+
+
+    @property
+    def a(self):
+        return self._a
+
+
+    @a.setter
+    def a(self, value):
+        self._a = value
+        self.update_tables()
+
+
+    @property
+    def b(self):
+        return self._b
+
+
+    @b.setter
+    def b(self, value):
+        self._b = value
+        self.update_tables()
+
+
+    @property
+    def k_max(self):
+        return self._k_max
+
+
+    @k_max.setter
+    def k_max(self, value):
+        self._k_max = value
+        self.update_tables()
 
 
     def __call__(self, phenome):
         """Evaluate the function."""
-        n = len(phenome)
-        a = self.a
-        b = self.b
-        k_max = self.k_max
-        sum1 = 0.0
-        cos = math.cos
-        for i in range(n):
-            for k in range(k_max + 1):
-                sum1 += a ** k * cos(TWO_PI * b ** k * (phenome[i] + 0.5))
-        sum2 = 0.0
-        for k in range(k_max + 1):
-            sum2 += a ** k * cos(TWO_PI * b ** k * 0.5)
-        return sum1 - n * sum2
+        phenome = np.asarray(phenome, dtype=float)
+        angles = np.outer(phenome + 0.5, self.frequencies)
+        sum1 = np.sum(np.dot(np.cos(angles), self.amplitudes))
+        return float(sum1 - len(phenome) * self.constant_term)
+
+
+    def vectorized(self, phenomes):
+        """Evaluate the function for a matrix with one phenome per row."""
+        phenomes = np.asarray(phenomes, dtype=float)
+        angles = (phenomes[:, :, np.newaxis] + 0.5) * self.frequencies
+        sum1 = np.sum(np.dot(np.cos(angles), self.amplitudes), axis=1)
+        return sum1 - phenomes.shape[1] * self.constant_term
 
 
 
@@ -0,0 +1,157 @@
+"""
+Repeated runs of optimization algorithms in parallel.
+
+An experiment consists of jobs, each of which runs an algorithm once on a
+freshly created problem instance. The random number generator of every
+job is derived from a :class:`numpy.random.SeedSequence`, so that the
+results do not depend on the number of processes or the order in which
+the jobs are carried out::
+
+    from functools import partial
+    from optproblems.cec2005 import F1, F9
+    from optproblems.algorithms import GeneticAlgorithm
+
+    factories = [partial(cls, 10, max_evaluations=10000) for cls in (F1, F9)]
+    jobs = create_jobs(GeneticAlgorithm, factories, num_runs=30,
+                       num_iterations=200, seed=42, population_size=50)
+    curves = run_experiment(jobs, processes=64)
+
+"""
+import random
+import multiprocessing
+
+import numpy as np
+
+
+class Job(object):
+    """A single run of an algorithm on a problem."""
+
+    def __init__(self, algorithm, problem_factory, seed_sequence, num_iterations,
+                 algorithm_kwargs=None, labels=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        algorithm : class
+            Instantiated as ``algorithm(problem, rng=generator,
+            **algorithm_kwargs)``, the instance must offer a method
+            ``run(num_iterations)`` returning a convergence curve, as the
+            algorithms in :mod:`optproblems.algorithms`.
+        problem_factory : callable
+            Creates the problem without arguments. It must be picklable
+            to be sent to worker processes, e.g., a class or a
+            :func:`functools.partial` object.
+        seed_sequence : numpy.random.SeedSequence
+            The source of all randomness of this job.
+        num_iterations : int
+            The number of iterations of the algorithm.
+        algorithm_kwargs : dict, optional
+            Further arguments for the algorithm.
+        labels : dict, optional
+            Arbitrary information identifying the job.
+
+        """
+        if algorithm_kwargs is None:
+            algorithm_kwargs = dict()
+        if labels is None:
+            labels = dict()
+        self.algorithm = algorithm
+        self.problem_factory = problem_factory
+        self.seed_sequence = seed_sequence
+        self.num_iterations = num_iterations
+        self.algorithm_kwargs = algorithm_kwargs
+        self.labels = labels
+
+
+
+def create_jobs(algorithm, problem_factories, num_runs, num_iterations, seed=None, **algorithm_kwargs):
+    """Create `num_runs` jobs for each problem factory.
+
+    The seed sequence created from `seed` is spawned once per problem
+    factory, and these are spawned once per run. Thus, the seeds of the
+    runs on a problem do not change when other problems are added.
+
+    Returns
+    -------
+    jobs : list of Job
+        The jobs, ordered by problem and run. Their labels contain the
+        indices "problem" and "run".
+
+    """
+    root = np.random.SeedSequence(seed)
+    jobs = []
+    for problem_index, problem_sequence in enumerate(root.spawn(len(problem_factories))):
+        problem_factory = problem_factories[problem_index]
+        for run_index, run_sequence in enumerate(problem_sequence.spawn(num_runs)):
+            labels = {"problem": problem_index, "run": run_index}
+            jobs.append(Job(algorithm, problem_factory, run_sequence, num_iterations,
+                            algorithm_kwargs, labels))
+    return jobs
+
+
+
+def run_job(job):
+    """Carry out a job and return its convergence curve.
+
+    Before the problem is created, the global random number generators
+    of the modules :mod:`random` and :mod:`numpy.random` are seeded from
+    the job's seed sequence, because some problems draw their instances
+    from them.
+
+    """
+    parent = job.seed_sequence
+    # derive the children without spawning, which would change the parent
+    # and thus the outcome of running the same job again
+    problem_sequence, algorithm_sequence = [
+        np.random.SeedSequence(parent.entropy, spawn_key=parent.spawn_key + (i,),
+                               pool_size=parent.pool_size)
+        for i in range(2)]
+    state = problem_sequence.generate_state(1)
+    random.seed(int(state[0]))
+    np.random.seed(state)
+    problem = job.problem_factory()
+    rng = np.random.default_rng(algorithm_sequence)
+    optimizer = job.algorithm(problem, rng=rng, **job.algorithm_kwargs)
+    return np.asarray(optimizer.run(job.num_iterations), dtype=float)
+
+
+
+def run_experiment(jobs, processes=None, pool=None, context=None):
+    """Carry out jobs in parallel and collect their convergence curves.
+
+    Parameters
+    ----------
+    jobs : sequence of Job
+        The jobs to carry out.
+    processes : int, optional
+        The number of worker processes, by default the number of CPUs.
+    pool : multiprocessing.pool.Pool, optional
+        An existing pool to use. If given, `processes` and `context` are
+        ignored. If ``processes == 1`` and no pool is given, the jobs are
+        run in the calling process.
+    context : multiprocessing context, optional
+        The context to create the pool with.
+
+    Returns
+    -------
+    curves : numpy.ndarray
+        An array of shape (len(jobs), n), where row i contains the curve
+        of job i. Curves shorter than the longest one, e.g., because the
+        budget was exhausted, are padded with NaN.
+
+    """
+    if pool is None and processes == 1:
+        curves = [run_job(job) for job in jobs]
+    elif pool is not None:
+        curves = pool.map(run_job, jobs, chunksize=1)
+    else:
+        if context is None:
+            context = multiprocessing
+        with context.Pool(processes) as new_pool:
+            # one job per task for load balancing, jobs are coarse
+            curves = new_pool.map(run_job, jobs, chunksize=1)
+    length = max([len(curve) for curve in curves] + [0])
+    result = np.full((len(curves), length), np.nan)
+    for i, curve in enumerate(curves):
+        result[i, :len(curve)] = curve
+    return result
@@ -0,0 +1,579 @@
+"""
+Helpers for evaluating problems with pools of worker processes.
+
+By default, :func:`Problem.batch_evaluate
+<optproblems.base.Problem.batch_evaluate>` sends the objective function
+to the workers together with every chunk of phenomes. For objective
+functions that are bound methods of large problem instances, this
+serialization can easily cost more than the evaluation itself. A pool
+created with :func:`create_worker_pool` instead receives the objective
+functions once, when the worker processes are started, and the tasks
+only consist of a problem id and a phenome::
+
+    problems = [F16(30), F18(30)]
+    with create_worker_pool(problems, processes=4) as pool:
+        for problem in problems:
+            problem.batch_evaluate(population)
+
+For numerical phenomes, the population can additionally be transported
+through shared memory (see :func:`evaluate_matrix_shared`), so that
+neither phenomes nor objective values are pickled.
+
+Single evaluations can be started asynchronously with
+:func:`Problem.submit <optproblems.base.Problem.submit>`, which relies on
+:func:`submit_task` and works with pools of this module as well as with
+the executors of :mod:`concurrent.futures`.
+
+"""
+import os
+import math
+import time
+import pickle
+import weakref
+import multiprocessing
+import concurrent.futures
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python < 3.8
+    shared_memory = None
+
+
+_worker_functions = dict()
+# the pid of this process and whether it runs its own resource tracker
+_tracker_owner = None
+
+
+
+def initialize_worker(objective_functions, initializer=None, initargs=()):
+    """Pool initializer storing objective functions in the worker process.
+
+    Parameters
+    ----------
+    objective_functions : dict
+        Maps problem ids to pairs of objective function and vectorized
+        objective function.
+    initializer : callable, optional
+        Another initializer to call afterwards.
+    initargs : tuple, optional
+        The arguments for `initializer`.
+
+    """
+    _worker_functions.update(objective_functions)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+
+def evaluate_registered(task):
+    """Evaluate a phenome with an objective function registered in this worker.
+
+    Parameters
+    ----------
+    task : tuple
+        A pair of problem id and phenome.
+
+    """
+    problem_id, phenome = task
+    return _worker_functions[problem_id][0](phenome)
+
+
+
+def evaluate_batch(task):
+    """Evaluate a list of phenomes with an objective function.
+
+    Parameters
+    ----------
+    task : tuple
+        A pair of objective function and list of phenomes.
+
+    """
+    objective_function, phenomes = task
+    return [objective_function(phenome) for phenome in phenomes]
+
+
+
+def evaluate_timed_batch(task):
+    """Evaluate a list of phenomes and measure the time it takes.
+
+    Parameters
+    ----------
+    task : tuple
+        The objective function, or None for a registered one, the
+        problem id, and the list of phenomes.
+
+    Returns
+    -------
+    objective_values : list
+    seconds : float
+        The time spent in the objective function.
+
+    """
+    objective_function, problem_id, phenomes = task
+    if objective_function is None:
+        objective_function = _worker_functions[problem_id][0]
+    start = time.perf_counter()
+    objective_values = [objective_function(phenome) for phenome in phenomes]
+    return objective_values, time.perf_counter() - start
+
+
+
+def evaluate_registered_batch(task):
+    """Evaluate a list of phenomes with a registered objective function.
+
+    Parameters
+    ----------
+    task : tuple
+        A pair of problem id and list of phenomes.
+
+    """
+    problem_id, phenomes = task
+    objective_function = _worker_functions[problem_id][0]
+    return [objective_function(phenome) for phenome in phenomes]
+
+
+
+def owns_resource_tracker():
+    """Check if this process runs a resource tracker of its own.
+
+    Processes created by the spawn and forkserver start methods, and
+    processes forked after the resource tracker was started, share the
+    tracker of their parent. Otherwise, the tracker is started on demand
+    by the process itself. The answer is determined before the first
+    attachment to a shared memory block and remembered per process.
+
+    """
+    global _tracker_owner
+    pid = os.getpid()
+    if _tracker_owner is None or _tracker_owner[0] != pid:
+        try:
+            from multiprocessing import resource_tracker
+            owns_tracker = resource_tracker._resource_tracker._fd is None
+        except (ImportError, AttributeError):
+            owns_tracker = False
+        _tracker_owner = (pid, owns_tracker)
+    return _tracker_owner[1]
+
+
+
+def attach_shared_array(name, shape):
+    """Create a float64 array on an existing shared memory block.
+
+    Returns
+    -------
+    block : SharedMemory
+        The block, which must be closed after use.
+    array : numpy.ndarray
+        The array using the block as buffer.
+
+    """
+    try:
+        block = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # before Python 3.13, attaching also registers the block for
+        # cleanup, although only the creator should unlink it
+        owns_tracker = owns_resource_tracker()
+        block = shared_memory.SharedMemory(name=name)
+        if owns_tracker:
+            # a tracker shared with the creator must keep its registration
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(block._name, "shared_memory")
+            except (ImportError, AttributeError):
+                pass
+    array = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+    return block, array
+
+
+
+def evaluate_shared_rows(task):
+    """Evaluate a range of rows of a population in shared memory.
+
+    The rows are evaluated with the vectorized objective function of the
+    registered problem, and the objective values are written into the
+    shared output array.
+
+    Parameters
+    ----------
+    task : tuple
+        Problem id, names of the input and output blocks, shapes of the
+        input and output arrays, and start and stop of the row range.
+
+    """
+    problem_id, input_name, output_name, input_shape, output_shape, start, stop = task
+    vectorized_function = _worker_functions[problem_id][1]
+    input_block, phenomes = attach_shared_array(input_name, input_shape)
+    output_block, objective_values = attach_shared_array(output_name, output_shape)
+    try:
+        values = np.asarray(vectorized_function(phenomes[start:stop]), dtype=np.float64)
+        objective_values[start:stop] = values.reshape((stop - start, output_shape[1]))
+    finally:
+        del phenomes
+        del objective_values
+        input_block.close()
+        output_block.close()
+
+
+
+def count_workers(pool):
+    """Return the number of workers of a pool.
+
+    Pools created by :func:`create_worker_pool` know their size in the
+    attribute `num_workers`, which can also be set on other pools. If it
+    is missing, the number of CPUs is returned.
+
+    """
+    num_workers = getattr(pool, "num_workers", None)
+    if not num_workers:
+        num_workers = multiprocessing.cpu_count()
+    return num_workers
+
+
+
+def evaluate_matrix_shared(pool, problem_id, phenomes, num_objectives, rows_per_task=None):
+    """Evaluate a population in parallel, transported via shared memory.
+
+    The phenomes are copied into a shared memory block once. The workers
+    of the pool read their row ranges from there and write the objective
+    values into a second shared block, so that only a small task
+    description per row range is pickled. No budget is consumed here.
+
+    Parameters
+    ----------
+    pool : multiprocessing.pool.Pool
+        A pool created by :func:`create_worker_pool`, in which the
+        problem is registered.
+    problem_id : str
+        The id of the problem.
+    phenomes : array_like
+        A two-dimensional array with one phenome per row.
+    num_objectives : int
+        The number of objectives.
+    rows_per_task : int, optional
+        By default, the rows are distributed evenly among the workers.
+
+    Returns
+    -------
+    objective_values : numpy.ndarray
+        An array of shape (n, num_objectives).
+
+    """
+    if shared_memory is None:
+        raise NotImplementedError("shared memory requires Python 3.8 or newer")
+    phenomes = np.asarray(phenomes, dtype=np.float64)
+    num_rows = len(phenomes)
+    output_shape = (num_rows, num_objectives)
+    if num_rows == 0:
+        return np.empty(output_shape)
+    if rows_per_task is None:
+        rows_per_task = int(math.ceil(num_rows / float(count_workers(pool))))
+    input_block = shared_memory.SharedMemory(create=True, size=max(phenomes.nbytes, 1))
+    output_block = shared_memory.SharedMemory(create=True, size=num_rows * num_objectives * 8)
+    try:
+        shared_phenomes = np.ndarray(phenomes.shape, dtype=np.float64, buffer=input_block.buf)
+        shared_phenomes[:] = phenomes
+        del shared_phenomes
+        tasks = []
+        for start in range(0, num_rows, rows_per_task):
+            stop = min(start + rows_per_task, num_rows)
+            tasks.append((problem_id, input_block.name, output_block.name,
+                          phenomes.shape, output_shape, start, stop))
+        pool.map(evaluate_shared_rows, tasks, chunksize=1)
+        shared_values = np.ndarray(output_shape, dtype=np.float64, buffer=output_block.buf)
+        objective_values = shared_values.copy()
+        del shared_values
+    finally:
+        input_block.close()
+        input_block.unlink()
+        output_block.close()
+        output_block.unlink()
+    return objective_values
+
+
+
+def do_nothing(argument):
+    """Trivial task for measuring the dispatch latency of a pool."""
+    return argument
+
+
+
+class AdaptiveScheduler(object):
+    """Chooses chunk sizes for pool evaluations from runtime measurements.
+
+    The cost of an evaluation is measured inside the worker tasks and
+    smoothed over the batches. Only for the very first batch, when no
+    estimate exists, one phenome is evaluated in the calling process
+    beforehand. The latency of a call to the pool's map and the dispatch
+    overhead per task are measured once per pool with trivial tasks,
+    and the time for pickling the objective function is added to the
+    latter for pools that do not know the problem. The remaining
+    phenomes are evaluated with the chunk size `k` that minimizes the
+    estimated time ``latency + W / p + ceil(n / k) * overhead + k * cost``,
+    where `W` is the total work and `p` the number of workers (see
+    :func:`count_workers`). If
+    evaluating in the calling process is estimated to be faster, the
+    pool is not used at all. The last decision is available in
+    :attr:`decision`. The scheduler is only used by problems whose
+    attribute `chunksize` is set to "auto".
+
+    """
+    def __init__(self, smoothing=0.3):
+        """Constructor.
+
+        Parameters
+        ----------
+        smoothing : float, optional
+            The weight of a new measurement in the exponential moving
+            average of the evaluation cost.
+
+        """
+        self.smoothing = smoothing
+        self.evaluation_time = None
+        # keyed by the pools themselves, so that measurements disappear
+        # with their pool and cannot be inherited by a new pool
+        self.dispatch_latencies = weakref.WeakKeyDictionary()
+        self.map_latencies = weakref.WeakKeyDictionary()
+        self.function_pickle_time = None
+        self.decision = None
+
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # latencies are only valid for pools of this process
+        del state["dispatch_latencies"]
+        del state["map_latencies"]
+        return state
+
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.dispatch_latencies = weakref.WeakKeyDictionary()
+        self.map_latencies = weakref.WeakKeyDictionary()
+
+
+    def measure_latencies(self, pool):
+        """Return the latency of a map call and the time per trivial task."""
+        if pool not in self.dispatch_latencies:
+            num_tasks = 16 * count_workers(pool)
+            pool.map(do_nothing, [None], chunksize=1)
+            start = time.perf_counter()
+            pool.map(do_nothing, [None], chunksize=1)
+            map_latency = time.perf_counter() - start
+            start = time.perf_counter()
+            pool.map(do_nothing, range(num_tasks), chunksize=1)
+            elapsed = time.perf_counter() - start
+            self.map_latencies[pool] = map_latency
+            self.dispatch_latencies[pool] = max(elapsed - map_latency, 0.0) / num_tasks
+        return self.map_latencies[pool], self.dispatch_latencies[pool]
+
+
+    def update_evaluation_time(self, seconds_per_evaluation):
+        """Include a new measurement of the evaluation cost."""
+        if self.evaluation_time is None:
+            self.evaluation_time = seconds_per_evaluation
+        else:
+            weight = self.smoothing
+            self.evaluation_time = (1.0 - weight) * self.evaluation_time + weight * seconds_per_evaluation
+
+
+    def decide(self, num_phenomes, pool, function_pickle_time=0.0):
+        """Choose between in-process evaluation and a chunk size.
+
+        Returns
+        -------
+        decision : dict
+            Contains the keys "mode" ("in-process" or "pool"),
+            "chunksize", and the estimates the decision is based on.
+
+        """
+        num_workers = count_workers(pool)
+        cost = max(self.evaluation_time, 1e-9)
+        map_latency, dispatch_latency = self.measure_latencies(pool)
+        overhead = dispatch_latency + function_pickle_time
+        total_work = num_phenomes * cost
+        # at least one chunk per worker, but not smaller than optimal
+        max_chunksize = max(1, int(math.ceil(num_phenomes / float(num_workers))))
+        chunksize = int(round(math.sqrt(num_phenomes * overhead / cost)))
+        chunksize = min(max(chunksize, 1), max_chunksize)
+        num_chunks = int(math.ceil(num_phenomes / float(chunksize)))
+        pool_time = map_latency + total_work / num_workers + num_chunks * overhead + chunksize * cost
+        if total_work <= pool_time:
+            mode = "in-process"
+        else:
+            mode = "pool"
+        self.decision = {"mode": mode,
+                         "chunksize": chunksize,
+                         "num_phenomes": num_phenomes,
+                         "num_workers": num_workers,
+                         "evaluation_time": cost,
+                         "map_latency": map_latency,
+                         "dispatch_overhead": overhead,
+                         "estimated_pool_time": pool_time,
+                         "estimated_in_process_time": total_work}
+        return self.decision
+
+
+    def map(self, problem, phenomes):
+        """Evaluate phenomes with the objective function of a problem.
+
+        No budget is consumed here.
+
+        """
+        if len(phenomes) == 0:
+            return []
+        objective_function = problem.objective_function
+        pool = problem.worker_pool
+        first_results = []
+        remaining_phenomes = phenomes
+        if self.evaluation_time is None:
+            # the decision needs an initial estimate of the cost
+            start = time.perf_counter()
+            first_results.append(objective_function(phenomes[0]))
+            self.update_evaluation_time(time.perf_counter() - start)
+            remaining_phenomes = phenomes[1:]
+            if not remaining_phenomes:
+                return first_results
+        is_registered = problem.uses_registered_pool()
+        function_pickle_time = 0.0
+        if not is_registered:
+            if self.function_pickle_time is None:
+                start = time.perf_counter()
+                pickle.dumps(objective_function, pickle.HIGHEST_PROTOCOL)
+                self.function_pickle_time = time.perf_counter() - start
+            function_pickle_time = self.function_pickle_time
+        decision = self.decide(len(remaining_phenomes), pool, function_pickle_time)
+        if decision["mode"] == "in-process":
+            start = time.perf_counter()
+            results = [objective_function(phenome) for phenome in remaining_phenomes]
+            elapsed = time.perf_counter() - start
+            self.update_evaluation_time(elapsed / len(remaining_phenomes))
+        else:
+            chunksize = decision["chunksize"]
+            if is_registered:
+                function, problem_id = None, problem.problem_id
+            else:
+                function, problem_id = objective_function, None
+            tasks = [(function, problem_id, remaining_phenomes[i:i + chunksize])
+                     for i in range(0, len(remaining_phenomes), chunksize)]
+            results = []
+            seconds = 0.0
+            for chunk_results, chunk_seconds in pool.map(evaluate_timed_batch, tasks, chunksize=1):
+                results.extend(chunk_results)
+                seconds += chunk_seconds
+            self.update_evaluation_time(seconds / len(remaining_phenomes))
+        return first_results + list(results)
+
+
+
+def _resolve(future, check, result):
+    """Set the checked result on a future, or the exception of the check."""
+    try:
+        result = check(result)
+    except Exception as exception:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
+
+
+def submit_task(pool, function, argument, check=None):
+    """Start an asynchronous evaluation and return a future for its result.
+
+    Pools offering ``submit``, as the executors of
+    :mod:`concurrent.futures`, and pools offering ``apply_async``, as
+    :class:`multiprocessing.pool.Pool`, are supported. For other pools
+    (and for ``pool = None``), the function is called immediately in the
+    calling process and a completed future is returned.
+
+    Parameters
+    ----------
+    pool : Pool or Executor
+        Where to carry out the evaluation.
+    function : callable
+        The function to apply.
+    argument : object
+        The single argument of the function.
+    check : callable, optional
+        Applied to the result in the calling process before it is set on
+        the future. It may transform the result or raise an exception,
+        which is then set on the future instead.
+
+    Returns
+    -------
+    future : concurrent.futures.Future
+
+    """
+    if check is None:
+        check = do_nothing
+    future = concurrent.futures.Future()
+    future.set_running_or_notify_cancel()
+    if hasattr(pool, "submit"):
+        def transfer(task_future):
+            exception = task_future.exception()
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                _resolve(future, check, task_future.result())
+        pool.submit(function, argument).add_done_callback(transfer)
+    elif hasattr(pool, "apply_async"):
+        pool.apply_async(function, (argument,),
+                         callback=lambda result: _resolve(future, check, result),
+                         error_callback=future.set_exception)
+    else:
+        try:
+            result = function(argument)
+        except Exception as exception:
+            future.set_exception(exception)
+        else:
+            _resolve(future, check, result)
+    return future
+
+
+
+def create_worker_pool(problems, processes=None, context=None, initializer=None, initargs=()):
+    """Create a pool of worker processes knowing the given problems.
+
+    The objective functions of the problems are transferred to the
+    workers once by the pool initializer. The pool is assigned to the
+    problems as their `worker_pool`, and their batch evaluations
+    automatically refer to the registered functions.
+
+    Parameters
+    ----------
+    problems : sequence of Problem
+        The problems to register.
+    processes : int, optional
+        The number of worker processes. By default, the number of CPUs.
+    context : multiprocessing context, optional
+        The context to create the pool with. By default, the
+        `multiprocessing` module itself is used.
+    initializer : callable, optional
+        An additional initializer for the workers.
+    initargs : tuple, optional
+        The arguments for `initializer`.
+
+    Returns
+    -------
+    pool : multiprocessing.pool.Pool
+        The pool, which has an attribute `registered_problems` containing
+        the ids of the registered problems, and an attribute
+        `num_workers`.
+
+    """
+    if context is None:
+        context = multiprocessing
+    objective_functions = dict()
+    for problem in problems:
+        objective_functions[problem.problem_id] = (problem.objective_function,
+                                                   problem.vectorized_objective_function)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    pool = context.Pool(processes, initialize_worker, (objective_functions, initializer, initargs))
+    pool.registered_problems = frozenset(objective_functions)
+    pool.num_workers = processes
+    for problem in problems:
+        problem.worker_pool = pool
+    return pool
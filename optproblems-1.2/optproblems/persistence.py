@@ -0,0 +1,216 @@
+"""
+Persistent storage of objective values.
+
+The archive in this module can be plugged into
+:class:`Cache <optproblems.base.Cache>` to reuse evaluations across
+repeated experiments, restarted jobs, and parallel worker processes::
+
+    archive = PersistentArchive("evaluations.sqlite", problem_identity(problem))
+    cached_problem = Cache(problem, archive=archive)
+
+"""
+import hashlib
+import pickle
+import sqlite3
+
+import numpy as np
+
+
+def phenome_digest(phenome):
+    """Return a 16-byte digest of a phenome (or a key derived from it).
+
+    Numerical phenomes are converted to an array of doubles first, so
+    that e.g. ``[1, 0]``, ``(1.0, 0.0)``, and ``[True, False]`` obtain
+    the same digest. Other objects are pickled.
+
+    """
+    try:
+        array = np.asarray(phenome, dtype=float)
+        data = str(array.shape).encode("ascii") + array.tobytes()
+    except (TypeError, ValueError):
+        data = pickle.dumps(phenome, protocol=2)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+
+def problem_identity(problem):
+    """Return a string identifying a problem for the persistent storage.
+
+    The identity consists of the class, the name, and the dimensions of
+    the problem. Problems with the same identity must have the same
+    objective function. For randomly generated problem instances, a
+    suitable namespace must be chosen manually.
+
+    """
+    cls = problem.__class__
+    parts = [cls.__module__ + "." + cls.__name__, str(problem)]
+    for attribute in ("num_variables", "num_objectives"):
+        parts.append(str(getattr(problem, attribute, None)))
+    return ":".join(parts)
+
+
+
+class PersistentArchive(object):
+    """An archive of objective values stored in an SQLite database.
+
+    Entries are stored under the digest of their key (see
+    :func:`phenome_digest <optproblems.persistence.phenome_digest>`),
+    separated by a namespace, so that several problems can share one
+    database file. The values are pickled. Several processes may access
+    the same file concurrently. Each process opens its own connection,
+    also after the archive was pickled and sent to a worker.
+
+    Batches are read with :func:`get_many` and written with
+    :func:`set_many` in a single transaction each, which
+    :class:`Cache <optproblems.base.Cache>` uses for its batch
+    evaluations.
+
+    """
+    def __init__(self, path, namespace="", timeout=60.0, key_function=phenome_digest):
+        """Constructor.
+
+        Parameters
+        ----------
+        path : str
+            The location of the database file. It is created if it does
+            not exist.
+        namespace : str, optional
+            Identifies the problem, e.g., obtained by
+            :func:`problem_identity <optproblems.persistence.problem_identity>`.
+        timeout : float, optional
+            How long to wait for locks held by other processes, in
+            seconds.
+        key_function : callable, optional
+            Maps the keys to the bytes stored in the database.
+
+        """
+        self.path = path
+        self.namespace = namespace
+        self.timeout = timeout
+        self.key_function = key_function
+        self.connection = None
+        self.last_lookup = None
+        self.connect()
+
+
+    def connect(self):
+        """Open the database connection and create the table, if necessary."""
+        connection = sqlite3.connect(self.path,
+                                     timeout=self.timeout,
+                                     check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS evaluations ("
+                               "namespace TEXT NOT NULL, "
+                               "key BLOB NOT NULL, "
+                               "value BLOB NOT NULL, "
+                               "PRIMARY KEY (namespace, key))")
+        self.connection = connection
+
+
+    def close(self):
+        """Close the database connection."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["connection"] = None
+        state["last_lookup"] = None
+        return state
+
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.connect()
+
+
+    def _fetch(self, digests):
+        query = "SELECT key, value FROM evaluations WHERE namespace = ? AND key IN ({})"
+        found = {}
+        digests = list(digests)
+        # stay below SQLite's limit of host parameters
+        step = 900
+        for start in range(0, len(digests), step):
+            chunk = digests[start:start + step]
+            statement = query.format(", ".join("?" * len(chunk)))
+            for digest, value in self.connection.execute(statement, [self.namespace] + chunk):
+                found[bytes(digest)] = value
+        return found
+
+
+    def __contains__(self, key):
+        digest = self.key_function(key)
+        found = self._fetch([digest])
+        if digest in found:
+            # remember for the subsequent __getitem__
+            self.last_lookup = (digest, found[digest])
+            return True
+        return False
+
+
+    def __getitem__(self, key):
+        digest = self.key_function(key)
+        if self.last_lookup is not None and self.last_lookup[0] == digest:
+            return pickle.loads(self.last_lookup[1])
+        found = self._fetch([digest])
+        if digest not in found:
+            raise KeyError(key)
+        return pickle.loads(found[digest])
+
+
+    def __setitem__(self, key, value):
+        self.set_many([(key, value)])
+
+
+    def __delitem__(self, key):
+        digest = self.key_function(key)
+        with self.connection:
+            cursor = self.connection.execute("DELETE FROM evaluations WHERE namespace = ? AND key = ?",
+                                             (self.namespace, digest))
+        self.last_lookup = None
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+
+    def __len__(self):
+        cursor = self.connection.execute("SELECT COUNT(*) FROM evaluations WHERE namespace = ?",
+                                         (self.namespace,))
+        return cursor.fetchone()[0]
+
+
+    def get_many(self, keys):
+        """Retrieve the stored values for several keys in one query.
+
+        Returns
+        -------
+        stored_values : dict
+            Maps the keys that were found to their values.
+
+        """
+        key_function = self.key_function
+        digests = {}
+        for key in keys:
+            digests.setdefault(key_function(key), []).append(key)
+        found = self._fetch(digests)
+        stored_values = {}
+        for digest, value in found.items():
+            value = pickle.loads(value)
+            for key in digests[digest]:
+                stored_values[key] = value
+        return stored_values
+
+
+    def set_many(self, items):
+        """Store several (key, value) pairs in one transaction."""
+        key_function = self.key_function
+        namespace = self.namespace
+        rows = [(namespace, key_function(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+                for key, value in items]
+        if rows:
+            with self.connection:
+                self.connection.executemany("INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?)", rows)
+        self.last_lookup = None
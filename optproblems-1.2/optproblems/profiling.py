@@ -0,0 +1,145 @@
+"""
+Lightweight instrumentation of problem evaluations.
+
+Profiling is switched on per problem::
+
+    problem = F8(30)
+    profile = problem.enable_profiling()
+    problem.batch_evaluate(population)
+    print(profile.to_json(indent=2))
+
+The profile records how much time is spent in the sections listed in
+:data:`SECTIONS`. Without profiling, the evaluation code only checks
+once per call if a profile is attached.
+
+"""
+import math
+import json
+import threading
+
+
+PREPROCESSOR = "preprocessor"
+BUDGET = "budget"
+OBJECTIVE_FUNCTION = "objective_function"
+POOL_DISPATCH = "pool_dispatch"
+
+#: The sections of an evaluation that are timed. The "budget" section
+#: contains the acquisition of the lock protecting the budget, and the
+#: "pool_dispatch" section the complete round trip to the worker pool,
+#: including the evaluations in the workers.
+SECTIONS = (PREPROCESSOR, BUDGET, OBJECTIVE_FUNCTION, POOL_DISPATCH)
+
+
+
+class SectionStatistics(object):
+    """Accumulates the timings of one section.
+
+    The histogram counts the time per item in buckets bounded by powers
+    of two, i.e., bucket `e` contains times in ``[2 ** (e - 1), 2 ** e)``
+    seconds.
+
+    """
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.min_time = float("inf")
+        self.max_time = 0.0
+        self.histogram = dict()
+
+
+    def add(self, seconds, num_items=1):
+        """Add a measurement covering `num_items` items."""
+        self.count += num_items
+        self.total_time += seconds
+        time_per_item = seconds / num_items
+        if time_per_item < self.min_time:
+            self.min_time = time_per_item
+        if time_per_item > self.max_time:
+            self.max_time = time_per_item
+        # the clock resolution is at least a nanosecond
+        exponent = math.frexp(max(time_per_item, 1e-9))[1]
+        histogram = self.histogram
+        histogram[exponent] = histogram.get(exponent, 0) + num_items
+
+
+    def as_dict(self):
+        """Return the statistics as a dictionary of builtin types."""
+        if self.count > 0:
+            mean_time = self.total_time / self.count
+            min_time = self.min_time
+        else:
+            mean_time = None
+            min_time = None
+        histogram = [{"upper_bound": math.ldexp(1.0, exponent), "count": count}
+                     for exponent, count in sorted(self.histogram.items())]
+        return {"count": self.count,
+                "total_time": self.total_time,
+                "mean_time": mean_time,
+                "min_time": min_time,
+                "max_time": self.max_time,
+                "histogram": histogram}
+
+
+
+class EvaluationProfile(object):
+    """Collects timings and counters of the evaluations of a problem.
+
+    Measurements may be recorded from several threads. When a problem is
+    sent to worker processes, the workers record into their own copies
+    of the profile.
+
+    """
+    def __init__(self):
+        self.sections = dict((section, SectionStatistics()) for section in SECTIONS)
+        self.counters = dict()
+        self.lock = threading.Lock()
+
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+
+    def record(self, section, seconds, num_items=1):
+        """Record the time spent in a section for `num_items` items."""
+        with self.lock:
+            statistics = self.sections.get(section)
+            if statistics is None:
+                statistics = self.sections[section] = SectionStatistics()
+            statistics.add(seconds, num_items)
+
+
+    def count(self, counter, increment=1):
+        """Increment a counter, e.g., the number of calls of a method."""
+        with self.lock:
+            self.counters[counter] = self.counters.get(counter, 0) + increment
+
+
+    def reset(self):
+        """Discard all measurements."""
+        with self.lock:
+            self.sections = dict((section, SectionStatistics()) for section in SECTIONS)
+            self.counters = dict()
+
+
+    def as_dict(self):
+        """Return counters and section statistics as a dictionary."""
+        with self.lock:
+            sections = dict((name, statistics.as_dict())
+                            for name, statistics in self.sections.items())
+            return {"counters": dict(self.counters), "sections": sections}
+
+
+    def to_json(self, **kwargs):
+        """Return the profile as JSON string.
+
+        Keyword arguments are passed on to :func:`json.dumps`.
+
+        """
+        return json.dumps(self.as_dict(), **kwargs)
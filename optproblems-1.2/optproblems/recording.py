@@ -0,0 +1,255 @@
+"""
+Streaming records of problem evaluations.
+
+Recording is switched on per problem::
+
+    problem = F8(30)
+    problem.start_recording("run-0001", record_phenomes=True)
+    algorithm.run(10000)
+    problem.stop_recording()
+    records = load_recording("run-0001")
+
+Each evaluation is stored with its index, the best objective values so
+far, its objective values, and optionally the phenome. The records are
+collected in a buffer of fixed size, which is written to disk whenever
+it is full. Every write creates new ``.npy`` files, one per column, so
+existing files are never modified and all but the last buffer survive a
+crash of the run. The memory use does not depend on the length of the
+run.
+
+"""
+import os
+import glob
+import threading
+
+import numpy as np
+
+
+INDEX = "index"
+BEST_SO_FAR = "best_so_far"
+OBJECTIVE_VALUES = "objective_values"
+PHENOMES = "phenomes"
+
+#: The columns of a recording. For single-objective problems, the
+#: best values and the objective values are one-dimensional.
+COLUMNS = (INDEX, BEST_SO_FAR, OBJECTIVE_VALUES, PHENOMES)
+
+
+
+def chunk_file_name(column, chunk_index):
+    """Return the file name of a column of a chunk."""
+    return "%s-%06d.npy" % (column, chunk_index)
+
+
+
+def load_recording(directory, mmap_mode=None):
+    """Load all chunks of a recording.
+
+    Only complete chunks are loaded, i.e., those whose index file exists.
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the recording.
+    mmap_mode : str, optional
+        Passed on to :func:`numpy.load`, e.g., "r" to map the chunks into
+        memory instead of reading them.
+
+    Returns
+    -------
+    records : dict
+        Maps the names of the recorded columns to arrays with one row
+        per evaluation.
+
+    """
+    records = dict()
+    num_chunks = len(glob.glob(os.path.join(directory, INDEX + "-*.npy")))
+    if num_chunks == 0:
+        return records
+    for column in COLUMNS:
+        file_names = [os.path.join(directory, chunk_file_name(column, chunk_index))
+                      for chunk_index in range(num_chunks)]
+        if os.path.exists(file_names[0]):
+            chunks = [np.load(file_name, mmap_mode=mmap_mode) for file_name in file_names]
+            records[column] = np.concatenate(chunks)
+    return records
+
+
+
+class EvaluationRecorder(object):
+    """Writes the evaluations of a problem to chunked, append-only files.
+
+    The best objective values so far are determined for each objective
+    separately, so for several objectives they do not necessarily belong
+    to one solution. NaN values are ignored. Records may be added from
+    several threads. The recorder stays in the process it was created
+    in, i.e., it is not sent along with the problem to other processes.
+
+    """
+    def __init__(self, directory, num_objectives=1, record_phenomes=False,
+                 chunk_size=10000, do_maximize=False):
+        """Constructor.
+
+        Parameters
+        ----------
+        directory : str
+            The directory for the chunk files. It is created if it does
+            not exist, but must not contain another recording.
+        num_objectives : int, optional
+            The number of objective values per evaluation.
+        record_phenomes : bool, optional
+            Whether to store the phenomes. They must be numeric sequences
+            of equal length.
+        chunk_size : int, optional
+            The number of evaluations in the buffer and in each chunk.
+        do_maximize : bool or sequence of bool, optional
+            Determines for each objective if larger values are better.
+
+        """
+        assert num_objectives >= 1
+        assert chunk_size >= 1
+        os.makedirs(directory, exist_ok=True)
+        existing_files = glob.glob(os.path.join(directory, INDEX + "-*.npy"))
+        assert not existing_files, "directory already contains a recording"
+        self.directory = directory
+        self.num_objectives = num_objectives
+        self.record_phenomes = record_phenomes
+        self.chunk_size = chunk_size
+        self.do_maximize = np.broadcast_to(np.asarray(do_maximize, dtype=bool), (num_objectives,))
+        self.num_records = 0
+        self.num_chunks = 0
+        self.best_so_far = np.full(num_objectives, np.nan)
+        self.buffers = None
+        self.num_buffered = 0
+        self.closed = False
+        self.lock = threading.Lock()
+
+
+    def __getstate__(self):
+        raise TypeError("an EvaluationRecorder cannot be sent to other processes")
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    def allocate_buffers(self, num_variables):
+        """Create the buffer arrays, once the phenome length is known."""
+        chunk_size = self.chunk_size
+        if self.num_objectives == 1:
+            values_shape = (chunk_size,)
+        else:
+            values_shape = (chunk_size, self.num_objectives)
+        buffers = {INDEX: np.empty(chunk_size, dtype=np.int64),
+                   BEST_SO_FAR: np.empty(values_shape),
+                   OBJECTIVE_VALUES: np.empty(values_shape)}
+        if self.record_phenomes:
+            buffers[PHENOMES] = np.empty((chunk_size, num_variables))
+        self.buffers = buffers
+
+
+    def update_best(self, objective_values):
+        """Return the best values so far after each of the given rows."""
+        best = np.empty((len(objective_values) + 1, self.num_objectives))
+        best[0] = self.best_so_far
+        best[1:] = objective_values
+        # fmin and fmax ignore NaN
+        minima = np.fmin.accumulate(best, axis=0)
+        maxima = np.fmax.accumulate(best, axis=0)
+        best = np.where(self.do_maximize, maxima, minima)[1:]
+        self.best_so_far = best[-1].copy()
+        return best
+
+
+    def record(self, phenomes, objective_values):
+        """Record a batch of evaluations.
+
+        Parameters
+        ----------
+        phenomes : sequence
+            The evaluated phenomes. Ignored if phenomes are not recorded.
+        objective_values : array_like
+            The objective values, one entry or row per phenome.
+
+        Raises
+        ------
+        ValueError
+            If the recorder is already closed.
+
+        """
+        num_records = len(objective_values)
+        if num_records == 0:
+            return
+        objective_values = np.asarray(objective_values, dtype=float)
+        objective_values = objective_values.reshape((num_records, self.num_objectives))
+        if self.record_phenomes:
+            phenomes = np.asarray(phenomes, dtype=float).reshape((num_records, -1))
+        with self.lock:
+            if self.closed:
+                raise ValueError("recorder is closed")
+            if self.buffers is None:
+                num_variables = phenomes.shape[1] if self.record_phenomes else 0
+                self.allocate_buffers(num_variables)
+            buffers = self.buffers
+            start_index = self.num_records
+            best = self.update_best(objective_values)
+            if self.num_objectives == 1:
+                best = best[:, 0]
+                objective_values = objective_values[:, 0]
+            self.num_records += num_records
+            position = 0
+            while position < num_records:
+                stop = min(num_records, position + self.chunk_size - self.num_buffered)
+                buffer_slice = slice(self.num_buffered, self.num_buffered + stop - position)
+                buffers[INDEX][buffer_slice] = np.arange(start_index + position, start_index + stop)
+                buffers[BEST_SO_FAR][buffer_slice] = best[position:stop]
+                buffers[OBJECTIVE_VALUES][buffer_slice] = objective_values[position:stop]
+                if self.record_phenomes:
+                    buffers[PHENOMES][buffer_slice] = phenomes[position:stop]
+                self.num_buffered += stop - position
+                position = stop
+                if self.num_buffered == self.chunk_size:
+                    self.write_chunk()
+
+
+    def write_chunk(self):
+        """Write the buffered records to new files and empty the buffer.
+
+        Each file is written under a temporary name first and then
+        renamed. The index column is written last, so that a chunk is
+        complete if its index file exists.
+
+        """
+        num_buffered = self.num_buffered
+        if num_buffered == 0:
+            return
+        columns = [column for column in COLUMNS[1:] if column in self.buffers] + [INDEX]
+        for column in columns:
+            buffer = self.buffers[column]
+            file_name = os.path.join(self.directory, chunk_file_name(column, self.num_chunks))
+            temporary_name = file_name + ".tmp"
+            with open(temporary_name, "wb") as file:
+                np.save(file, buffer[:num_buffered])
+            os.replace(temporary_name, file_name)
+        self.num_chunks += 1
+        self.num_buffered = 0
+
+
+    def flush(self):
+        """Write the buffered records, even if the buffer is not full."""
+        with self.lock:
+            self.write_chunk()
+
+
+    def close(self):
+        """Write the remaining records and release the buffer."""
+        with self.lock:
+            if not self.closed:
+                if self.buffers is not None:
+                    self.write_chunk()
+                self.buffers = None
+                self.closed = True
@@ -58,11 +58,19 @@ if __name__ == '__main__':
 
             'License :: OSI Approved :: BSD License',
 
-            'Programming Language :: Python :: 2',
-            'Programming Language :: Python :: 2.7',
             'Programming Language :: Python :: 3',
-            'Programming Language :: Python :: 3.4',
+            'Programming Language :: Python :: 3 :: Only',
+            'Programming Language :: Python :: 3.8',
+            'Programming Language :: Python :: 3.9',
+            'Programming Language :: Python :: 3.10',
+            'Programming Language :: Python :: 3.11',
         ],
         keywords='objective function multimodal multiobjective black-box optimization benchmark problem binary Dixon ZDT DTLZ WFG CEC',
-        packages=find_packages(exclude=['test']),
+        packages=find_packages(exclude=['test', 'benchmarks']),
+        package_data={'optproblems.cec2005': ['data/*.npy']},
+        # shared memory transport needs multiprocessing.shared_memory
+        python_requires='>=3.8',
+        # default_rng and SeedSequence
+        install_requires=['numpy>=1.17'],
+        zip_safe=False,
     )
@@ -0,0 +1,102 @@
+import os
+import signal
+import multiprocessing
+import multiprocessing.dummy
+
+import numpy as np
+import pytest
+
+from optproblems import Problem
+from optproblems.algorithms import GeneticAlgorithm, ParticleSwarmOptimization
+from optproblems.algorithms import IslandModel
+
+
+def sphere(phenome):
+    return float(np.sum(np.square(phenome)))
+
+
+def make_problem(max_evaluations=float("inf"), locking=None):
+    problem = Problem(sphere, max_evaluations=max_evaluations, locking=locking)
+    problem.num_variables = 3
+    problem.min_bounds = [-5.0] * 3
+    problem.max_bounds = [5.0] * 3
+    return problem
+
+
+class KilledGeneticAlgorithm(GeneticAlgorithm):
+    """Dies like a process killed by the operating system."""
+
+    def step(self):
+        os.kill(os.getpid(), signal.SIGKILL)
+
+
+def test_island_model_reports_killed_island():
+    context = multiprocessing.get_context("fork")
+    problem = make_problem(1000, locking="counter")
+    model = IslandModel(problem, 2, algorithm=KilledGeneticAlgorithm, context=context,
+                        seed=1, population_size=4)
+    model.poll_interval = 0.05
+    with pytest.raises(RuntimeError, match="island . died"):
+        model.run(5)
+
+
+def check_evaluation_counts(optimizer, problem, size):
+    curve = optimizer.run(5)
+    assert len(curve) == 6
+    assert problem.consumed_evaluations == size * 6
+    assert optimizer.best_objective_value == curve[-1]
+    assert optimizer.best_objective_value == sphere(optimizer.best_phenome)
+    # continuing does not repeat the initialization
+    optimizer.run(2)
+    assert problem.consumed_evaluations == size * 8
+
+
+def check_budget_exhaustion(optimizer, problem):
+    curve = optimizer.run(100)
+    # a generation is only evaluated if the budget suffices for all of it
+    assert len(curve) == 4
+    assert problem.consumed_evaluations == 40
+
+
+def test_genetic_algorithm_evaluates_each_solution_once():
+    problem = make_problem()
+    check_evaluation_counts(GeneticAlgorithm(problem, population_size=8, rng=0), problem, 8)
+
+
+def test_genetic_algorithm_ends_when_budget_is_exhausted():
+    problem = make_problem(max_evaluations=45)
+    check_budget_exhaustion(GeneticAlgorithm(problem, population_size=10, rng=0), problem)
+
+
+def test_batch_evaluate_path_counts():
+    with multiprocessing.dummy.Pool(2) as pool:
+        problem = make_problem()
+        problem.worker_pool = pool
+        curve = GeneticAlgorithm(problem, population_size=6, rng=0).run(3)
+    assert len(curve) == 4
+    assert problem.consumed_evaluations == 6 * 4
+
+
+def test_particle_swarm_evaluates_each_solution_once():
+    problem = make_problem()
+    check_evaluation_counts(ParticleSwarmOptimization(problem, swarm_size=8, rng=0), problem, 8)
+
+
+def test_particle_swarm_ends_when_budget_is_exhausted():
+    problem = make_problem(max_evaluations=45)
+    check_budget_exhaustion(ParticleSwarmOptimization(problem, swarm_size=10, rng=0), problem)
+
+
+def test_island_model_evaluation_counts():
+    context = multiprocessing.get_context("fork")
+    problem = make_problem(locking="counter")
+    curves = IslandModel(problem, 3, migration_interval=2, context=context,
+                         seed=1, population_size=6).run(5)
+    assert curves.shape == (3, 6)
+    assert problem.consumed_evaluations == 3 * 6 * 6
+    problem = make_problem(max_evaluations=120, locking="counter")
+    model = IslandModel(problem, 3, migration_interval=2, context=context,
+                        seed=1, population_size=6)
+    curves = model.run(100)
+    assert problem.consumed_evaluations == 120
+    assert model.best_objective_value == np.nanmin(curves)
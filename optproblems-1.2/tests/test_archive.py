@@ -0,0 +1,91 @@
+import pytest
+
+from optproblems import Problem, Cache
+from optproblems.base import BoundedArchive
+
+
+def fill(archive, keys):
+    for key in keys:
+        archive[key] = key * 10
+
+
+def test_lru_evicts_least_recently_used():
+    archive = BoundedArchive(max_entries=3, policy="lru")
+    fill(archive, "abc")
+    archive["a"]
+    # membership tests do not count as access
+    assert "b" in archive
+    archive["d"] = "dd"
+    assert list(archive) == ["c", "a", "d"]
+    assert archive.num_evictions == 1
+
+
+def test_lfu_evicts_least_frequently_used():
+    archive = BoundedArchive(max_entries=3, policy="lfu")
+    fill(archive, "abc")
+    for key in "aab":
+        archive[key]
+    archive["d"] = "dd"
+    assert sorted(archive) == ["a", "b", "d"]
+    # ties are broken by age, the new entry has the lowest frequency
+    archive["e"] = "ee"
+    assert sorted(archive) == ["a", "b", "e"]
+    archive["b"]
+    archive["b"]
+    archive["f"] = "ff"
+    assert sorted(archive) == ["a", "b", "f"]
+    assert archive.num_evictions == 3
+
+
+def test_fifo_evicts_oldest():
+    archive = BoundedArchive(max_entries=2, policy="fifo")
+    fill(archive, "ab")
+    archive["a"]
+    archive["c"] = "cc"
+    assert list(archive) == ["b", "c"]
+    # overwriting counts as a new insertion
+    archive["b"] = "bbb"
+    archive["d"] = "dd"
+    assert dict(archive) == {"b": "bbb", "d": "dd"}
+
+
+def test_ttl_removes_expired_entries():
+    archive = BoundedArchive(ttl=2, policy="lru")
+    fill(archive, "ab")
+    archive["a"]
+    archive["c"] = "cc"
+    assert list(archive) == ["b", "c"]
+    archive["d"] = "dd"
+    assert list(archive) == ["c", "d"]
+    assert archive.num_evictions == 2
+
+
+def test_byte_budget():
+    # each entry has a key of 2 and a value of 20 characters
+    archive = BoundedArchive(max_bytes=50, size_function=len)
+    fill(archive, ["k1", "k2", "k3"])
+    assert list(archive) == ["k2", "k3"]
+    assert archive.total_bytes == 44
+    assert archive.num_evictions == 1
+    # an entry larger than the budget is not stored
+    archive["big"] = "x" * 60
+    assert "big" not in archive
+    assert archive.total_bytes == 44
+    del archive["k3"]
+    assert archive.total_bytes == 22
+
+
+def test_cache_counters():
+    cache = Cache(Problem(sum), max_entries=2)
+    for phenome in ([1], [2], [1], [3], [2], [1]):
+        cache(phenome)
+    # [2] was evicted by [3], and then [1] by [2]
+    assert cache.saved_evaluations == 1
+    assert cache.cache_misses == 5
+    assert cache.cache_evictions == 3
+    assert cache.consumed_evaluations == 5
+
+
+def test_invalid_policy():
+    with pytest.raises(AssertionError):
+        BoundedArchive(policy="random")
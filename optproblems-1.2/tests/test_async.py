@@ -0,0 +1,80 @@
+import asyncio
+import concurrent.futures
+import multiprocessing.dummy
+
+import pytest
+
+from optproblems import Problem, Individual, ResourcesExhausted
+
+
+def double(phenome):
+    return [2 * value for value in phenome]
+
+
+def evaluate_all(problem, individuals):
+    """Start all evaluations, then wait for them.
+
+    Returns the evaluated individuals and the number of evaluations
+    rejected because of the budget.
+
+    """
+    async def main():
+        futures = []
+        num_rejected = 0
+        for individual in individuals:
+            try:
+                futures.append(problem.evaluate_async(individual))
+            except ResourcesExhausted:
+                num_rejected += 1
+        return await asyncio.gather(*futures), num_rejected
+    return asyncio.run(main())
+
+
+@pytest.fixture(params=["none", "thread_pool", "executor"])
+def worker_pool(request):
+    if request.param == "none":
+        yield None
+    elif request.param == "thread_pool":
+        with multiprocessing.dummy.Pool(2) as pool:
+            yield pool
+    else:
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            yield executor
+
+
+def test_budget_is_honoured(worker_pool):
+    problem = Problem(sum, max_evaluations=3, worker_pool=worker_pool)
+    individuals = [Individual([i, 1]) for i in range(5)]
+    evaluated, num_rejected = evaluate_all(problem, individuals)
+    assert num_rejected == 2
+    assert evaluated == individuals[:3]
+    assert problem.consumed_evaluations == 3
+    assert [ind.objective_values for ind in individuals] == [1, 2, 3, None, None]
+
+
+def test_preprocessor_is_applied(worker_pool):
+    problem = Problem(sum, worker_pool=worker_pool, phenome_preprocessor=double)
+    individuals = [Individual([i, 1]) for i in range(4)]
+    evaluated, num_rejected = evaluate_all(problem, individuals)
+    assert evaluated == individuals
+    assert num_rejected == 0
+    assert [ind.objective_values for ind in individuals] == [2 * (i + 1) for i in range(4)]
+    assert problem.consumed_evaluations == 4
+
+
+def test_awaiting_single_evaluation():
+    async def main():
+        problem = Problem(sum, max_evaluations=1)
+        individual = await problem.evaluate_async(Individual([1, 2]))
+        with pytest.raises(ResourcesExhausted):
+            problem.evaluate_async(Individual([3, 4]))
+        return individual
+    assert asyncio.run(main()).objective_values == 3
+
+
+def test_objective_function_errors_are_propagated(worker_pool):
+    problem = Problem(lambda phenome: 1 / phenome[0], worker_pool=worker_pool)
+    async def main():
+        return await problem.evaluate_async(Individual([0]))
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(main())
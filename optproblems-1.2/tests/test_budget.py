@@ -0,0 +1,99 @@
+import multiprocessing
+import multiprocessing.dummy
+
+import numpy as np
+import pytest
+
+from optproblems import Problem, Individual, ResourcesExhausted
+from optproblems.base import EvaluationBudget, SharedEvaluationBudget
+from optproblems.parallel import create_worker_pool
+
+
+def total(phenome):
+    return float(sum(phenome))
+
+
+def reject_negative(phenome):
+    if min(phenome) < 0:
+        raise ValueError("negative variable")
+    return phenome
+
+
+def batch(num_individuals):
+    return [Individual([i, 1]) for i in range(num_individuals)]
+
+
+def check_exhausted_batch(problem):
+    individuals = batch(5)
+    with pytest.raises(ResourcesExhausted):
+        problem.batch_evaluate(individuals)
+    assert problem.consumed_evaluations == 3
+    assert problem.remaining_evaluations == 0
+    assert [ind.objective_values for ind in individuals] == [1.0, 2.0, 3.0, None, None]
+
+
+def test_budget_counters():
+    budget = EvaluationBudget(3)
+    assert budget.try_consume(2)
+    assert not budget.try_consume(2)
+    assert budget.consume_up_to(5) == 1
+    budget.refund(2)
+    assert budget.consumed == 1
+    assert budget.remaining == 2
+
+
+def test_shared_budget_counters():
+    budget = SharedEvaluationBudget(3)
+    assert budget.consume_up_to(5) == 3
+    assert isinstance(budget.consumed, int)
+    budget.refund(1)
+    assert budget.remaining == 1
+    assert SharedEvaluationBudget().remaining == float("inf")
+
+
+def test_serial_exhaustion():
+    problem = Problem(total, max_evaluations=3)
+    with pytest.raises(ResourcesExhausted):
+        for individual in batch(5):
+            problem.evaluate(individual)
+    assert problem.consumed_evaluations == 3
+    check_exhausted_batch(Problem(total, max_evaluations=3))
+
+
+def test_thread_pool_exhaustion():
+    with multiprocessing.dummy.Pool(2) as pool:
+        check_exhausted_batch(Problem(total, max_evaluations=3, worker_pool=pool))
+
+
+def test_process_pool_exhaustion():
+    problem = Problem(total, max_evaluations=3, locking="counter")
+    with create_worker_pool([problem], processes=2) as pool:
+        problem.worker_pool = pool
+        check_exhausted_batch(problem)
+        problem.worker_pool = None
+
+
+def test_matrix_exhaustion_consumes_nothing():
+    problem = Problem(total, max_evaluations=3)
+    with pytest.raises(ResourcesExhausted):
+        problem.evaluate_matrix(np.ones((4, 2)))
+    assert problem.consumed_evaluations == 0
+    np.testing.assert_array_equal(problem.evaluate_matrix(np.ones((3, 2))), [2.0] * 3)
+
+
+def test_refund_when_preprocessor_raises():
+    with multiprocessing.dummy.Pool(2) as pool:
+        problem = Problem(total, max_evaluations=10, worker_pool=pool,
+                          phenome_preprocessor=reject_negative)
+        individuals = batch(3) + [Individual([-1, 1])]
+        with pytest.raises(ValueError):
+            problem.batch_evaluate(individuals)
+        assert problem.consumed_evaluations == 0
+        assert problem.remaining_evaluations == 10
+        with pytest.raises(ValueError):
+            problem.submit_batch([[1, 1], [-1, 1]])
+        with pytest.raises(ValueError):
+            problem.evaluate_matrix(np.array([[1.0, 1.0], [-1.0, 1.0]]))
+        assert problem.consumed_evaluations == 0
+        problem.batch_evaluate(batch(3))
+        assert problem.consumed_evaluations == 3
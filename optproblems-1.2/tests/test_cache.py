@@ -0,0 +1,111 @@
+import multiprocessing.dummy
+
+import numpy as np
+import pytest
+
+from optproblems import Problem, Individual, Cache, ResourcesExhausted
+from optproblems.base import array_key, vectorized_array_key
+
+
+def make_cache(max_evaluations=float("inf"), pool=None):
+    problem = Problem(sum, max_evaluations=max_evaluations, worker_pool=pool)
+    return Cache(problem)
+
+
+def test_serial_duplicates_are_saved():
+    cache = make_cache()
+    for phenome in ([1, 2], [1, 2], [3, 4], [1, 2]):
+        cache(phenome)
+    assert cache.consumed_evaluations == 2
+    assert cache.saved_evaluations == 2
+    assert cache.cache_misses == 2
+
+
+def test_batch_duplicates_are_saved():
+    with multiprocessing.dummy.Pool(2) as pool:
+        cache = make_cache(pool=pool)
+        cache([5, 5])
+        phenomes = [[1, 2], [3, 4], [1, 2], [5, 5], [5, 5], [1, 2]]
+        individuals = [Individual(phenome) for phenome in phenomes]
+        cache.batch_evaluate(individuals)
+    assert [ind.objective_values for ind in individuals] == [3, 7, 3, 10, 10, 3]
+    # [1, 2] and [3, 4] are evaluated, the rest is saved
+    assert cache.consumed_evaluations == 3
+    assert cache.saved_evaluations == 4
+
+
+def test_batch_duplicates_of_unevaluated_representatives_are_not_saved():
+    with multiprocessing.dummy.Pool(2) as pool:
+        cache = make_cache(max_evaluations=1, pool=pool)
+        phenomes = [[1, 2], [3, 4], [1, 2], [3, 4], [3, 4]]
+        individuals = [Individual(phenome) for phenome in phenomes]
+        with pytest.raises(ResourcesExhausted):
+            cache.batch_evaluate(individuals)
+    assert [ind.objective_values for ind in individuals] == [3, None, 3, None, None]
+    assert cache.consumed_evaluations == 1
+    assert cache.saved_evaluations == 1
+    assert len(cache.archive) == 1
+
+
+def test_matrix_duplicates_are_saved():
+    cache = make_cache(max_evaluations=2)
+    phenomes = np.array([[1.0, 2.0], [3.0, 4.0], [1.0, 2.0]])
+    np.testing.assert_array_equal(cache.evaluate_matrix(phenomes), [3.0, 7.0, 3.0])
+    assert cache.consumed_evaluations == 2
+    assert cache.saved_evaluations == 1
+    with pytest.raises(ResourcesExhausted):
+        cache.evaluate_matrix(np.array([[5.0, 6.0], [5.0, 6.0]]))
+    assert cache.saved_evaluations == 1
+
+
+def test_submit_batch_duplicates_are_saved():
+    cache = make_cache()
+    values = cache.submit_batch([[1, 2], [1, 2], [3, 4]]).result()
+    assert list(values) == [3, 3, 7]
+    assert cache.consumed_evaluations == 2
+    assert cache.saved_evaluations == 1
+
+
+def test_hits_return_immutable_values():
+    problem = Problem(lambda phenome: [phenome[0], phenome[1]], num_objectives=2)
+    cache = Cache(problem)
+    first = cache([1, 2])
+    assert first == (1, 2)
+    assert cache([1, 2]) is first
+    with pytest.raises(TypeError):
+        first[0] = 5
+    assert cache([1, 2]) == (1, 2)
+
+
+def test_array_values_cannot_corrupt_archive():
+    cache = Cache(Problem(lambda phenome: np.array(phenome) * 2.0, num_objectives=2),
+                  hash_function=array_key)
+    values = cache(np.array([1.0, 2.0]))
+    assert not values.flags.writeable
+    with pytest.raises(ValueError):
+        values[0] = 0.0
+    hit = cache(np.array([1.0, 2.0]))
+    np.testing.assert_array_equal(hit, [2.0, 4.0])
+    assert cache.saved_evaluations == 1
+
+
+def test_array_keys_distinguish_dtype_and_shape():
+    assert array_key(np.zeros(2)) != array_key(np.zeros(16, dtype=np.uint8))
+    assert array_key(np.zeros(2)) != array_key(np.zeros(2, dtype=np.int64))
+    assert array_key(np.zeros((2, 3))) != array_key(np.zeros((3, 2)))
+    assert array_key([1.0, 2.0]) == array_key(np.array([1.0, 2.0]))
+    phenomes = np.arange(12.0).reshape((4, 3))
+    assert vectorized_array_key(phenomes) == [array_key(row) for row in phenomes]
+    assert vectorized_array_key(np.empty((2, 0))) == [array_key(np.empty(0))] * 2
+    # Fortran order does not matter
+    assert vectorized_array_key(np.asfortranarray(phenomes)) == vectorized_array_key(phenomes)
+
+
+def test_matrix_hits_with_array_keys():
+    cache = make_cache()
+    cache.hash_function = array_key
+    phenomes = np.array([[1.0, 2.0], [3.0, 4.0], [1.0, 2.0]])
+    cache.evaluate_matrix(phenomes)
+    cache(np.array([3.0, 4.0]))
+    assert cache.consumed_evaluations == 2
+    assert cache.saved_evaluations == 2
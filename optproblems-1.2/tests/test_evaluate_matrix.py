@@ -0,0 +1,98 @@
+import random
+
+import numpy as np
+import pytest
+
+from optproblems import Problem
+from optproblems import binary, continuous
+from optproblems.cec2005 import CEC2005
+
+
+def sample(problem, rng, num_points=20):
+    num_variables = problem.num_variables
+    min_bounds = getattr(problem, "min_bounds", None)
+    max_bounds = getattr(problem, "max_bounds", None)
+    if min_bounds is None or max_bounds is None:
+        min_bounds = [-5.0] * num_variables
+        max_bounds = [5.0] * num_variables
+    return rng.uniform(min_bounds, max_bounds, (num_points, num_variables))
+
+
+def assert_matches_calls(problem, phenomes):
+    # noisy problems draw from the global generators in the same order
+    random.seed(0)
+    np.random.seed(0)
+    row_values = np.array([problem(phenome) for phenome in phenomes.tolist()])
+    consumed = problem.consumed_evaluations
+    random.seed(0)
+    np.random.seed(0)
+    matrix_values = problem.evaluate_matrix(phenomes)
+    assert problem.consumed_evaluations == consumed + len(phenomes)
+    np.testing.assert_allclose(matrix_values, row_values, rtol=1e-10, atol=1e-12)
+
+
+def continuous_problems():
+    random.seed(1)
+    np.random.seed(1)
+    problems = list(continuous.DixonSzegoe())
+    problems.extend([continuous.Shekel(7),
+                     continuous.Ackley(),
+                     continuous.DoubleSum(),
+                     continuous.Ellipsoid(),
+                     continuous.FletcherPowell(),
+                     continuous.Griewank(),
+                     continuous.Himmelblau(),
+                     continuous.LunacekTwoSpheres(),
+                     continuous.LunacekTwoRastrigins(),
+                     continuous.ModifiedRastrigin(),
+                     continuous.Rastrigin(),
+                     continuous.Rosenbrock(),
+                     continuous.Schaffer6(),
+                     continuous.Schaffer7(),
+                     continuous.Schwefel(),
+                     continuous.SixHumpCamelback(),
+                     continuous.Sphere(),
+                     continuous.Vincent(),
+                     continuous.Weierstrass()])
+    return problems
+
+
+@pytest.mark.parametrize("problem", continuous_problems(), ids=str)
+def test_continuous(problem):
+    assert_matches_calls(problem, sample(problem, np.random.default_rng(0)))
+
+
+@pytest.mark.parametrize("num_variables", [2, 10])
+def test_cec2005(num_variables):
+    rng = np.random.default_rng(num_variables)
+    for problem in CEC2005(num_variables):
+        assert_matches_calls(problem, sample(problem, rng))
+
+
+@pytest.mark.parametrize("cls", [binary.OneMax, binary.LeadingOnes,
+                                 binary.LeadingOnesTrailingZeros])
+def test_binary(cls):
+    problem = cls(12)
+    phenomes = np.random.default_rng(0).integers(0, 2, (20, 12))
+    assert_matches_calls(problem, phenomes)
+
+
+def test_plain_problem_without_kernel():
+    problem = Problem(sum)
+    assert_matches_calls(problem, np.arange(12.0).reshape((4, 3)))
+
+
+def test_weierstrass_parameters_update_tables():
+    function = continuous.WeierstrassFunction()
+    function.a = 0.7
+    function.b = 2.0
+    function.k_max = 5
+    phenome = [0.1, -0.3, 0.25]
+    expected = 0.0
+    for x in phenome:
+        for k in range(6):
+            expected += 0.7 ** k * np.cos(2.0 * np.pi * 2.0 ** k * (x + 0.5))
+            expected -= 0.7 ** k * np.cos(2.0 * np.pi * 2.0 ** k * 0.5)
+    assert function(phenome) == pytest.approx(expected)
+    reference = continuous.WeierstrassFunction(0.7, 2.0, 5)
+    np.testing.assert_allclose(function.vectorized([phenome]), reference.vectorized([phenome]))
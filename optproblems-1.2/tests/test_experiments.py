@@ -0,0 +1,28 @@
+from functools import partial
+
+import numpy as np
+
+from optproblems.cec2005 import F1, F9
+from optproblems.algorithms import GeneticAlgorithm
+from optproblems.experiments import create_jobs, run_job, run_experiment
+
+
+def make_jobs():
+    factories = [partial(cls, 2, max_evaluations=400) for cls in (F1, F9)]
+    return create_jobs(GeneticAlgorithm, factories, num_runs=3,
+                       num_iterations=10, seed=42, population_size=10)
+
+
+def test_run_job_is_repeatable():
+    job = make_jobs()[0]
+    np.testing.assert_array_equal(run_job(job), run_job(job))
+
+
+def test_results_independent_of_processes():
+    jobs = make_jobs()
+    serial = run_experiment(jobs, processes=1)
+    parallel = run_experiment(jobs, processes=3)
+    again = run_experiment(jobs, processes=1)
+    np.testing.assert_array_equal(serial, parallel)
+    np.testing.assert_array_equal(serial, again)
+    np.testing.assert_array_equal(serial, run_experiment(make_jobs(), processes=2))
@@ -0,0 +1,66 @@
+import pickle
+import multiprocessing.dummy
+
+import pytest
+
+from optproblems import Problem, Cache, Individual
+from optproblems.cec2005 import F1, F9
+from optproblems.persistence import PersistentArchive, problem_identity
+
+
+def test_reopening_keeps_entries(tmp_path):
+    path = str(tmp_path / "evaluations.sqlite")
+    archive = PersistentArchive(path, "sum")
+    cache = Cache(Problem(sum), archive=archive)
+    assert cache([1, 2]) == 3
+    archive.close()
+    cache = Cache(Problem(sum), archive=PersistentArchive(path, "sum"))
+    assert cache([1, 2]) == 3
+    assert cache.consumed_evaluations == 0
+    assert cache.saved_evaluations == 1
+    # also after sending the archive to another process
+    copy = pickle.loads(pickle.dumps(cache.archive))
+    assert copy[[1, 2]] == 3
+    assert len(copy) == 1
+
+
+def test_namespaces_separate_problems(tmp_path):
+    path = str(tmp_path / "evaluations.sqlite")
+    identities = [problem_identity(F1(2)), problem_identity(F9(2)), problem_identity(F1(10))]
+    assert len(set(identities)) == 3
+    assert problem_identity(F1(2)) == identities[0]
+    first = PersistentArchive(path, identities[0])
+    second = PersistentArchive(path, identities[1])
+    first[(0.0, 0.0)] = 1.0
+    assert (0.0, 0.0) in first
+    assert (0.0, 0.0) not in second
+    with pytest.raises(KeyError):
+        second[(0.0, 0.0)]
+    second[(0.0, 0.0)] = 2.0
+    assert first[(0.0, 0.0)] == 1.0
+    del first[(0.0, 0.0)]
+    assert len(first) == 0
+    assert len(second) == 1
+
+
+def test_bulk_operations_beyond_parameter_limit(tmp_path):
+    archive = PersistentArchive(str(tmp_path / "evaluations.sqlite"))
+    keys = [(float(i), 1.0) for i in range(2000)]
+    archive.set_many((key, sum(key)) for key in keys)
+    assert len(archive) == 2000
+    stored_values = archive.get_many(keys + [(-1.0, -1.0)])
+    assert len(stored_values) == 2000
+    assert all(stored_values[key] == sum(key) for key in keys)
+
+
+def test_cache_batch_with_persistent_archive(tmp_path):
+    archive = PersistentArchive(str(tmp_path / "evaluations.sqlite"))
+    with multiprocessing.dummy.Pool(2) as pool:
+        cache = Cache(Problem(sum, worker_pool=pool), archive=archive)
+        cache([0, 1])
+        individuals = [Individual([i, 1]) for i in range(1000)]
+        cache.batch_evaluate(individuals)
+    assert [ind.objective_values for ind in individuals] == [i + 1 for i in range(1000)]
+    assert cache.consumed_evaluations == 1000
+    assert cache.saved_evaluations == 1
+    assert len(archive) == 1000
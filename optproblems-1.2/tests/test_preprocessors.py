@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from optproblems import ScalingPreprocessor
+from optproblems.continuous import SequenceChecker
+from optproblems.binary import BinaryChecker
+
+
+FROM_CUBOID = ([-1.0, 0.0, 2.0], [1.0, 10.0, 4.5])
+TO_CUBOID = ([0.0, -5.0, 100.0], [1.0, 5.0, 200.0])
+
+
+def apply_scalar(preprocessor, phenomes):
+    return np.array([preprocessor(list(row)) for row in phenomes])
+
+
+def check_rejected(preprocessor, phenomes):
+    """Both forms must reject the same population."""
+    with pytest.raises(AssertionError):
+        apply_scalar(preprocessor, phenomes)
+    with pytest.raises(AssertionError):
+        preprocessor.vectorized(phenomes)
+
+
+def test_scaling_vectorized_matches_scalar():
+    rng = np.random.default_rng(0)
+    phenomes = rng.uniform(FROM_CUBOID[0], FROM_CUBOID[1], (100, 3))
+    preprocessor = ScalingPreprocessor(FROM_CUBOID, TO_CUBOID)
+    expected = apply_scalar(preprocessor, phenomes)
+    np.testing.assert_allclose(preprocessor.vectorized(phenomes), expected)
+    np.testing.assert_allclose(apply_scalar(preprocessor, [FROM_CUBOID[0]]),
+                               [TO_CUBOID[0]])
+
+
+def test_scaling_vectorized_with_previous_preprocessor():
+    previous = ScalingPreprocessor(TO_CUBOID, FROM_CUBOID)
+    preprocessor = ScalingPreprocessor(FROM_CUBOID, TO_CUBOID, previous)
+    rng = np.random.default_rng(1)
+    phenomes = rng.uniform(TO_CUBOID[0], TO_CUBOID[1], (20, 3))
+    expected = apply_scalar(preprocessor, phenomes)
+    np.testing.assert_allclose(preprocessor.vectorized(phenomes), expected)
+    np.testing.assert_allclose(expected, phenomes)
+
+
+def test_scaling_degenerate_range_fails_on_call():
+    from_cuboid = ([0.0, 1.0], [1.0, 1.0])
+    preprocessor = ScalingPreprocessor(from_cuboid, ([0.0, 0.0], [1.0, 1.0]))
+    with pytest.raises(ZeroDivisionError):
+        preprocessor([0.5, 1.0])
+    with pytest.raises(ZeroDivisionError):
+        preprocessor.vectorized(np.array([[0.5, 1.0]]))
+
+
+def test_sequence_checker_vectorized_matches_scalar():
+    rng = np.random.default_rng(2)
+    phenomes = rng.uniform(-1.0, 1.0, (30, 4))
+    checker = SequenceChecker(4, data_type=float)
+    np.testing.assert_array_equal(checker.vectorized(phenomes),
+                                  apply_scalar(checker, phenomes))
+    check_rejected(SequenceChecker(3), phenomes)
+    check_rejected(SequenceChecker(4, data_type=str), phenomes)
+
+
+def test_sequence_checker_vectorized_object_array():
+    phenomes = np.array([[1, 2.0], [3.0, 4.0]], dtype=object)
+    checker = SequenceChecker(2, data_type=float)
+    check_rejected(checker, phenomes)
+    phenomes[0, 0] = 1.0
+    np.testing.assert_array_equal(checker.vectorized(phenomes),
+                                  apply_scalar(checker, phenomes))
+
+
+def test_binary_checker_vectorized_matches_scalar():
+    rng = np.random.default_rng(3)
+    phenomes = rng.integers(0, 2, (50, 8))
+    for checker in (BinaryChecker(), BinaryChecker(8)):
+        np.testing.assert_array_equal(checker.vectorized(phenomes),
+                                      apply_scalar(checker, phenomes))
+    check_rejected(BinaryChecker(7), phenomes)
+    phenomes[10, 3] = 2
+    check_rejected(BinaryChecker(), phenomes)
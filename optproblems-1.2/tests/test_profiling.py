@@ -0,0 +1,86 @@
+import json
+import multiprocessing.dummy
+
+import pytest
+
+from optproblems import Problem, Individual, ResourcesExhausted
+from optproblems.profiling import EvaluationProfile, SECTIONS
+from optproblems.profiling import PREPROCESSOR, BUDGET, OBJECTIVE_FUNCTION, POOL_DISPATCH
+
+
+def sphere(phenome):
+    return sum(x * x for x in phenome)
+
+
+def section_counts(profile):
+    return dict((name, statistics["count"])
+                for name, statistics in profile.as_dict()["sections"].items())
+
+
+def test_call_sections():
+    problem = Problem(sphere, max_evaluations=4)
+    problem([1.0, 2.0])
+    profile = problem.enable_profiling()
+    assert problem.profile is profile
+    for _ in range(3):
+        problem([1.0, 2.0])
+    with pytest.raises(ResourcesExhausted):
+        problem([1.0, 2.0])
+    counts = section_counts(profile)
+    assert counts[PREPROCESSOR] == 4
+    assert counts[BUDGET] == 4
+    assert counts[OBJECTIVE_FUNCTION] == 3
+    assert counts[POOL_DISPATCH] == 0
+    assert profile.counters == {"calls": 4, "exhausted": 1}
+    assert problem.consumed_evaluations == 4
+    assert problem.disable_profiling() is profile
+    assert problem.profile is None
+
+
+def test_batch_evaluate_sections():
+    with multiprocessing.dummy.Pool(2) as pool:
+        problem = Problem(sphere, worker_pool=pool)
+        profile = problem.enable_profiling()
+        individuals = [Individual([float(i), 1.0]) for i in range(5)]
+        problem.batch_evaluate(individuals)
+    assert [individual.objective_values for individual in individuals] == \
+        [i * i + 1.0 for i in range(5)]
+    counts = section_counts(profile)
+    assert counts[BUDGET] == 5
+    assert counts[PREPROCESSOR] == 5
+    assert counts[POOL_DISPATCH] == 5
+    assert profile.counters["batch_evaluations"] == 1
+
+
+def test_batch_evaluate_without_pool():
+    problem = Problem(sphere)
+    profile = problem.enable_profiling()
+    problem.batch_evaluate([Individual([1.0]), Individual([2.0])])
+    counts = section_counts(profile)
+    assert counts[OBJECTIVE_FUNCTION] == 2
+    assert profile.counters["calls"] == 2
+
+
+def test_round_trip():
+    problem = Problem(sphere)
+    profile = problem.enable_profiling()
+    for i in range(10):
+        problem([float(i)])
+    dictionary = profile.as_dict()
+    assert json.loads(profile.to_json()) == dictionary
+    assert json.loads(profile.to_json(indent=2)) == dictionary
+    assert set(dictionary["sections"]) == set(SECTIONS)
+    statistics = dictionary["sections"][OBJECTIVE_FUNCTION]
+    assert statistics["count"] == 10
+    assert sum(bucket["count"] for bucket in statistics["histogram"]) == 10
+    assert statistics["min_time"] <= statistics["mean_time"] <= statistics["max_time"]
+    assert dictionary["sections"][POOL_DISPATCH]["mean_time"] is None
+
+
+def test_reset():
+    profile = EvaluationProfile()
+    profile.record(BUDGET, 0.5, 2)
+    profile.count("calls")
+    profile.reset()
+    assert profile.counters == {}
+    assert all(count == 0 for count in section_counts(profile).values())
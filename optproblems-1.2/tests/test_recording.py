@@ -0,0 +1,51 @@
+import multiprocessing.dummy
+
+import numpy as np
+import pytest
+
+from optproblems import Problem
+from optproblems.recording import load_recording
+
+
+def sphere(phenome):
+    return float(np.sum(np.square(phenome)))
+
+
+def test_all_evaluation_paths_are_recorded(tmp_path):
+    with multiprocessing.dummy.Pool(2) as pool:
+        problem = Problem(sphere, worker_pool=pool)
+        problem.start_recording(str(tmp_path), record_phenomes=True, chunk_size=4)
+        problem([1.0, 2.0])
+        problem.submit([0.0, 1.0]).result()
+        problem.submit_batch([[1.0, 1.0], [2.0, 0.0]]).result()
+        streamed = list(problem.evaluate_iter(([float(i), 0.0] for i in range(5)), chunksize=2))
+        problem.evaluate_matrix(np.array([[3.0, 0.0]]))
+        problem.stop_recording()
+    assert len(streamed) == 5
+    records = load_recording(str(tmp_path))
+    assert problem.consumed_evaluations == 10
+    np.testing.assert_array_equal(records["index"], np.arange(10))
+    values = [sphere(phenome) for phenome in records["phenomes"]]
+    np.testing.assert_array_equal(records["objective_values"], values)
+    assert sorted(values) == sorted([5.0, 1.0, 2.0, 4.0, 0.0, 1.0, 4.0, 9.0, 16.0, 9.0])
+    np.testing.assert_array_equal(records["best_so_far"],
+                                  np.minimum.accumulate(records["objective_values"]))
+
+
+def test_closed_recorder_rejects_records(tmp_path):
+    problem = Problem(sphere)
+    recorder = problem.start_recording(str(tmp_path))
+    problem([1.0])
+    assert problem.stop_recording() is recorder
+    with pytest.raises(ValueError, match="recorder is closed"):
+        recorder.record([[2.0]], [4.0])
+    assert len(load_recording(str(tmp_path))["objective_values"]) == 1
+
+
+def test_submit_completing_after_close_is_not_recorded(tmp_path):
+    problem = Problem(sphere)
+    recorder = problem.start_recording(str(tmp_path))
+    check = problem.recording_check(lambda result: result, [[3.0]], single=True)
+    problem.stop_recording()
+    assert check(9.0) == 9.0
+    assert recorder.num_records == 0
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from optproblems import BoundConstraintsRepair, BoundConstraintError
+from optproblems.base import project, reflect, wrap
+from optproblems.base import project_array, reflect_array, wrap_array, bounds_to_arrays
+
+
+MIN_BOUNDS = [-1.0, 0.0, 2.0, None, -3.0, 4.0]
+MAX_BOUNDS = [1.0, 10.0, 2.0, 5.0, None, 4.5]
+
+
+def random_phenomes(num_phenomes=200, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-50.0, 50.0, (num_phenomes, len(MIN_BOUNDS)))
+
+
+def apply_scalar(function, phenomes, min_bounds, max_bounds):
+    return np.array([[function(value, min_bound, max_bound)
+                      for value, min_bound, max_bound in zip(row, min_bounds, max_bounds)]
+                     for row in phenomes.tolist()])
+
+
+@pytest.mark.parametrize("function, array_function", [(project, project_array),
+                                                      (reflect, reflect_array)])
+def test_array_forms_match_scalar_forms(function, array_function):
+    phenomes = random_phenomes()
+    min_array, max_array = bounds_to_arrays(MIN_BOUNDS, MAX_BOUNDS)
+    expected = apply_scalar(function, phenomes, MIN_BOUNDS, MAX_BOUNDS)
+    repaired = array_function(phenomes.copy(), min_array, max_array)
+    np.testing.assert_allclose(repaired, expected, rtol=1e-12, atol=1e-9)
+
+
+def test_wrap_array_matches_wrap():
+    # wrapping requires both bounds
+    columns = [0, 1, 2, 5]
+    min_bounds = [MIN_BOUNDS[i] for i in columns]
+    max_bounds = [MAX_BOUNDS[i] for i in columns]
+    phenomes = random_phenomes()[:, columns]
+    expected = apply_scalar(wrap, phenomes, min_bounds, max_bounds)
+    min_array, max_array = bounds_to_arrays(min_bounds, max_bounds)
+    repaired = wrap_array(phenomes.copy(), min_array, max_array)
+    np.testing.assert_allclose(repaired, expected, rtol=1e-12, atol=1e-9)
+    with pytest.raises(Exception):
+        wrap_array(random_phenomes(), *bounds_to_arrays(MIN_BOUNDS, MAX_BOUNDS))
+
+
+def test_repair_preprocessor_matches_rows():
+    # variables with a missing bound cannot be wrapped
+    modes = ["project", "reflect", "wrap", "reflect", "project", "wrap"]
+    repair = BoundConstraintsRepair((MIN_BOUNDS, MAX_BOUNDS), modes)
+    phenomes = random_phenomes()
+    expected = np.array([repair(row) for row in phenomes.tolist()])
+    np.testing.assert_allclose(repair.vectorized(phenomes), expected, rtol=1e-12, atol=1e-9)
+    in_place = phenomes.copy()
+    repair.vectorized(in_place, in_place=True)
+    np.testing.assert_array_equal(in_place, repair.vectorized(phenomes))
+
+
+def test_missing_repair_mode_raises():
+    repair = BoundConstraintsRepair(([0.0, 0.0], [1.0, 1.0]), ["project", None])
+    assert repair([2.0, 0.5]) == [1.0, 0.5]
+    np.testing.assert_array_equal(repair.vectorized(np.array([[2.0, 0.5]])), [[1.0, 0.5]])
+    with pytest.raises(BoundConstraintError):
+        repair([0.5, 2.0])
+    with pytest.raises(BoundConstraintError):
+        repair.vectorized(np.array([[0.5, 0.5], [0.5, 2.0]]))
+
+
+def repair_outcome(function, argument):
+    try:
+        return np.asarray(function(argument), dtype=float)
+    except Exception as exception:
+        return type(exception)
+
+
+@pytest.mark.parametrize("mode", ["project", "reflect", "wrap", None])
+@pytest.mark.parametrize("min_bound, max_bound", [(-1.0, 1.0), (None, 1.0), (-1.0, None),
+                                                  (-np.inf, 1.0), (-1.0, np.inf), (None, None)])
+def test_scalar_and_vectorized_repair_agree(mode, min_bound, max_bound):
+    repair = BoundConstraintsRepair(([min_bound, 0.0], [max_bound, 1.0]), [mode, "project"])
+    for value in (0.5, -3.5, 3.5, 0.0):
+        phenome = [value, 0.5]
+        scalar = repair_outcome(repair, phenome)
+        vectorized = repair_outcome(lambda row: repair.vectorized(np.array([row]))[0], phenome)
+        if isinstance(scalar, type):
+            assert scalar is vectorized
+        else:
+            np.testing.assert_allclose(scalar, vectorized, rtol=1e-12)
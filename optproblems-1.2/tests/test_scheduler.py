@@ -0,0 +1,66 @@
+import os
+import gc
+import time
+import multiprocessing
+import multiprocessing.dummy
+
+from optproblems import Problem, Individual
+from optproblems.parallel import AdaptiveScheduler, count_workers, create_worker_pool
+
+
+def slow_process_id(phenome):
+    time.sleep(0.005)
+    return float(os.getpid())
+
+
+def test_chunksize_defaults_to_static():
+    problem = Problem(sum)
+    assert problem.chunksize == 1
+    with multiprocessing.dummy.Pool(2) as pool:
+        problem.worker_pool = pool
+        individuals = [Individual([i, 1]) for i in range(20)]
+        problem.batch_evaluate(individuals)
+    assert problem.scheduler.decision is None
+    assert [ind.objective_values for ind in individuals] == [i + 1 for i in range(20)]
+
+
+def test_latencies_are_not_inherited_by_new_pools():
+    scheduler = AdaptiveScheduler()
+    pool = multiprocessing.dummy.Pool(2)
+    scheduler.measure_latencies(pool)
+    assert len(scheduler.map_latencies) == 1
+    pool.close()
+    pool.join()
+    del pool
+    gc.collect()
+    assert len(scheduler.map_latencies) == 0
+    assert len(scheduler.dispatch_latencies) == 0
+
+
+def test_create_worker_pool_records_workers():
+    problem = Problem(sum)
+    with create_worker_pool([problem], processes=3) as pool:
+        assert pool.num_workers == 3
+        assert count_workers(pool) == 3
+    with multiprocessing.dummy.Pool(2) as pool:
+        assert count_workers(pool) == multiprocessing.cpu_count()
+        pool.num_workers = 2
+        assert count_workers(pool) == 2
+
+
+def test_auto_chunks_probe_in_parent_only_once():
+    problem = Problem(slow_process_id)
+    problem.chunksize = "auto"
+    parent = float(os.getpid())
+    context = multiprocessing.get_context("fork")
+    with create_worker_pool([problem], processes=2, context=context):
+        first = [Individual([i]) for i in range(20)]
+        problem.batch_evaluate(first)
+        assert first[0].objective_values == parent
+        second = [Individual([i]) for i in range(20)]
+        problem.batch_evaluate(second)
+    assert problem.scheduler.decision["mode"] == "pool"
+    assert parent not in [ind.objective_values for ind in second]
+    assert problem.consumed_evaluations == 40
+    # the cost is measured in the workers
+    assert 0.004 < problem.scheduler.evaluation_time < 0.05
@@ -0,0 +1,68 @@
+import os
+import sys
+import subprocess
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from optproblems import Individual
+from optproblems.continuous import Sphere
+from optproblems.parallel import create_worker_pool, evaluate_matrix_shared
+
+
+START_METHODS = [method for method in ("fork", "spawn")
+                 if method in multiprocessing.get_all_start_methods()]
+
+SCRIPT = """
+import multiprocessing
+import numpy as np
+from optproblems.continuous import Sphere
+from optproblems.parallel import create_worker_pool
+
+if __name__ == "__main__":
+    problem = Sphere(3)
+    context = multiprocessing.get_context("%s")
+    with create_worker_pool([problem], processes=2, context=context) as pool:
+        phenomes = np.random.rand(10, 3)
+        assert np.allclose(problem.evaluate_matrix(phenomes), (phenomes ** 2).sum(axis=1))
+        pool.close()
+        pool.join()
+"""
+
+
+@pytest.fixture(params=START_METHODS)
+def context(request):
+    return multiprocessing.get_context(request.param)
+
+
+def test_evaluate_matrix_shared(context):
+    problem = Sphere(3)
+    phenomes = np.random.default_rng(0).uniform(-5.0, 5.0, (11, 3))
+    with create_worker_pool([problem], processes=2, context=context) as pool:
+        values = evaluate_matrix_shared(pool, problem.problem_id, phenomes, 1, rows_per_task=3)
+        np.testing.assert_allclose(values, (phenomes ** 2).sum(axis=1).reshape((11, 1)))
+        assert evaluate_matrix_shared(pool, problem.problem_id, np.empty((0, 3)), 1).shape == (0, 1)
+        np.testing.assert_allclose(problem.evaluate_matrix(phenomes), (phenomes ** 2).sum(axis=1))
+    assert problem.consumed_evaluations == 11
+
+
+def test_shared_memory_transport(context):
+    problem = Sphere(3)
+    problem.transport = "shared_memory"
+    individuals = [Individual([float(i), 1.0, 0.0]) for i in range(7)]
+    with create_worker_pool([problem], processes=2, context=context):
+        problem.batch_evaluate(individuals)
+    assert [ind.objective_values for ind in individuals] == [i * i + 1.0 for i in range(7)]
+    assert problem.consumed_evaluations == 7
+
+
+@pytest.mark.parametrize("start_method", START_METHODS)
+def test_no_resource_tracker_warnings(start_method):
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(sys.path)
+    process = subprocess.run([sys.executable, "-c", SCRIPT % start_method],
+                             env=environment, capture_output=True, text=True, timeout=120)
+    assert process.returncode == 0, process.stderr
+    assert "KeyError" not in process.stderr
+    assert "leaked" not in process.stderr